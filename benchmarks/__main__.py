@@ -0,0 +1,187 @@
+"""Benchmarks purepyodbc, and pyodbc if it is installed, against a SQLite database through the SQLite ODBC driver.
+
+    python -m benchmarks run -o results.json
+    python -m benchmarks run --synthetic -o results.json
+    python -m benchmarks compare old.json new.json
+    python -m benchmarks compare results.json
+
+The second form runs purepyodbc against the synthetic driver in tests/synthetic.py rather than SQLite. The third
+compares the results of two runs, such as of two commits, and exits with status 1 if any case regressed by more than
+the threshold. The fourth compares purepyodbc to pyodbc within a single run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import typing
+from dataclasses import replace
+
+from . import database, suite
+
+DEFAULT_DRIVER = os.environ.get("PUREPYODBC_BENCHMARK_DRIVER", "SQLite3")
+
+
+def _log(message: str) -> None:
+    print(message, file=sys.stderr, flush=True)
+
+
+def _latency(value: str) -> tuple[str, float]:
+    function, _, seconds = value.partition("=")
+    try:
+        return function, float(seconds)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected FUNCTION=SECONDS, not {value!r}") from None
+
+
+def _run(args: argparse.Namespace) -> int:
+    options = suite.Options(
+        connection_string="",
+        rows=args.rows,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        warmup=args.warmup,
+        patterns=tuple(args.patterns),
+    )
+    if args.synthetic:
+        # The synthetic driver stands in for the driver manager that purepyodbc loads, so pyodbc cannot use it.
+        options = replace(options, driver=suite.synthetic_driver(args.rows, dict(args.latency)))
+        report = suite.run(options, ["purepyodbc"], _log, args.commit)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            path = args.database or os.path.join(directory, "benchmark.sqlite")
+            _log(f"Creating {path} with {args.rows} rows per table")
+            database.create(path, args.rows)
+            options = replace(options, connection_string=f"DRIVER={{{args.driver}}};Database={path}")
+            report = suite.run(options, args.libraries or suite.LIBRARIES, _log, args.commit)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        _log(f"Wrote {args.output}")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.result is None:
+        result = baseline
+        baseline_library, result_library = "pyodbc", "purepyodbc"
+        headings = baseline_library, result_library
+    else:
+        with open(args.result) as f:
+            result = json.load(f)
+        baseline_library = result_library = args.library
+        headings = "baseline", "result"
+        if baseline["options"]["rows"] != result["options"]["rows"]:
+            _log("Warning: the runs fetched different numbers of rows per table, so their fetch times differ anyway")
+
+    old_results: dict[str, typing.Any] = baseline["libraries"].get(baseline_library, {}).get("results", {})
+    new_results: dict[str, typing.Any] = result["libraries"].get(result_library, {}).get("results", {})
+    cases = [case for case in new_results if case in old_results]
+    if not cases:
+        _log(f"There are no results of {result_library} to compare with {baseline_library}")
+        return 2
+
+    print(f"{'case':<28} {headings[0] + ' (ms)':>16} {headings[1] + ' (ms)':>16} {'change':>8}")
+    regressions = []
+    for case in cases:
+        old, new = old_results[case]["median"], new_results[case]["median"]
+        change = new / old - 1 if old else 0.0
+        flag = ""
+        if change > args.threshold:
+            regressions.append(case)
+            flag = "  slower"
+        elif change < -args.threshold:
+            flag = "  faster"
+        print(f"{case:<28} {old * 1e3:>16.4f} {new * 1e3:>16.4f} {change:>+8.1%}{flag}")
+
+    if args.result is not None and regressions:
+        _log(f"{len(regressions)} case(s) regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n", 1)[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="run the benchmarks and write their results as JSON")
+    run.add_argument(
+        "--driver",
+        default=DEFAULT_DRIVER,
+        help="the name of the SQLite ODBC driver (default: %(default)s, or $PUREPYODBC_BENCHMARK_DRIVER)",
+    )
+    run.add_argument("--database", help="the path of the SQLite database to create (default: a temporary file)")
+    run.add_argument("--rows", type=int, default=database.DEFAULT_ROWS, help="rows per table (default: %(default)s)")
+    run.add_argument("--repeat", type=int, default=5, help="timed samples per case (default: %(default)s)")
+    run.add_argument("--min-time", type=float, default=0.1, help="minimum seconds per sample (default: %(default)s)")
+    run.add_argument(
+        "--warmup",
+        type=float,
+        # PyPy's JIT needs longer to warm up.
+        default=2.0 if platform.python_implementation() == "PyPy" else 0.1,
+        help="seconds to run each case before timing it (default: %(default)s)",
+    )
+    run.add_argument(
+        "--library",
+        dest="libraries",
+        action="append",
+        choices=suite.LIBRARIES,
+        help="a library to benchmark, which may be repeated (default: all those installed)",
+    )
+    run.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        default=[],
+        help="only run the cases matching this glob pattern, which may be repeated (such as 'fetch*_text_*')",
+    )
+    run.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="run purepyodbc against the in-process synthetic driver in tests/synthetic.py instead of SQLite, to "
+        "measure its own overhead, counting the ODBC calls made by each case",
+    )
+    run.add_argument(
+        "--latency",
+        type=_latency,
+        action="append",
+        default=[],
+        metavar="FUNCTION=SECONDS",
+        help="with --synthetic, sleep this long in each call to an ODBC function, which may be repeated",
+    )
+    run.add_argument("--commit", help="the commit to record with the results (default: the checked out commit)")
+    run.add_argument("-o", "--output", help="the file to write the results to (default: standard output)")
+    run.set_defaults(func=_run)
+
+    compare = subparsers.add_parser("compare", help="compare the results of two runs, or of two libraries in one run")
+    compare.add_argument("baseline", help="the results to compare against")
+    compare.add_argument("result", nargs="?", help="the results to compare (default: pyodbc against purepyodbc)")
+    compare.add_argument(
+        "--library", default="purepyodbc", choices=suite.LIBRARIES, help="the library to compare (default: %(default)s)"
+    )
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="the relative change in median time reported as a regression (default: %(default)s)",
+    )
+    compare.set_defaults(func=_compare)
+
+    args = parser.parse_args(argv)
+    result: int = args.func(args)
+    return result
+
+
+if __name__ == "__main__":
+    sys.exit(main())
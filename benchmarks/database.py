@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import random
+import sqlite3
+import string
+from dataclasses import dataclass
+
+DEFAULT_ROWS = 1000
+
+
+@dataclass(frozen=True)
+class Table:
+    """A table of the benchmark database, named after the type and width of its columns."""
+
+    name: str
+    # The column definitions, excluding the integer primary key "id".
+    columns: tuple[str, ...]
+
+
+TABLES = (
+    Table("integer_1", ("a integer",)),
+    Table("real_1", ("a real",)),
+    Table("text_10", ("a varchar(10)",)),
+    Table("text_100", ("a varchar(100)",)),
+    Table("text_1000", ("a varchar(1000)",)),
+    Table("blob_100", ("a blob",)),
+    Table("integer_20", tuple(f"c{i} integer" for i in range(20))),
+    Table(
+        "mixed_20",
+        tuple(f"c{i} {('integer', 'real', 'varchar(50)', 'timestamp')[i % 4]}" for i in range(20)),
+    ),
+)
+
+
+def __value(rng: random.Random, column: str) -> object:
+    name, declared_type = column.split(" ", 1)
+    if declared_type == "integer":
+        return rng.randrange(-(2**31), 2**31)
+    if declared_type == "real":
+        return rng.uniform(-1e6, 1e6)
+    if declared_type == "blob":
+        return bytes(rng.randrange(256) for _ in range(100))
+    if declared_type == "timestamp":
+        return f"20{rng.randrange(10, 30)}-{rng.randrange(1, 13):02}-{rng.randrange(1, 29):02} 12:34:56"
+    size = int(declared_type[len("varchar(") : -1])
+    return "".join(rng.choices(string.ascii_letters, k=size))
+
+
+def rows(table: Table, count: int) -> list[tuple[object, ...]]:
+    """Return `count` rows of pseudorandom values for the table, including its id, which are the same every time."""
+    rng = random.Random(table.name)
+    return [(i, *(__value(rng, column) for column in table.columns)) for i in range(count)]
+
+
+def create(path: str, count: int = DEFAULT_ROWS) -> None:
+    """Create the benchmark database at `path`, with `count` rows in each table."""
+    with sqlite3.connect(path) as connection:
+        for table in TABLES:
+            connection.execute(f"drop table if exists {table.name}")
+            connection.execute(f"create table {table.name} (id integer primary key, {', '.join(table.columns)})")
+            placeholders = ", ".join("?" * (len(table.columns) + 1))
+            connection.executemany(f"insert into {table.name} values ({placeholders})", rows(table, count))
+    connection.close()
@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import datetime
+import fnmatch
+import gc
+import importlib
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import typing
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from types import ModuleType
+
+from . import database
+from .database import TABLES
+
+# The libraries benchmarked, in order. Those which are not installed are skipped.
+LIBRARIES = ("purepyodbc", "pyodbc")
+
+FETCHMANY_SIZE = 100
+
+
+@dataclass(frozen=True)
+class Options:
+    connection_string: str
+    rows: int
+    # The number of timed samples taken of each case.
+    repeat: int = 5
+    # The minimum duration of a sample. Quick operations are repeated within a sample until it takes this long.
+    min_time: float = 0.1
+    # The time spent running each case before it is timed, which gives PyPy's JIT a chance to compile it.
+    warmup: float = 0.1
+    # Glob patterns matching the names of the cases to run, or all of them if empty.
+    patterns: tuple[str, ...] = ()
+    # The SyntheticDriver to connect to instead of the connection string, if any.
+    driver: typing.Any = None
+
+
+@dataclass(frozen=True)
+class Result:
+    """The timings of a case. Times are in seconds per operation."""
+
+    # The number of times the operation was run in each sample.
+    loops: int
+    times: list[float]
+    min: float
+    median: float
+    mean: float
+    stdev: float
+    # The number of rows each operation fetched, and how many that is per second at the median time.
+    rows: int = 0
+    rows_per_second: float | None = None
+    # The number of memory blocks still allocated per row fetched by an operation, which is roughly the number of
+    # objects each row is made of. Only measured on CPython.
+    allocated_blocks_per_row: float | None = None
+    # The number of ODBC calls made per operation. Only counted with a SyntheticDriver.
+    odbc_calls: int | None = None
+
+
+@dataclass
+class Case:
+    name: str
+    # Given the library and the options, sets up the case and yields the operation to time, then tears it down.
+    setup: Callable[[ModuleType, Options], typing.ContextManager[Callable[[], object]]]
+    # The number of rows the operation fetches, if any.
+    rows: Callable[[Options], int] = lambda options: 0
+    # The libraries the case applies to, or all of them if empty.
+    libraries: tuple[str, ...] = field(default_factory=tuple)
+    # Whether the case applies when connecting to a SyntheticDriver.
+    synthetic: bool = True
+
+
+def _connect(library: ModuleType, options: Options) -> typing.Any:
+    if options.driver is not None:
+        return options.driver.connect(autocommit=True)
+    return library.connect(options.connection_string, autocommit=True)
+
+
+@contextmanager
+def _connect_close(library: ModuleType, options: Options) -> Iterator[Callable[[], object]]:
+    def operation() -> None:
+        _connect(library, options).close()
+
+    yield operation
+
+
+@contextmanager
+def _connect_close_pooled(library: ModuleType, options: Options) -> Iterator[Callable[[], object]]:
+    setattr(library, "connection_pooling", True)
+    try:
+        with _connect_close(library, options) as operation:
+            yield operation
+    finally:
+        setattr(library, "connection_pooling", False)
+        library.close_pools()
+
+
+@contextmanager
+def _cursor(library: ModuleType, options: Options) -> Iterator[typing.Any]:
+    connection = _connect(library, options)
+    try:
+        cursor = connection.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+    finally:
+        connection.close()
+
+
+def _execute(sql: str, *params: object) -> Callable[[ModuleType, Options], typing.ContextManager[Callable[[], object]]]:
+    @contextmanager
+    def setup(library: ModuleType, options: Options) -> Iterator[Callable[[], object]]:
+        with _cursor(library, options) as cursor:
+            execute = cursor.execute
+            fetchone = cursor.fetchone
+
+            def operation() -> object:
+                execute(sql, *params)
+                return fetchone()
+
+            yield operation
+
+    return setup
+
+
+def _fetch(method: str, table: str) -> Callable[[ModuleType, Options], typing.ContextManager[Callable[[], object]]]:
+    sql = f"select * from {table}"
+
+    @contextmanager
+    def setup(library: ModuleType, options: Options) -> Iterator[Callable[[], object]]:
+        with _cursor(library, options) as cursor:
+            execute = cursor.execute
+            fetchone = cursor.fetchone
+            fetchmany = cursor.fetchmany
+            fetchall = cursor.fetchall
+
+            # Each operation returns the rows it fetched, to count the memory they hold.
+            def fetch_one() -> object:
+                execute(sql)
+                rows: list[typing.Any] = []
+                append = rows.append
+                while (row := fetchone()) is not None:
+                    append(row)
+                return rows
+
+            def fetch_many() -> object:
+                execute(sql)
+                rows: list[typing.Any] = []
+                extend = rows.extend
+                while many := fetchmany(FETCHMANY_SIZE):
+                    extend(many)
+                return rows
+
+            def fetch_all() -> object:
+                execute(sql)
+                return fetchall()
+
+            yield {"fetchone": fetch_one, "fetchmany": fetch_many, "fetchall": fetch_all}[method]
+
+    return setup
+
+
+@contextmanager
+def _tables(library: ModuleType, options: Options) -> Iterator[Callable[[], object]]:
+    with _cursor(library, options) as cursor:
+
+        def operation() -> object:
+            return cursor.tables().fetchall()
+
+        yield operation
+
+
+CASES = [
+    Case("connect_close", _connect_close),
+    Case("connect_close_pooled", _connect_close_pooled, libraries=("purepyodbc",), synthetic=False),
+    Case("execute_select_1", _execute("select 1")),
+    Case("execute_select_param", _execute("select a from integer_1 where id = ?", 1)),
+    *(
+        Case(f"{method}_{table.name}", _fetch(method, table.name), rows=lambda options: options.rows)
+        for method in ("fetchone", "fetchmany", "fetchall")
+        for table in TABLES
+    ),
+    Case("catalog_tables", _tables),
+]
+
+
+def selected(name: str, patterns: tuple[str, ...]) -> bool:
+    return not patterns or any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def measure(operation: Callable[[], object], options: Options, rows: int = 0) -> Result:
+    """Time `operation`, first running it for the warmup time, then taking `repeat` samples of as many loops as make a
+    sample last at least the minimum time."""
+    perf_counter = time.perf_counter
+
+    deadline = perf_counter() + options.warmup
+    operation()
+    while perf_counter() < deadline:
+        operation()
+
+    # Find the number of loops as timeit.Timer.autorange() does.
+    loops = 1
+    while True:
+        start = perf_counter()
+        for _ in range(loops):
+            operation()
+        elapsed = perf_counter() - start
+        if elapsed >= options.min_time:
+            break
+        loops *= 10 if elapsed < options.min_time / 10 else 2
+
+    times = []
+    for _ in range(options.repeat):
+        start = perf_counter()
+        for _ in range(loops):
+            operation()
+        times.append((perf_counter() - start) / loops)
+    return _result(loops, times, rows)
+
+
+def profile(operation: Callable[[], object], options: Options, result: Result) -> Result:
+    """Add the memory blocks allocated per row fetched by `operation`, and the ODBC calls it makes, to its result."""
+    blocks = None
+    if result.rows and platform.python_implementation() == "CPython":
+        gc.collect()
+        gc.disable()
+        try:
+            before = sys.getallocatedblocks()
+            rows = operation()
+            blocks = (sys.getallocatedblocks() - before) / result.rows
+            del rows
+        finally:
+            gc.enable()
+
+    calls = None
+    if options.driver is not None:
+        before = sum(options.driver.calls.values())
+        operation()
+        calls = sum(options.driver.calls.values()) - before
+
+    return replace(result, allocated_blocks_per_row=blocks, odbc_calls=calls)
+
+
+def _result(loops: int, times: list[float], rows: int = 0) -> Result:
+    median = statistics.median(times)
+    return Result(
+        loops=loops,
+        times=times,
+        min=min(times),
+        median=median,
+        mean=statistics.mean(times),
+        stdev=statistics.stdev(times) if len(times) > 1 else 0.0,
+        rows=rows,
+        rows_per_second=rows / median if rows and median else None,
+    )
+
+
+def measure_import(library: str, options: Options) -> Result:
+    """Time importing `library` in a new interpreter, `repeat` times."""
+    code = f"import time; start = time.perf_counter(); import {library}; print(time.perf_counter() - start)"
+    # Import the library from wherever this process did.
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(path for path in sys.path if path)}
+    times = []
+    for _ in range(options.repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True, env=env
+        ).stdout
+        times.append(float(output))
+    return _result(1, times)
+
+
+def run_library(name: str, options: Options, log: Callable[[str], None]) -> dict[str, typing.Any] | None:
+    """Run the cases against the library `name`, returning its version and the results of each case, or None if it is
+    not installed."""
+    try:
+        library = importlib.import_module(name)
+    except ImportError:
+        log(f"{name} is not installed, skipping it")
+        return None
+
+    # Compare the libraries without connection pooling (which pyodbc does in the driver manager by default), except
+    # where a case asks for it.
+    if name == "pyodbc":
+        setattr(library, "pooling", False)
+    results: dict[str, Result] = {}
+
+    if selected("import", options.patterns):
+        results["import"] = measure_import(name, options)
+        log(f"{name} import: {_format(results['import'])}")
+
+    for case in CASES:
+        if not selected(case.name, options.patterns) or (case.libraries and name not in case.libraries):
+            continue
+        if options.driver is not None and not case.synthetic:
+            continue
+        with case.setup(library, options) as operation:
+            results[case.name] = profile(operation, options, measure(operation, options, case.rows(options)))
+        log(f"{name} {case.name}: {_format(results[case.name])}")
+
+    return {
+        "version": getattr(library, "version", None),
+        "results": {case: asdict(result) for case, result in results.items()},
+    }
+
+
+def run(
+    options: Options, libraries: typing.Sequence[str], log: Callable[[str], None], commit: str | None = None
+) -> dict[str, typing.Any]:
+    """Run the benchmarks, returning their results along with a description of the environment they ran in, and the
+    commit they ran at (by default, the checked out commit, if there is one)."""
+    report: dict[str, typing.Any] = {
+        "format": 1,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit or _git_commit(),
+        "python": {
+            "implementation": platform.python_implementation(),
+            "version": platform.python_version(),
+        },
+        "platform": platform.platform(),
+        "connection_string": options.connection_string,
+        "synthetic": options.driver is not None,
+        "options": {
+            "rows": options.rows,
+            "repeat": options.repeat,
+            "min_time": options.min_time,
+            "warmup": options.warmup,
+            "latency": options.driver.latency if options.driver is not None else {},
+        },
+        "libraries": {},
+    }
+    for name in libraries:
+        library = run_library(name, options, log)
+        if library is not None:
+            report["libraries"][name] = library
+    return report
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _format(result: Result) -> str:
+    text = f"{_format_time(result.median)} median, {_format_time(result.min)} min"
+    if result.rows_per_second is not None:
+        text += f", {result.rows_per_second:,.0f} rows/s"
+    if result.allocated_blocks_per_row is not None:
+        text += f", {result.allocated_blocks_per_row:.1f} blocks/row"
+    if result.odbc_calls is not None:
+        text += f", {result.odbc_calls} ODBC calls"
+    return text
+
+
+def synthetic_driver(rows: int, latency: dict[str, float]) -> typing.Any:
+    """Return a SyntheticDriver serving the same tables as the benchmark database, and the other statements the cases
+    execute, with `latency` injected into its functions."""
+    from purepyodbc._enums import SqlDataType
+    from tests.synthetic import Column, ResultSet, SyntheticDriver
+
+    sql_types = {
+        "integer": SqlDataType.SQL_INTEGER,
+        "real": SqlDataType.SQL_DOUBLE,
+        "blob": SqlDataType.SQL_VARBINARY,
+        "timestamp": SqlDataType.SQL_TYPE_TIMESTAMP,
+    }
+    results = {}
+    for table in TABLES:
+        columns = [Column("id", SqlDataType.SQL_INTEGER.value)]
+        timestamps = []
+        for i, definition in enumerate(table.columns, 1):
+            name, declared_type = definition.split(" ", 1)
+            if declared_type.startswith("varchar("):
+                size = int(declared_type[len("varchar(") : -1])
+                columns.append(Column(name, SqlDataType.SQL_WVARCHAR.value, size))
+            else:
+                columns.append(Column(name, sql_types[declared_type].value, 100 if declared_type == "blob" else 0))
+                if declared_type == "timestamp":
+                    timestamps.append(i)
+        values = [list(row) for row in database.rows(table, rows)]
+        for row in values:
+            for i in timestamps:
+                row[i] = datetime.datetime.fromisoformat(str(row[i]))
+        results[f"select * from {table.name}"] = ResultSet(columns, values)
+    results["select 1"] = ResultSet([Column("1", SqlDataType.SQL_INTEGER.value)], [(1,)])
+    results["select a from integer_1 where id = ?"] = ResultSet([Column("a", SqlDataType.SQL_INTEGER.value)], [(1,)])
+    results["SQLTables"] = ResultSet(
+        [
+            Column(name, SqlDataType.SQL_WVARCHAR.value, 128)
+            for name in ("TABLE_CAT", "TABLE_SCHEM", "TABLE_NAME", "TABLE_TYPE", "REMARKS")
+        ],
+        [(None, None, table.name, "TABLE", None) for table in TABLES],
+    )
+    return SyntheticDriver(results, latency)
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
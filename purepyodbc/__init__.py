@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import threading
+import warnings
+from collections.abc import Hashable, Sequence
 
-from . import _driver_manager
+from . import _driver_manager, _pool, _tracing
 from ._connection import Connection
 from ._cursor import Cursor
+from ._enums import InfoType
 from ._environment import Environment as _Environment
 from ._errors import (
     DatabaseError,
@@ -23,15 +26,35 @@ apilevel: str = "2.0"
 lowercase: bool = False
 native_uuid: bool = False
 paramstyle: str = "qmark"
+# Deprecated, and ignored. In pyodbc it turns driver-manager pooling on (by default) or off, which here is
+# driver_manager_pooling, off by default. Turning it off warns, as code which does so expects connections not to be
+# pooled at all. The application-level pools it did turn on here are turned on with connection_pooling instead.
 pooling: bool = True
+# Whether connect() checks connections out of connection pools (one per connection string and set of options), to which
+# closing them returns them rather than disconnecting them. These pools are separate from driver-manager pooling, which
+# not every driver manager does (or does well), and are sized, timed and observed from Python. This is off by default,
+# as closing a pooled connection does not disconnect it, and rolls back rather than resetting its session state.
+connection_pooling: bool = False
+# Whether the driver manager pools connections (with SQL_ATTR_CONNECTION_POOLING), as well as or instead of the
+# connection pools above. This must be set before the first connection is opened.
+driver_manager_pooling: bool = False
+# The settings of connection pools, which apply to pools created after they are changed. Times are in seconds, and
+# None is unlimited.
+pool_max_size: int = 10
+pool_min_idle: int = 0
+pool_idle_timeout: float | None = 600.0
+pool_max_lifetime: float | None = 1800.0
+pool_checkout_timeout: float | None = 30.0
 threadsafety: int = 1  # TODO: Check threadsafety
 # release-please-action automatically updates this attribute.
 __version__ = "0.1.0"
 # This one is merely to mimic the pyodbc api.
 version = __version__
 
-__driver_manager: _driver_manager.DriverManager = _driver_manager.detect_driver_manager()
-__environment: _Environment
+# The driver manager is loaded, and the environment allocated, once per process when they are first needed.
+__driver_manager: _driver_manager.DriverManager | None = None
+__environment: _Environment | None = None
+__lock = threading.Lock()
 
 
 def connect(
@@ -43,28 +66,132 @@ def connect(
     attrs_before: dict[int, int | bytes | bytearray | str | Sequence[str]] | None = None,
     encoding: str | None = None,
 ) -> Connection:
-    __ensure_environment_created()
+    driver_manager = __get_driver_manager()
+    environment = __get_environment()
 
-    connection = __environment.connection(
-        connection_string, autocommit, ansi, timeout, readonly, attrs_before, encoding
+    def open_connection() -> Connection:
+        return environment.connection(connection_string, autocommit, ansi, timeout, readonly, attrs_before, encoding)
+
+    if not connection_pooling:
+        return open_connection()
+
+    # Connections are only interchangeable if they were opened with the same connection string and options.
+    key = (
+        connection_string,
+        autocommit,
+        ansi,
+        timeout,
+        readonly,
+        tuple((k, __hashable_attr_value(v)) for k, v in sorted((attrs_before or {}).items())),
+        encoding,
     )
 
-    return connection
+    def create_pool() -> _pool.ConnectionPool:
+        return _pool.ConnectionPool(
+            driver_manager,
+            open_connection,
+            connection_string,
+            autocommit=autocommit,
+            max_size=pool_max_size,
+            min_idle=pool_min_idle,
+            idle_timeout=pool_idle_timeout,
+            max_lifetime=pool_max_lifetime,
+            checkout_timeout=pool_checkout_timeout,
+        )
+
+    return _pool.get_pool(key, create_pool).checkout()
 
 
 def drivers(include_attributes: bool = False) -> list[str]:
-    __ensure_environment_created()
-    return __driver_manager.sql_drivers(__environment, include_attributes=include_attributes)
+    return __get_driver_manager().sql_drivers(__get_environment(), include_attributes=include_attributes)
+
+
+def __hashable_attr_value(value: int | bytes | bytearray | str | Sequence[str]) -> Hashable:
+    if isinstance(value, bytearray):
+        return bytes(value)
+    if isinstance(value, (int, bytes, str)):
+        return value
+    return tuple(value)
+
+
+def pool_statistics() -> list[_pool.PoolStatistics]:
+    """Return a snapshot of the state and usage of each connection pool."""
+    return _pool.get_pool_statistics()
+
+
+def close_pools() -> None:
+    """Close the idle connections of all connection pools, and discard the pools.
+
+    Connections which are in use are closed when they are closed by the application, rather than being returned.
+    """
+    _pool.close_pools()
+
+
+def enable_tracing(*hooks: _tracing.TraceHook) -> None:
+    """Time every ODBC call from here on, collecting the number of calls and errors and the total, minimum and maximum
+    time of each ODBC function, which are returned by call_statistics().
+
+    Each hook is called with the name of the ODBC function before each call, and returns a function which is called
+    with its return code after it (or None if the call raised an exception). Enabling tracing again replaces the hooks.
+    """
+    __get_driver_manager().enable_tracing(hooks)
+
+
+def disable_tracing() -> None:
+    """Stop tracing ODBC calls, which are then made directly. The statistics collected so far are kept."""
+    driver_manager = __driver_manager
+    if driver_manager is not None:
+        driver_manager.disable_tracing()
+
+
+def call_statistics() -> list[_tracing.CallStatistics]:
+    """Return a snapshot of the ODBC calls made while tracing was enabled, with one entry per ODBC function."""
+    driver_manager = __driver_manager
+    return [] if driver_manager is None else driver_manager.call_statistics()
+
+
+def reset_call_statistics() -> None:
+    driver_manager = __driver_manager
+    if driver_manager is not None:
+        driver_manager.reset_call_statistics()
+
+
+def __get_driver_manager() -> _driver_manager.DriverManager:
+    global __driver_manager
+    driver_manager = __driver_manager
+    if driver_manager is None:
+        with __lock:
+            driver_manager = __driver_manager
+            if driver_manager is None:
+                driver_manager = __driver_manager = _driver_manager.detect_driver_manager()
+    return driver_manager
 
 
-def __ensure_environment_created() -> None:
+def __get_environment() -> _Environment:
     global __environment
-    __environment = _Environment(driver_manager=__driver_manager, pooling=pooling)
+    driver_manager = __get_driver_manager()
+    environment = __environment
+    if environment is None:
+        with __lock:
+            environment = __environment
+            if environment is None:
+                if pooling is not True:
+                    warnings.warn(
+                        "purepyodbc.pooling is deprecated and ignored. Connections are only pooled if "
+                        "purepyodbc.connection_pooling or purepyodbc.driver_manager_pooling is set.",
+                        DeprecationWarning,
+                        stacklevel=3,
+                    )
+                environment = __environment = _Environment(
+                    driver_manager=driver_manager, pooling=driver_manager_pooling
+                )
+    return environment
 
 
 __all__ = [
     "Connection",
     "Cursor",
+    "InfoType",
     "Warning",
     "Error",
     "InterfaceError",
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from _ctypes import Array
+from ctypes import c_char, create_string_buffer
+from dataclasses import dataclass, field
+
+from ._dto import SqlColumnDescription
+from ._enums import CDataType, ParameterStatus
+from ._typedef import SQLLEN, SQLULEN, SQLUSMALLINT
+
+
+@dataclass
+class BoundColumn:
+    """A column-wise bound array which receives one result set column for a whole rowset."""
+
+    description: SqlColumnDescription
+    c_type: CDataType
+    element_size: int
+    capacity: int
+    data: Array[c_char] = field(init=False, repr=False)
+    indicators: Array[SQLLEN] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.data = create_string_buffer(self.element_size * self.capacity)
+        self.indicators = (SQLLEN * self.capacity)()
+
+
+@dataclass
+class RowSetBuffer:
+    """The bound columns of a result set, which is fetched up to `capacity` rows at a time with SQLFetchScroll.
+
+    The values of a `columnar` row set are not converted to Python objects, but read from the arrays as a whole. A
+    `capped` row set was bound for fewer rows than were asked for, so that its arrays fit in ROW_SET_BUFFER_SIZE.
+    """
+
+    columns: tuple[BoundColumn, ...]
+    capacity: int
+    capped: bool = False
+    row_array_size: int = 1
+    columnar: bool = False
+    rows_fetched: SQLULEN = field(default_factory=SQLULEN, repr=False)
+
+
+@dataclass
+class GetDataBuffer:
+    """A buffer which is reused to read one result set column with SQLGetData, row after row."""
+
+    size: int
+    data: Array[c_char] = field(init=False, repr=False)
+    length_or_indicator: SQLLEN = field(default_factory=SQLLEN, repr=False)
+
+    def __post_init__(self) -> None:
+        self.data = create_string_buffer(self.size)
+
+
+@dataclass
+class BoundParameter:
+    """The value of a statement parameter, which is referenced by the driver until the statement is executed again.
+
+    `data` is None for a null value.
+    """
+
+    c_type: CDataType
+    sql_type: int
+    column_size: int
+    decimal_digits: int
+    data: bytes | None
+    length_or_indicator: SQLLEN = field(repr=False)
+
+
+@dataclass
+class ParameterArray:
+    """A column-wise bound array which holds one statement parameter for a whole batch of parameter sets.
+
+    `data` is None if all values are null.
+    """
+
+    c_type: CDataType
+    sql_type: int
+    column_size: int
+    decimal_digits: int
+    element_size: int
+    data: Array[c_char] | None = field(repr=False)
+    indicators: Array[SQLLEN] = field(repr=False)
+
+
+@dataclass
+class ParameterSetBuffer:
+    """The bound parameter arrays of a batch of `size` parameter sets, which are executed with one SQLExecute."""
+
+    parameters: tuple[ParameterArray, ...]
+    size: int
+    statuses: Array[SQLUSMALLINT] = field(init=False, repr=False)
+    params_processed: SQLULEN = field(default_factory=SQLULEN, repr=False)
+
+    def __post_init__(self) -> None:
+        self.statuses = (SQLUSMALLINT * self.size)(*[ParameterStatus.SQL_PARAM_UNUSED.value] * self.size)
+
+    def get_statuses(self) -> list[ParameterStatus]:
+        """Return the status of each parameter set, those which the driver did not process being unused."""
+        processed = self.params_processed.value
+        return [
+            ParameterStatus(status) if i < processed else ParameterStatus.SQL_PARAM_UNUSED
+            for i, status in enumerate(self.statuses)
+        ]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from ._dto import SqlColumnDescription
+from ._row import Row
+
+DEFAULT_CATALOG_CACHE_TTL = 300.0
+
+# Statements which may change what the catalog functions return, or the columns of a prepared statement's result set.
+_DDL = re.compile(r"\s*(?:alter|comment|create|drop|grant|rename|revoke)\b", re.IGNORECASE)
+
+
+def is_ddl(sql: str) -> bool:
+    """Return whether `sql` looks like DDL, such as create, alter or drop."""
+    return _DDL.match(sql) is not None
+
+
+@dataclass(frozen=True)
+class CatalogResult:
+    """The result set of a catalog function, fetched in full."""
+
+    sql_column_descriptions: tuple[SqlColumnDescription, ...]
+    rows: tuple[Row, ...]
+    rowcount: int
+    # The time.monotonic() at which the result expires, or None if it does not.
+    expires: float | None
+
+
+class CatalogCache:
+    """A least recently used cache of the result sets of the catalog functions (SQLTables, SQLProcedures and
+    SQLForeignKeys) called on a connection, keyed by the function and its arguments.
+
+    Results expire `ttl` seconds after they were fetched. All results are discarded by clear(), and when the connection
+    executes a statement which looks like DDL (such as create, alter or drop), since that may have changed them.
+    """
+
+    def __init__(self, maxsize: int = 0, ttl: float | None = DEFAULT_CATALOG_CACHE_TTL) -> None:
+        self.__maxsize = maxsize
+        self.ttl = ttl
+        self.__results: OrderedDict[Hashable, CatalogResult] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__results)
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of results kept. Zero disables the cache."""
+        return self.__maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        self.__maxsize = maxsize
+        self.__evict()
+
+    def get(self, key: Hashable) -> CatalogResult | None:
+        """Return the result cached for `key`, as the most recently used one, or None if there is none or it has
+        expired."""
+        result = self.__results.get(key)
+        if result is None:
+            return None
+        if result.expires is not None and result.expires <= time.monotonic():
+            del self.__results[key]
+            return None
+        self.__results.move_to_end(key)
+        return result
+
+    def put(
+        self,
+        key: Hashable,
+        sql_column_descriptions: tuple[SqlColumnDescription, ...],
+        rows: tuple[Row, ...],
+        rowcount: int,
+    ) -> CatalogResult:
+        """Cache the result fetched for `key`, and return it."""
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        result = CatalogResult(sql_column_descriptions, rows, rowcount, expires)
+        self.__results[key] = result
+        self.__results.move_to_end(key)
+        self.__evict()
+        return result
+
+    def executed(self, sql: str) -> None:
+        """Discard all results if `sql`, which the connection is executing, looks like DDL."""
+        if self.__results and is_ddl(sql):
+            self.clear()
+
+    def clear(self) -> None:
+        self.__results.clear()
+
+    def __evict(self) -> None:
+        while len(self.__results) > max(self.__maxsize, 0):
+            self.__results.popitem(last=False)
@@ -0,0 +1,337 @@
+"""Fetching result sets column by column into NumPy arrays and Apache Arrow arrays.
+
+The columns are bound to arrays of C types which NumPy can use as they are, and each column of a rowset is converted as
+a whole, without creating a Python object for each value. NumPy and PyArrow are optional dependencies, which are only
+imported when they are used.
+"""
+
+from __future__ import annotations
+
+import importlib
+import types
+import typing
+
+from ._buffers import BoundColumn, RowSetBuffer
+from ._driver_manager import MAX_BOUND_COLUMN_SIZE, DriverManager
+from ._dto import SqlColumnDescription
+from ._enums import CDataType, LengthOrIndicatorType, SqlDataType
+from ._errors import DataError
+from ._row import Row
+
+# The most memory to bind for a columnar fetch whose number of rows is not given, so that fewer rows are fetched at a
+# time from wider result sets.
+FETCH_BUFFER_SIZE = 16 * 1024 * 1024
+
+# The C types of numeric columns, which NumPy reads as they are.
+_NUMERIC_TYPES: dict[SqlDataType, CDataType] = {
+    SqlDataType.SQL_BIT: CDataType.SQL_C_BIT,
+    # TINYINT is unsigned in some databases, so it does not fit in a signed char.
+    SqlDataType.SQL_TINYINT: CDataType.SQL_C_SSHORT,
+    SqlDataType.SQL_SMALLINT: CDataType.SQL_C_SSHORT,
+    SqlDataType.SQL_INTEGER: CDataType.SQL_C_SLONG,
+    SqlDataType.SQL_BIGINT: CDataType.SQL_C_SBIGINT,
+    SqlDataType.SQL_REAL: CDataType.SQL_C_FLOAT,
+    SqlDataType.SQL_FLOAT: CDataType.SQL_C_DOUBLE,
+    SqlDataType.SQL_DOUBLE: CDataType.SQL_C_DOUBLE,
+}
+# The NumPy dtypes of numeric C types, and their sizes.
+_NUMERIC_DTYPES: dict[CDataType, tuple[str, int]] = {
+    CDataType.SQL_C_BIT: ("u1", 1),
+    CDataType.SQL_C_SSHORT: ("=i2", 2),
+    CDataType.SQL_C_SLONG: ("=i4", 4),
+    CDataType.SQL_C_SBIGINT: ("=i8", 8),
+    CDataType.SQL_C_FLOAT: ("=f4", 4),
+    CDataType.SQL_C_DOUBLE: ("=f8", 8),
+}
+_DATE_FIELDS = [("year", "=i2"), ("month", "=u2"), ("day", "=u2")]
+_TIME_FIELDS = [("hour", "=u2"), ("minute", "=u2"), ("second", "=u2")]
+_TIMESTAMP_FIELDS = [*_DATE_FIELDS, *_TIME_FIELDS, ("fraction", "=u4")]
+_STRING_TYPES = frozenset(
+    {SqlDataType.SQL_CHAR, SqlDataType.SQL_VARCHAR, SqlDataType.SQL_WCHAR, SqlDataType.SQL_WVARCHAR}
+)
+_BINARY_TYPES = frozenset({SqlDataType.SQL_BINARY, SqlDataType.SQL_VARBINARY})
+# The length of a GUID formatted as text.
+_GUID_LENGTH = 36
+# Arrow decimals hold up to 76 digits.
+_MAX_ARROW_PRECISION = 76
+
+
+def import_optional(name: str, feature: str) -> types.ModuleType:
+    """Import an optional dependency of a feature."""
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(f"{feature} requires {name}, which is not installed.") from e
+
+
+def _c_type(description: SqlColumnDescription, sqlwchar_size: int, arrow: bool) -> tuple[CDataType, int] | None:
+    """Return the C type and size of the array elements to bind a column to, or None if the column is long or of a type
+    which is not fetched column by column."""
+    data_type = description.data_type
+    c_type = _NUMERIC_TYPES.get(data_type)
+    if c_type is not None:
+        return c_type, _NUMERIC_DTYPES[c_type][1]
+    if data_type in (SqlDataType.SQL_DECIMAL, SqlDataType.SQL_NUMERIC):
+        if arrow and 0 < description.size <= _MAX_ARROW_PRECISION:
+            # Read as text, which Arrow parses into decimals.
+            return CDataType.SQL_C_CHAR, description.size + 4
+        return CDataType.SQL_C_DOUBLE, 8
+    if data_type is SqlDataType.SQL_TYPE_DATE:
+        return CDataType.SQL_C_TYPE_DATE, 6
+    if data_type is SqlDataType.SQL_TYPE_TIME:
+        return CDataType.SQL_C_TYPE_TIME, 6
+    if data_type is SqlDataType.SQL_TYPE_TIMESTAMP:
+        return CDataType.SQL_C_TYPE_TIMESTAMP, 16
+    if data_type is SqlDataType.SQL_GUID:
+        return CDataType.SQL_C_WCHAR, (_GUID_LENGTH + 1) * sqlwchar_size
+    if not 0 < description.size <= MAX_BOUND_COLUMN_SIZE:
+        return None
+    if data_type in _STRING_TYPES:
+        # Leave room for characters outside the BMP, which take two UTF-16 code units.
+        return CDataType.SQL_C_WCHAR, (description.size * 2 + 1) * sqlwchar_size
+    if data_type in _BINARY_TYPES:
+        return CDataType.SQL_C_BINARY, description.size
+    return None
+
+
+def columnar_row_set(
+    driver_manager: DriverManager,
+    descriptions: typing.Sequence[SqlColumnDescription],
+    arrow: bool,
+    capacity: int | None = None,
+) -> RowSetBuffer | None:
+    """Allocate (but do not bind) the arrays to fetch a result set into column by column, or return None if it has a
+    column which cannot be fetched so.
+
+    Without a `capacity`, as many rows as fit in FETCH_BUFFER_SIZE are fetched at a time.
+    """
+    c_types = [_c_type(x, driver_manager._sqlwchar_size, arrow) for x in descriptions]
+    if not c_types or None in c_types:
+        return None
+    c_types_and_sizes = typing.cast(list[tuple[CDataType, int]], c_types)
+    if capacity is None:
+        row_size = sum(size for _, size in c_types_and_sizes)
+        capacity = max(1, FETCH_BUFFER_SIZE // row_size)
+    return RowSetBuffer(
+        columns=tuple(
+            BoundColumn(description, c_type, size, capacity)
+            for description, (c_type, size) in zip(descriptions, c_types_and_sizes)
+        ),
+        capacity=capacity,
+        columnar=True,
+    )
+
+
+def numpy_arrays(np: typing.Any, row_set: RowSetBuffer, count: int, sqlwchar_size: int) -> list[typing.Any]:
+    """Return a NumPy masked array of the first `count` values in each array of a row set."""
+    arrays = []
+    for column in row_set.columns:
+        if column.c_type is CDataType.SQL_C_BINARY:
+            values, valid = _binary_objects(np, column, count)
+        else:
+            values, valid = _column_values(np, column, count, sqlwchar_size)
+        if column.c_type is CDataType.SQL_C_TYPE_TIME:
+            values = values.astype("m8[s]")
+        arrays.append(np.ma.MaskedArray(values, mask=~valid))
+    return arrays
+
+
+def arrow_arrays(
+    pa: typing.Any, np: typing.Any, row_set: RowSetBuffer, count: int, sqlwchar_size: int
+) -> list[typing.Any]:
+    """Return an Arrow array of the first `count` values in each array of a row set."""
+    arrays = []
+    for column in row_set.columns:
+        description = column.description
+        c_type = column.c_type
+        if c_type is CDataType.SQL_C_WCHAR:
+            arrays.append(_arrow_strings(pa, np, column, count, sqlwchar_size))
+        elif c_type is CDataType.SQL_C_BINARY:
+            arrays.append(_arrow_binary(pa, np, pa.binary(), column, count))
+        elif c_type is CDataType.SQL_C_CHAR:
+            text = _arrow_binary(pa, np, pa.string(), column, count)
+            decimal = pa.decimal128 if description.size <= 38 else pa.decimal256
+            arrays.append(text.cast(decimal(description.size, description.decimal_digits)))
+        else:
+            values, valid = _column_values(np, column, count, sqlwchar_size)
+            arrow_type = pa.time32("s") if c_type is CDataType.SQL_C_TYPE_TIME else None
+            arrays.append(pa.array(values, type=arrow_type, mask=~valid))
+    return arrays
+
+
+def numpy_arrays_from_rows(np: typing.Any, rows: typing.Sequence[Row], columns: int) -> list[typing.Any]:
+    """Return a NumPy masked object array of each column of rows which were fetched as Python objects."""
+    arrays = []
+    for i in range(columns):
+        values = np.empty(len(rows), dtype=object)
+        values[:] = [row[i] for row in rows]
+        arrays.append(np.ma.MaskedArray(values, mask=np.equal(values, None)))
+    return arrays
+
+
+def arrow_arrays_from_rows(pa: typing.Any, rows: typing.Sequence[Row], columns: int) -> list[typing.Any]:
+    """Return an Arrow array of each column of rows which were fetched as Python objects."""
+    return [pa.array([row[i] for row in rows]) for i in range(columns)]
+
+
+def _indicators(np: typing.Any, column: BoundColumn, count: int) -> typing.Any:
+    return np.ctypeslib.as_array(column.indicators)[:count]
+
+
+def _column_values(
+    np: typing.Any, column: BoundColumn, count: int, sqlwchar_size: int
+) -> tuple[typing.Any, typing.Any]:
+    """Return a NumPy array of the first `count` values of a bound column, and whether each one is not null.
+
+    The values of null elements are undefined.
+    """
+    indicators = _indicators(np, column, count)
+    valid = indicators != LengthOrIndicatorType.SQL_NULL_DATA.value
+    c_type = column.c_type
+
+    if c_type is CDataType.SQL_C_WCHAR:
+        code_points, _ = _code_points(np, column, count, sqlwchar_size)
+        return code_points.view(np.dtype(("U", code_points.shape[1]))).reshape(count), valid
+    if c_type is CDataType.SQL_C_TYPE_DATE:
+        return _dates(np, _fields(np, column, count, _DATE_FIELDS)), valid
+    if c_type is CDataType.SQL_C_TYPE_TIMESTAMP:
+        fields = _fields(np, column, count, _TIMESTAMP_FIELDS)
+        # The fraction of a SQL_TIMESTAMP_STRUCT is in nanoseconds.
+        microseconds = (_seconds(np, fields) * 1_000_000 + fields["fraction"] // 1000).astype("m8[us]")
+        return _dates(np, fields) + microseconds, valid
+    if c_type is CDataType.SQL_C_TYPE_TIME:
+        return _seconds(np, _fields(np, column, count, _TIME_FIELDS)).astype("=i4"), valid
+
+    values = np.frombuffer(column.data, dtype=_NUMERIC_DTYPES[c_type][0], count=count).copy()
+    if c_type is CDataType.SQL_C_BIT:
+        values = values.astype(bool)
+    return values, valid
+
+
+def _binary_objects(np: typing.Any, column: BoundColumn, count: int) -> tuple[typing.Any, typing.Any]:
+    """Return a NumPy object array of the first `count` values of a bound binary column, as NumPy has no variable
+    length binary type, and whether each one is not null."""
+    indicators = _indicators(np, column, count)
+    valid = indicators != LengthOrIndicatorType.SQL_NULL_DATA.value
+    _check_lengths(np, column, indicators, valid, column.element_size)
+    data = memoryview(column.data).cast("B")
+    element_size = column.element_size
+    values = np.empty(count, dtype=object)
+    values[:] = [
+        bytes(data[i * element_size : i * element_size + length]) if length >= 0 else None
+        for i, length in enumerate(indicators.tolist())
+    ]
+    return values, valid
+
+
+def _fields(np: typing.Any, column: BoundColumn, count: int, fields: list[tuple[str, str]]) -> typing.Any:
+    return np.frombuffer(column.data, dtype=np.dtype(fields), count=count)
+
+
+def _dates(np: typing.Any, fields: typing.Any) -> typing.Any:
+    years = (fields["year"].astype("=i8") - 1970).astype("M8[Y]")
+    months = (fields["month"].astype("=i8") - 1).astype("m8[M]")
+    days = (fields["day"].astype("=i8") - 1).astype("m8[D]")
+    return (years + months).astype("M8[D]") + days
+
+
+def _seconds(np: typing.Any, fields: typing.Any) -> typing.Any:
+    return fields["hour"].astype("=i8") * 3600 + fields["minute"].astype("=i8") * 60 + fields["second"].astype("=i8")
+
+
+def _check_lengths(
+    np: typing.Any, column: BoundColumn, lengths: typing.Any, valid: typing.Any, max_length: int
+) -> None:
+    if np.any(valid & ((lengths < 0) | (lengths > max_length))):
+        raise DataError(f"Value of column {column.description.name} was truncated")
+
+
+def _code_points(np: typing.Any, column: BoundColumn, count: int, sqlwchar_size: int) -> tuple[typing.Any, typing.Any]:
+    """Return the code points of the first `count` SQLWCHAR strings of a bound column as a 2-dimensional array padded
+    with zeros, and the number of code points in each string (0 for nulls)."""
+    indicators = _indicators(np, column, count)
+    valid = indicators != LengthOrIndicatorType.SQL_NULL_DATA.value
+    _check_lengths(np, column, indicators, valid, column.element_size - sqlwchar_size)
+
+    width = column.element_size // sqlwchar_size
+    units = np.frombuffer(column.data, dtype=f"=u{sqlwchar_size}", count=count * width).reshape(count, width)
+    lengths = np.where(valid, indicators // sqlwchar_size, 0)
+    in_value = np.arange(width) < lengths[:, None]
+    code_points = np.where(in_value, units, 0).astype("=u4")
+
+    if sqlwchar_size == 2:
+        # Characters outside the BMP are UTF-16 surrogate pairs, which are combined into a code point in place of the
+        # high surrogate, with the low surrogates then removed.
+        high = (code_points >= 0xD800) & (code_points < 0xDC00)
+        if np.any(high):
+            low = np.zeros_like(high)
+            low[:, 1:] = high[:, :-1]
+            following = np.zeros_like(code_points)
+            following[:, :-1] = code_points[:, 1:]
+            combined = 0x10000 + ((code_points - 0xD800) << 10) + (following - 0xDC00)
+            code_points = np.where(high, combined, code_points)
+            code_points[low] = 0
+            order = np.argsort(low, axis=1, kind="stable")
+            code_points = np.take_along_axis(code_points, order, axis=1)
+            lengths = lengths - low.sum(axis=1)
+
+    return np.ascontiguousarray(code_points), lengths
+
+
+def _validity_bitmap(pa: typing.Any, np: typing.Any, valid: typing.Any) -> tuple[typing.Any, int]:
+    """Return an Arrow validity bitmap (or None if there are no nulls) and the number of nulls."""
+    null_count = int(valid.size - np.count_nonzero(valid))
+    if not null_count:
+        return None, 0
+    return pa.py_buffer(np.packbits(valid, bitorder="little").tobytes()), null_count
+
+
+def _arrow_variable_length(
+    pa: typing.Any, np: typing.Any, arrow_type: typing.Any, data: bytes, lengths: typing.Any, valid: typing.Any
+) -> typing.Any:
+    """Build an Arrow string or binary array from the concatenated values and their lengths."""
+    offsets = np.zeros(len(lengths) + 1, dtype="=i8")
+    np.cumsum(lengths, out=offsets[1:])
+    if offsets[-1] > 2**31 - 1:
+        arrow_type = pa.large_string() if arrow_type == pa.string() else pa.large_binary()
+    else:
+        offsets = offsets.astype("=i4")
+    bitmap, null_count = _validity_bitmap(pa, np, valid)
+    return pa.Array.from_buffers(
+        arrow_type, len(lengths), [bitmap, pa.py_buffer(offsets.tobytes()), pa.py_buffer(data)], null_count
+    )
+
+
+def _arrow_strings(pa: typing.Any, np: typing.Any, column: BoundColumn, count: int, sqlwchar_size: int) -> typing.Any:
+    """Build an Arrow string array from the first `count` SQLWCHAR strings of a bound column.
+
+    The strings of the rowset are decoded and encoded as UTF-8 at once, and the length of each one in UTF-8 is
+    calculated from its code points.
+    """
+    code_points, lengths = _code_points(np, column, count, sqlwchar_size)
+    in_value = np.arange(code_points.shape[1]) < lengths[:, None]
+    values = code_points[in_value]
+    data = values.astype("<u4").tobytes().decode("utf-32-le").encode("utf-8")
+    utf8_lengths = 1 + (values >= 0x80).astype("=i8") + (values >= 0x800) + (values >= 0x10000)
+    byte_lengths = np.zeros(code_points.shape, dtype="=i8")
+    byte_lengths[in_value] = utf8_lengths
+    valid = _indicators(np, column, count) != LengthOrIndicatorType.SQL_NULL_DATA.value
+    return _arrow_variable_length(pa, np, pa.string(), data, byte_lengths.sum(axis=1), valid)
+
+
+def _arrow_binary(
+    pa: typing.Any, np: typing.Any, arrow_type: typing.Any, column: BoundColumn, count: int
+) -> typing.Any:
+    """Build an Arrow binary (or string, from SQL_C_CHAR text) array from the first `count` values of a bound
+    column."""
+    indicators = _indicators(np, column, count)
+    valid = indicators != LengthOrIndicatorType.SQL_NULL_DATA.value
+    terminator = 1 if column.c_type is CDataType.SQL_C_CHAR else 0
+    _check_lengths(np, column, indicators, valid, column.element_size - terminator)
+
+    values = np.frombuffer(column.data, dtype="u1", count=count * column.element_size).reshape(
+        count, column.element_size
+    )
+    lengths = np.where(valid, indicators, 0)
+    data = values[np.arange(column.element_size) < lengths[:, None]].tobytes()
+    return _arrow_variable_length(pa, np, arrow_type, data, lengths, valid)
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
-from typing import Any
+import dataclasses
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
+from ._catalog_cache import CatalogCache
 from ._cursor import Cursor
+from ._driver_manager import DriverManager
 from ._enums import (
     CompletionType,
     ConnectionAttributeType,
     ConnectionAutocommitMode,
+    FunctionId,
     HandleType,
     InfoType,
 )
 from ._errors import ProgrammingError
 from ._handler import Handler
+from ._prepared_statement import StatementCache
+from ._statistics import ConnectionStatistics, ExecutionStatistics, StatementStatistics
+
+if TYPE_CHECKING:
+    from ._pool import PooledConnection
+
+# The information types whose values can change during a connection, which are read every time.
+_VOLATILE_INFO_TYPES = frozenset({InfoType.SQL_DATABASE_NAME, InfoType.SQL_DATA_SOURCE_READ_ONLY})
 
 
 class Connection(Handler):
@@ -23,18 +37,116 @@ class Connection(Handler):
     create a Connection object.
     """
 
+    def __init__(self, driver_manager: DriverManager) -> None:
+        super().__init__(driver_manager)
+        self._statement_cache = StatementCache(self)
+        self._catalog_cache = CatalogCache()
+        self.__supported_functions: dict[FunctionId, bool] = {}
+        # The values of the information types read so far, which are shared with the pooled connection (if any).
+        self._info: dict[InfoType, str | int | bool] = {}
+        self.__cursors: weakref.WeakSet[Cursor] = weakref.WeakSet()
+        # The pooled physical connection which this object wraps, if it was checked out of a pool.
+        self._pooled: PooledConnection | None = None
+        # The autocommit mode last set on the connection, or None if it has to be read from the driver.
+        self._autocommit: bool | None = None
+        # Whether a statement has been executed since the last commit or rollback, so that there may be a transaction
+        # to roll back.
+        self._in_transaction = False
+        # The statement counts, and the totals of the cursors which have been closed or garbage collected, to which
+        # those of the open cursors are added (less __reset, their totals when the statistics were last reset).
+        self._statistics = ConnectionStatistics()
+        self.__reset = ExecutionStatistics()
+        # The number of seconds after which a statement counts as slow, or None to not look for slow statements. A
+        # statement becomes slow when the time spent executing it and fetching its results so far reaches the
+        # threshold, when slow_statement_callback (if set) is called with its SQL and statistics, once per execution.
+        # The callback is called by the thread which executed or fetched, which is a helper thread when rows are
+        # prefetched.
+        self.slow_statement_threshold: float | None = None
+        self.slow_statement_callback: Callable[[str, StatementStatistics], None] | None = None
+
+    @property
+    def statement_cache_size(self) -> int:
+        """The maximum number of parameterized statements kept prepared for re-execution, by SQL text.
+
+        Setting this to 0 disables the cache, so statements are prepared every time they are executed.
+        """
+        return self._statement_cache.maxsize
+
+    @statement_cache_size.setter
+    def statement_cache_size(self, size: int) -> None:
+        self._statement_cache.maxsize = size
+
+    @property
+    def catalog_cache_size(self) -> int:
+        """The maximum number of catalog function results (of Cursor.tables(), procedures() and foreignKeys()) kept, by
+        function and arguments, to be replayed when the same function is called again.
+
+        This is 0 by default, which disables the cache. Cached results are discarded when they expire, when the
+        connection executes DDL or is rolled back, and by clear_catalog_cache().
+        """
+        return self._catalog_cache.maxsize
+
+    @catalog_cache_size.setter
+    def catalog_cache_size(self, size: int) -> None:
+        self._catalog_cache.maxsize = size
+
+    @property
+    def catalog_cache_ttl(self) -> float | None:
+        """The number of seconds for which a catalog function result is cached, or None if it does not expire."""
+        return self._catalog_cache.ttl
+
+    @catalog_cache_ttl.setter
+    def catalog_cache_ttl(self, ttl: float | None) -> None:
+        self._catalog_cache.ttl = ttl
+
+    def clear_catalog_cache(self) -> None:
+        """Discard all cached catalog function results, for example after the schema was changed by another
+        connection."""
+        self._catalog_cache.clear()
+
+    @property
+    def statistics(self) -> ConnectionStatistics:
+        """A snapshot of the statistics of all the statements executed by the connection's cursors."""
+        statistics = dataclasses.replace(self._statistics)
+        statistics._add(self.__open_cursor_totals())
+        statistics._add(self.__reset, -1)
+        return statistics
+
+    def reset_statistics(self) -> None:
+        self._statistics = ConnectionStatistics()
+        self.__reset = self.__open_cursor_totals()
+
+    def __open_cursor_totals(self) -> ExecutionStatistics:
+        totals = ExecutionStatistics()
+        for cursor in list(self.__cursors):
+            if not cursor._closed:
+                totals._add(cursor._sync_totals())
+        return totals
+
+    def _add_statistics(self, totals: ExecutionStatistics) -> None:
+        """Add the totals of a cursor which has been closed or garbage collected."""
+        self._statistics._add(totals)
+
+    def _supports(self, function_id: FunctionId) -> bool:
+        """Return whether the driver supports an ODBC function."""
+        if function_id not in self.__supported_functions:
+            self.__supported_functions[function_id] = self._driver_manager.sql_get_functions(self, function_id)
+        return self.__supported_functions[function_id]
+
     @property
     def autocommit(self) -> bool:
         """Whether the database automatically executes a commit after every successful transaction.
 
         Default is False.
+
+        The mode is remembered when it is set, rather than read from the driver every time. If it may have been changed
+        some other way (for example by executing SQL), refresh_autocommit() reads it from the driver.
         """
         # TODO: According to pep-0249 this is deprecated.
         #  https://peps.python.org/pep-0249/#optional-db-api-extensions
-        ret: int = self._driver_manager.sql_get_connect_attr(
-            connection=self, attr=ConnectionAttributeType.SQL_ATTR_AUTOCOMMIT
-        )
-        return ConnectionAutocommitMode(ret) == ConnectionAutocommitMode.SQL_AUTOCOMMIT_ON
+        if self._autocommit is None:
+            return self.refresh_autocommit()
+        return self._autocommit
 
     @autocommit.setter
     def autocommit(self, enabled: bool) -> None:
@@ -43,10 +155,42 @@ class Connection(Handler):
             attr=ConnectionAttributeType.SQL_ATTR_AUTOCOMMIT,
             value=ConnectionAutocommitMode(int(enabled)).value,
         )
+        self._autocommit = enabled
+        if enabled:
+            # Turning autocommit on commits any open transaction.
+            self._in_transaction = False
+
+    def refresh_autocommit(self) -> bool:
+        """Read the autocommit mode from the driver, remember it and return it."""
+        ret: int = self._driver_manager.sql_get_connect_attr(
+            connection=self, attr=ConnectionAttributeType.SQL_ATTR_AUTOCOMMIT
+        )
+        self._autocommit = ConnectionAutocommitMode(ret) == ConnectionAutocommitMode.SQL_AUTOCOMMIT_ON
+        return self._autocommit
+
+    def getinfo(self, info_type: InfoType | int) -> str | int | bool:
+        """Return the value of a SQLGetInfo information type, given as an InfoType or its value.
+
+        Character string types are returned as a str, and "Y"/"N" types as a bool. The others are returned as an int,
+        which for many types is a bitmask.
+
+        Values which do not change during the connection are only read from the driver once.
+        """
+        if not isinstance(info_type, InfoType):
+            try:
+                info_type = InfoType(info_type)
+            except ValueError:
+                raise ProgrammingError(f"Unknown information type {info_type}.") from None
+        value = self._info.get(info_type)
+        if value is None:
+            value = self._driver_manager.get_info(self, info_type)
+            if info_type not in _VOLATILE_INFO_TYPES:
+                self._info[info_type] = value
+        return value
 
     @property
     def dbms_name(self) -> str:
-        return self._driver_manager.sql_get_info(connection=self, info_type=InfoType.SQL_DBMS_NAME)
+        return str(self.getinfo(InfoType.SQL_DBMS_NAME))
 
     @property
     def identifier_quote_char(self) -> str:
@@ -61,10 +205,7 @@ class Connection(Handler):
         Because the identifier quote character in SQL-92 is the double quotation mark ("), a driver that conforms
         strictly to SQL-92 will always return the double quotation mark character.
         """
-        return self._driver_manager.sql_get_info(
-            connection=self,
-            info_type=InfoType.SQL_IDENTIFIER_QUOTE_CHAR,
-        )
+        return str(self.getinfo(InfoType.SQL_IDENTIFIER_QUOTE_CHAR))
 
     @property
     def schema_term(self) -> str:
@@ -77,19 +218,17 @@ class Connection(Handler):
 
         :return: A string with the data source vendor's name for a schema.
         """
-        return self._driver_manager.sql_get_info(
-            connection=self,
-            info_type=InfoType.SQL_SCHEMA_TERM,
-        )
+        return str(self.getinfo(InfoType.SQL_SCHEMA_TERM))
 
     def cursor(self) -> Cursor:
         cur = Cursor(self._driver_manager, self)
+        self.__cursors.add(cur)
         return cur
 
     @property
     def searchescape(self) -> str:
         """The escape character to be used with catalog functions."""
-        return self._driver_manager.sql_get_info(self, InfoType.SQL_SEARCH_PATTERN_ESCAPE)
+        return str(self.getinfo(InfoType.SQL_SEARCH_PATTERN_ESCAPE))
 
     @property
     def handle_type(self) -> HandleType:
@@ -97,14 +236,43 @@ class Connection(Handler):
 
     def commit(self) -> None:
         self._driver_manager.sql_end_tran(self, CompletionType.SQL_COMMIT)
+        self._in_transaction = False
 
     def rollback(self) -> None:
         self._driver_manager.sql_end_tran(self, CompletionType.SQL_ROLLBACK)
+        self._in_transaction = False
+        # Results cached since DDL was executed in the transaction may describe objects which no longer exist.
+        self._catalog_cache.clear()
 
     def close(self) -> None:
+        """Close the connection, rolling back any open transaction.
+
+        The rollback is skipped if no statement has been executed since the last commit or rollback. A connection
+        checked out of a pool is returned to it, rather than being disconnected.
+        """
         if self._closed:
             return
-        if not self.autocommit:
+        for cursor in list(self.__cursors):
+            cursor.close()
+        self._statement_cache.clear()
+        self._catalog_cache.clear()
+
+        if self._pooled is not None:
+            pool = self._pooled.pool
+            reusable = False
+            try:
+                autocommit = self.autocommit
+                if not autocommit and self._in_transaction:
+                    self.rollback()
+                if autocommit != pool.autocommit:
+                    self.autocommit = pool.autocommit
+                reusable = True
+            finally:
+                pool.release(self, reusable)
+                self._closed = True
+            return
+
+        if self._in_transaction and not self.autocommit:
             self.rollback()
         self._driver_manager.sql_disconnect(self)
         super().close()
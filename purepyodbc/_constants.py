@@ -1,3 +1,18 @@
 from __future__ import annotations
 
+from ._enums import ReturnCode
+
 SQL_NTS = -3
+
+# Return codes as plain ints, so that the return values of ODBC functions can be checked without creating ReturnCode
+# members.
+SQL_SUCCESS = ReturnCode.SQL_SUCCESS.value
+SQL_SUCCESS_WITH_INFO = ReturnCode.SQL_SUCCESS_WITH_INFO.value
+SQL_NO_DATA = ReturnCode.SQL_NO_DATA.value
+SQL_STILL_EXECUTING = ReturnCode.SQL_STILL_EXECUTING.value
+SQL_NEED_DATA = ReturnCode.SQL_NEED_DATA.value
+SQL_ERROR = ReturnCode.SQL_ERROR.value
+SQL_INVALID_HANDLE = ReturnCode.SQL_INVALID_HANDLE.value
+
+# The return codes which check_success() accepts.
+SUCCESS_RETURN_CODES = frozenset((SQL_SUCCESS, SQL_SUCCESS_WITH_INFO, SQL_NO_DATA))
@@ -1,56 +1,371 @@
 from __future__ import annotations
 
+import collections
+import dataclasses
+import time
 import typing
+import weakref
+from collections.abc import Hashable
 
-from ._driver_manager import DriverManager
+import purepyodbc
+
+from . import _columnar
+from ._buffers import BoundParameter, GetDataBuffer, RowSetBuffer
+from ._driver_manager import GET_DATA_BUFFER_SIZE, DriverManager
 from ._dto import ColumnDescription, SqlColumnDescription
-from ._enums import HandleType
+from ._enums import AsyncEnable, FreeStatementOption, HandleType, ParameterStatus, StatementAttributeType
+from ._errors import Error, ProgrammingError
 from ._handler import Handler
+from ._pending import Pending
+from ._prefetch import PrefetchedBlock, Prefetcher
+from ._prepared_statement import PreparedStatement
 from ._row import Row
+from ._statistics import ExecutionStatistics, StatementStatistics
 
 if typing.TYPE_CHECKING:
+    from _typeshed import SupportsWrite
+
     from ._connection import Connection
 
+T = typing.TypeVar("T")
+
+# How long an asynchronous call whose Pending was discarded is polled for after being cancelled, in seconds.
+ABANDON_TIMEOUT = 1.0
+
 
 class Cursor(Handler):
     def __init__(self, driver_manager: DriverManager, connection: Connection) -> None:
         super().__init__(driver_manager)
         self.connection = connection
         self.arraysize = 1
-        self.__rowcount = -1
+        # The minimum number of rows fetched at once in blocks, as when iterating over the cursor or by fetchall().
+        self.iteration_size = 100
+        # The number of blocks of rows which a helper thread fetches ahead while the cursor is iterated over, or 0 to
+        # fetch them in the iterating thread.
+        self.prefetch_blocks = 0
+        # The maximum number of parameter sets which executemany() sends to the driver at once.
+        self.executemany_batch_size = 1024
+        # The rowcount, or None if it is to be read from the driver when first needed.
+        self.__rowcount: int | None = -1
+        self.__columncount: int | None = 0
         self.__column_descriptions: tuple[ColumnDescription, ...] = tuple()
         self.__sql_column_descriptions: tuple[SqlColumnDescription, ...] = tuple()
+        # Whether the columns of the result set have been described. They are described when first needed, with
+        # lowercase names if __lowercase is set, and cached with the prepared statement under __description_key (if
+        # any).
+        self.__described = True
+        self.__lowercase = False
+        self.__description_key: Hashable | None = None
+        # Maps column names to indexes, shared by all rows of the result set.
+        self.__column_index: dict[str, int] = {}
+        # Whether the result set is fetched in blocks of bound rows, or decided on the first fetch if None.
+        self.__block_fetch: bool | None = None
+        self.__row_set: RowSetBuffer | None = None
+        self.__get_data_buffers: tuple[GetDataBuffer, ...] | None = None
+        # Rows fetched ahead, by __next__() or as the rest of a block, which are returned before any others.
+        self.__prefetched: collections.deque[Row] = collections.deque()
+        self.__prefetcher: Prefetcher | None = None
+        # Whether the result set was replayed from the connection's catalog cache, in which case all of its rows are in
+        # __prefetched and there is none open on the statement.
+        self.__replayed = False
+        # A prepared statement checked out of the connection's statement cache, whose handle is used in place of the
+        # cursor's own until the next execution.
+        self.__statement: PreparedStatement | None = None
+        self.__parameters: tuple[BoundParameter, ...] = tuple()
+        self.__parameter_statuses: list[ParameterStatus] = []
+        # The statistics of everything the cursor has executed, to which the driver manager adds the bytes fetched, and
+        # of which those of the last statement are the difference from __baseline. The ODBC calls (counted while
+        # tracing is enabled) are copied from _odbc_calls when the statistics are read.
+        self._totals = ExecutionStatistics()
+        self.__baseline = ExecutionStatistics()
+        self.__sql = ""
+        # The time.perf_counter() at which the last statement started executing, the time until its first row was
+        # fetched, and whether it has been reported as slow (or there is none to report).
+        self.__started = 0.0
+        self.__first_row_time: float | None = None
+        self.__slow = True
+        # The totals of a cursor which is closed, or garbage collected, are added to those of its connection.
+        self.__finalizer = weakref.finalize(self, connection._add_statistics, self._totals)
         self._driver_manager.allocate_statement(self)
+        self.__own_handle = self.handle
+
+    def __iter__(self) -> Cursor:
+        return self
+
+    def __next__(self) -> Row:
+        """Return the next row of the result set, fetching max(arraysize, iteration_size) rows at a time.
+
+        If prefetch_blocks is set, the rows are fetched by a helper thread, which keeps up to that many blocks fetched
+        ahead while the caller processes the current one. It stops at the end of the result set, or when the cursor
+        executes again, moves to the next result set or is closed. The helper thread only fetches and converts the
+        rows: their statistics are added, and the connection's slow_statement_callback called, on the calling thread
+        as it takes them.
+        """
+        prefetched = self.__prefetched
+        if not prefetched:
+            size = max(self.arraysize, self.iteration_size)
+            if self.prefetch_blocks > 0 and self.__prefetcher is None and not self.__replayed and self.__describe():
+                # The helper thread has the statement to itself, so the rowcount is read and the arrays (or the
+                # buffers for SQLGetData) are bound first.
+                if self.__rowcount is None:
+                    self.__rowcount = self._driver_manager.sql_row_count(self)
+                row_set = self.__row_set if self.__use_block_fetch(size) else None
+                if row_set is None:
+                    self.__data_buffers()
+                self.__prefetcher = Prefetcher(lambda: self.__prefetch_block(row_set, size), self.prefetch_blocks)
+            prefetched.extend(self.__fetch_many(size))
+            if not prefetched:
+                raise StopIteration
+        return prefetched.popleft()
 
     @property
     def rowcount(self) -> int:
+        if self.__rowcount is None:
+            self.__rowcount = self._driver_manager.sql_row_count(self)
         return self.__rowcount
 
     @property
     def description(self) -> typing.Sequence[ColumnDescription]:
+        self.__describe()
         return self.__column_descriptions
 
+    @property
+    def parameter_statuses(self) -> list[ParameterStatus]:
+        """The status of each set of parameters executed by the last call to executemany(), as reported by the driver.
+
+        Sets which were not executed (for example because the driver stops at the first error) are SQL_PARAM_UNUSED.
+        """
+        return self.__parameter_statuses
+
     @property
     def columncount(self) -> int:
-        return self._driver_manager.sql_num_result_cols(self)
+        if self.__columncount is None:
+            self.__columncount = self._driver_manager.sql_num_result_cols(self)
+        return self.__columncount
+
+    @property
+    def statistics(self) -> StatementStatistics:
+        """A snapshot of the statistics of the statement last executed, and of the fetching of its results so far."""
+        statistics = StatementStatistics(sql=self.__sql, first_row_time=self.__first_row_time)
+        statistics._add(self._sync_totals())
+        statistics._add(self.__baseline, -1)
+        return statistics
 
     @property
     def handle_type(self) -> HandleType:
         return HandleType.SQL_HANDLE_STMT
 
-    def __post_execute(self, lowercase: bool = False) -> None:
-        """Update rowcount and column descriptions."""
-        self.__rowcount = self._driver_manager.sql_row_count(self)
-        self.__sql_column_descriptions = tuple(
-            self._driver_manager.sql_describe_col(self, i + 1, lowercase) for i in range(self.columncount)
-        )
-        self.__column_descriptions = tuple(x.to_column_description() for x in self.__sql_column_descriptions)
+    def __begin(self, sql: str) -> float:
+        """Start collecting the statistics of a new statement, returning the time at which it started."""
+        # The calls made since the last statement finished, such as closing its result set, belong to it.
+        self.__baseline = dataclasses.replace(self._sync_totals())
+        self.__sql = sql
+        self.__first_row_time = None
+        self.__slow = False
+        self.connection._statistics.statements += 1
+        self.__started = time.perf_counter()
+        return self.__started
+
+    def __executed(self, start: float) -> None:
+        """Add the time since `start` to the statement's execute time."""
+        self._totals.execute_time += time.perf_counter() - start
+        if self.connection.slow_statement_threshold is not None:
+            self.__check_slow()
+
+    def __fetched(self, start: float, rows: int) -> None:
+        """Add the time since `start`, in which `rows` rows were fetched, to the statement's fetch time."""
+        end = time.perf_counter()
+        totals = self._totals
+        totals.fetch_time += end - start
+        totals.rows_fetched += rows
+        self.__after_fetch(end, rows)
+
+    def __took_block(self, block: PrefetchedBlock) -> None:
+        """Add the statistics of a block fetched by the prefetching thread, as the cursor's thread takes it."""
+        self._totals._add(block.totals)
+        self.__after_fetch(time.perf_counter(), len(block.rows))
+
+    def __after_fetch(self, end: float, rows: int) -> None:
+        if rows and self.__first_row_time is None:
+            self.__first_row_time = end - self.__started
+        if self.connection.slow_statement_threshold is not None:
+            self.__check_slow()
 
-    def execute(self, query_string: str) -> Cursor:
-        self._driver_manager.sql_exec_direct(self, query_string)
-        self.__post_execute()
+    def __check_slow(self) -> None:
+        """Count the statement as slow, and report it to the connection's slow_statement_callback, if it has reached
+        the connection's slow_statement_threshold."""
+        if self.__slow:
+            return
+        connection = self.connection
+        statistics = self.statistics
+        threshold = connection.slow_statement_threshold
+        if threshold is not None and statistics.elapsed_time >= threshold:
+            self.__slow = True
+            connection._statistics.slow_statements += 1
+            if connection.slow_statement_callback is not None:
+                connection.slow_statement_callback(statistics.sql, statistics)
+
+    def _sync_totals(self) -> ExecutionStatistics:
+        """Return the totals, with the ODBC calls counted so far."""
+        self._totals.odbc_calls = self._odbc_calls
+        return self._totals
+
+    def __pre_execute(self) -> None:
+        """Close any open result set, release the arrays and parameters bound to the statement, and return any prepared
+        statement to the connection's statement cache."""
+        # Any prefetching thread is stopped first, as it may be in the middle of a fetch on the statement.
+        self.__release_row_set()
+        if self.__columncount != 0:
+            self._driver_manager.sql_free_stmt(self, FreeStatementOption.SQL_CLOSE)
+        # What was not read from the driver about the previous result can no longer be.
+        if not self.__described:
+            self.__set_description(tuple())
+        if self.__rowcount is None:
+            self.__rowcount = -1
+        self.__replayed = False
+        self.__parameter_statuses = []
+        if self.__parameters:
+            self._driver_manager.sql_free_stmt(self, FreeStatementOption.SQL_RESET_PARAMS)
+            self.__parameters = tuple()
+        if self.__statement is not None:
+            self.handle = self.__own_handle
+            self.connection._statement_cache.checkin(self.__statement)
+            self.__statement = None
+
+    def __release_row_set(self) -> None:
+        if self.__prefetcher is not None:
+            blocks, _ = self.__prefetcher.stop()
+            self.__prefetcher = None
+            for block in blocks:
+                self.__took_block(block)
+        if self.__row_set is not None:
+            self._driver_manager.unbind_row_set(self)
+            self.__row_set = None
+        self.__block_fetch = None
+        self.__get_data_buffers = None
+        self.__prefetched.clear()
+
+    def __post_execute(self, lowercase: bool = False, description_key: Hashable | None = None) -> None:
+        """Reset rowcount and the column descriptions, which are read from the driver when they are first needed.
+
+        The column descriptions of the first result set of a prepared statement are cached with the statement under
+        `description_key`.
+        """
+        self.__rowcount = None
+        if description_key is not None:
+            assert self.__statement is not None
+            sql_column_descriptions = self.__statement.column_descriptions.get(description_key)
+            if sql_column_descriptions is not None:
+                self.__set_description(sql_column_descriptions)
+                return
+        self.__described = False
+        self.__columncount = None
+        self.__lowercase = lowercase
+        self.__description_key = description_key
+
+    def __describe(self) -> tuple[SqlColumnDescription, ...]:
+        """Return the descriptions of the result set's columns, describing them if they have not been yet."""
+        if not self.__described:
+            sql_column_descriptions = self._driver_manager.sql_describe_cols(self, self.columncount, self.__lowercase)
+            self.__set_description(sql_column_descriptions)
+            if self.__description_key is not None:
+                assert self.__statement is not None
+                self.__statement.column_descriptions[self.__description_key] = sql_column_descriptions
+        return self.__sql_column_descriptions
+
+    def __set_description(self, sql_column_descriptions: tuple[SqlColumnDescription, ...]) -> None:
+        self.__described = True
+        self.__columncount = len(sql_column_descriptions)
+        self.__sql_column_descriptions = sql_column_descriptions
+        self.__column_descriptions = tuple(x.to_column_description() for x in sql_column_descriptions)
+        self.__column_index = {x.name: i for i, x in enumerate(sql_column_descriptions)}
+
+    def execute(self, query_string: str, *params: typing.Any) -> Cursor:
+        """Execute a SQL statement, with the values of any parameter markers (?) passed either as separate arguments
+        or as a single sequence.
+
+        Statements with parameters are prepared, and kept prepared in the connection's statement cache, so executing
+        them again only binds the new values. Statements without parameters are executed directly.
+        """
+        if len(params) == 1 and isinstance(params[0], (list, tuple, Row)):
+            params = tuple(params[0])
+
+        self.__pre_execute()
+        start = self.__begin(query_string)
+        self.connection._catalog_cache.executed(query_string)
+        self.connection._statement_cache.executed(query_string)
+        self.connection._in_transaction = True
+        if params:
+            self.__execute_prepared(query_string, params)
+        else:
+            self._driver_manager.sql_exec_direct(self, query_string)
+            self.__post_execute()
+        self.__executed(start)
         return self
 
+    def executemany(self, query_string: str, seq_of_parameters: typing.Iterable[typing.Sequence[typing.Any]]) -> None:
+        """Execute a SQL statement once for each set of parameter values.
+
+        The parameter sets are bound as column-wise arrays, and sent to the driver in batches of up to
+        executemany_batch_size sets, each executed with a single SQLExecute. The status of each set is then available
+        from parameter_statuses, also when an error is raised.
+        """
+        self.__pre_execute()
+        start = self.__begin(query_string)
+        self.connection._catalog_cache.executed(query_string)
+        self.connection._statement_cache.executed(query_string)
+        self.connection._in_transaction = True
+        statement = self.__use_prepared_statement(query_string)
+        rowcount = 0
+
+        batch_size = self._driver_manager.set_paramset_size(self, max(self.executemany_batch_size, 1))
+        try:
+            for batch in self._driver_manager.parameter_batches(statement, seq_of_parameters, batch_size):
+                parameter_set_buffer = self._driver_manager.bind_parameter_sets(self, statement, batch)
+                try:
+                    self._driver_manager.sql_execute(self)
+                finally:
+                    self.__parameter_statuses.extend(parameter_set_buffer.get_statuses())
+                batch_rowcount = self._driver_manager.sql_row_count(self)
+                rowcount = -1 if rowcount < 0 or batch_rowcount < 0 else rowcount + batch_rowcount
+        finally:
+            self._driver_manager.unbind_parameter_sets(self)
+
+        if not self.__parameter_statuses:
+            raise ProgrammingError("The second parameter to executemany must not be empty.")
+        self.__rowcount = rowcount
+        self.__set_description(tuple())
+        self.__executed(start)
+
+    def __use_prepared_statement(self, query_string: str) -> PreparedStatement:
+        """Check the statement prepared for `query_string` out of the connection's statement cache, and use its handle
+        until the next execution."""
+        statement = self.connection._statement_cache.checkout(query_string)
+        self.__statement = statement
+        self.handle = statement.handle
+        return statement
+
+    def __execute_prepared(self, query_string: str, params: typing.Sequence[typing.Any]) -> None:
+        self.__bind_prepared(query_string, params)
+        self._driver_manager.sql_execute(self)
+        self.__post_execute_prepared()
+
+    def __bind_prepared(self, query_string: str, params: typing.Sequence[typing.Any]) -> PreparedStatement:
+        statement = self.__use_prepared_statement(query_string)
+
+        if len(params) != statement.parameter_count:
+            raise ProgrammingError(
+                f"The SQL contains {statement.parameter_count} parameter markers, but {len(params)} parameters were "
+                f"supplied"
+            )
+
+        self.__parameters = self._driver_manager.bind_parameters(self, statement, params)
+        return statement
+
+    def __post_execute_prepared(self) -> None:
+        key = (tuple(x.c_type for x in self.__parameters), purepyodbc.lowercase, purepyodbc.native_uuid)
+        self.__post_execute(description_key=key)
+
     def fetchmany(self, size: int | None = None) -> list[Row]:
         """Fetch the next set of rows of a query result.
 
@@ -58,27 +373,80 @@ class Cursor(Handler):
         """
 
         size = self.arraysize if size is None else size
-        rows: list[Row] = []
+        rows = self.__fetch_many(size)
+        self.__keep_surplus(rows, size)
+        return rows
 
-        if size:
+    def __fetch_many(self, size: int) -> list[Row]:
+        """Take or fetch at least `size` rows, or the rest of the result set if there are fewer, which may be more than
+        `size` when they were fetched in blocks."""
+        rows = self.__take_prefetched(size)
+        if len(rows) < size:
+            rows.extend(self.__fetch_rows(size - len(rows)))
+        return rows
+
+    def __fetch_rows(self, size: int) -> list[Row]:
+        """Fetch up to `size` rows, or whole blocks of at least `size` rows in all if the result set is fetched in
+        blocks."""
+        if self.__replayed:
+            return []
+        start = time.perf_counter()
+        row_set = self.__row_set if self.__use_block_fetch(size) else None
+        rows = self.__read_rows(row_set, size, self._totals)
+        self.__fetched(start, len(rows))
+        return rows
+
+    def __prefetch_block(self, row_set: RowSetBuffer | None, size: int) -> PrefetchedBlock:
+        """Fetch the next block of rows on the prefetching thread, timing it separately from the cursor's statistics."""
+        block = PrefetchedBlock([])
+        start = time.perf_counter()
+        block.rows = self.__read_rows(row_set, size, block.totals)
+        block.totals.fetch_time = time.perf_counter() - start
+        block.totals.rows_fetched = len(block.rows)
+        return block
+
+    def __read_rows(self, row_set: RowSetBuffer | None, size: int, totals: ExecutionStatistics) -> list[Row]:
+        """Fetch up to `size` rows, in whole blocks into the arrays of `row_set` if there is one, adding the bytes read
+        and the conversion time to `totals`.
+
+        This changes nothing else on the cursor, as the prefetching thread calls it.
+        """
+        driver_manager = self._driver_manager
+        rows: list[Row] = []
+        if row_set is not None:
             while len(rows) < size:
-                row = self.fetchone()
-                if not row:
+                count = driver_manager.sql_fetch_scroll(self, row_set, totals)
+                rows.extend(self.__rows_from_row_set(row_set, count, totals))
+                # A partial block is the end of the result set.
+                if count < row_set.capacity:
                     break
-                rows.append(row)
-
+        else:
+            while len(rows) < size and driver_manager.sql_fetch(self):
+                rows.append(self.__read_row(totals))
         return rows
 
     def fetchall(self) -> list[Row]:
         """Fetch all (remaining) rows in the result set."""
-        rows = []
+        rows = self.__take_prefetched(None)
+        if self.__replayed:
+            return rows
 
-        while True:
-            row = self.fetchone()
-            if not row:
-                break
-            rows.append(row)
+        start = time.perf_counter()
+        taken = len(rows)
+        if self.__use_block_fetch(max(self.arraysize, self.iteration_size)):
+            while True:
+                block = self.__fetch_block()
+                if not block:
+                    break
+                rows.extend(block)
+        else:
+            while True:
+                row = self.__fetch_row()
+                if row is None:
+                    break
+                rows.append(row)
 
+        self.__fetched(start, len(rows) - taken)
         return rows
 
     def fetchone(self) -> Row | None:
@@ -87,17 +455,457 @@ class Cursor(Handler):
 
         :return: A single row, or None when no more data is available.
         """
-        if not self._driver_manager.sql_fetch(self):
+        if self.__prefetched:
+            return self.__prefetched.popleft()
+        if self.__prefetcher is not None:
+            rows = self.__take_prefetched(1)
+            if rows:
+                return rows[0]
+        if self.__replayed:
             return None
-        row = Row()
-        for sql_column_description in self.__sql_column_descriptions:
-            value = self._driver_manager.sql_get_data(self, sql_column_description)
-            setattr(row, sql_column_description.name, value)
+        start = time.perf_counter()
+        if self.__use_block_fetch(1):
+            rows = self.__fetch_block()
+            row = rows[0] if rows else None
+            self.__keep_surplus(rows, 1)
+        else:
+            row = self.__fetch_row()
+        self.__fetched(start, row is not None)
         return row
 
+    def fetch_numpy(self) -> dict[str, typing.Any]:
+        """Fetch all (remaining) rows of the result set into a NumPy masked array per column, keyed by column name, in
+        which nulls are masked.
+
+        The columns are fetched into arrays of C types, which are converted column by column rather than value by
+        value. Integers and floats keep their size, decimals become float64, dates datetime64[D], timestamps
+        datetime64[us], times timedelta64[s], and strings and GUIDs fixed width str. Binary columns, and all the columns
+        of result sets with long columns, are fetched row by row into object arrays.
+
+        Requires NumPy.
+        """
+        np = _columnar.import_optional("numpy", "fetch_numpy()")
+        pieces = list(self.__fetch_arrays(np, None, None))
+        return {
+            x.name: np.ma.concatenate([piece[i] for piece in pieces])
+            for i, x in enumerate(self.__sql_column_descriptions)
+        }
+
+    def fetch_arrow_batches(self, batch_size: int = 10000) -> typing.Iterator[typing.Any]:
+        """Fetch the (remaining) rows of the result set as Arrow record batches of up to `batch_size` rows.
+
+        The columns are fetched into arrays of C types, from which Arrow buffers are built column by column: strings
+        are written to offset and data buffers and nulls to validity bitmaps, without creating a Python object for each
+        value. Decimals become Arrow decimals, dates date32, timestamps timestamp[us], times time32[s] and GUIDs
+        strings. Result sets with long columns are fetched row by row. There is always at least one batch, which is
+        empty if there are no rows left.
+
+        Requires PyArrow and NumPy.
+        """
+        pa = _columnar.import_optional("pyarrow", "fetch_arrow_batches()")
+        np = _columnar.import_optional("numpy", "fetch_arrow_batches()")
+        if batch_size < 1:
+            raise ProgrammingError("The batch size must be at least 1.")
+        names = [x.name for x in self.__describe()]
+        return (pa.RecordBatch.from_arrays(x, names=names) for x in self.__fetch_arrays(np, pa, batch_size))
+
+    def __fetch_arrays(self, np: typing.Any, pa: typing.Any, size: int | None) -> typing.Iterator[list[typing.Any]]:
+        """Fetch the rest of the result set up to `size` rows at a time, yielding a NumPy array (or an Arrow array,
+        given pa) per column for each rowset, and at least one rowset, which is empty if there are no rows left."""
+        if not self.__describe():
+            raise ProgrammingError("No results.  Previous SQL was not a query.")
+
+        arrow = pa is not None
+        row_set = None
+        if not self.__replayed:
+            row_set = _columnar.columnar_row_set(self._driver_manager, self.__sql_column_descriptions, arrow, size)
+        if row_set is None:
+            yield from self.__fetch_arrays_from_rows(np, pa, size)
+            return
+
+        # Rows already fetched ahead come first.
+        self.__stop_prefetcher()
+        first = True
+        while self.__prefetched:
+            yield self.__arrays_from_rows(np, pa, self.__take_prefetched(size))
+            first = False
+
+        sqlwchar_size = self._driver_manager._sqlwchar_size
+        self.__release_row_set()
+        self._driver_manager.bind_columns(self, row_set)
+        self.__row_set = row_set
+        try:
+            while True:
+                if self.__row_set is not row_set:
+                    raise ProgrammingError("Rows were fetched from the cursor while it was fetching arrays.")
+                start = time.perf_counter()
+                count = self._driver_manager.sql_fetch_scroll(self, row_set, self._totals)
+                if count or first:
+                    converting = time.perf_counter()
+                    if arrow:
+                        arrays = _columnar.arrow_arrays(pa, np, row_set, count, sqlwchar_size)
+                    else:
+                        arrays = _columnar.numpy_arrays(np, row_set, count, sqlwchar_size)
+                    self._totals.conversion_time += time.perf_counter() - converting
+                    self.__fetched(start, count)
+                    yield arrays
+                else:
+                    self.__fetched(start, count)
+                first = False
+                # A partial rowset is the end of the result set.
+                if count < row_set.capacity:
+                    return
+        finally:
+            if self.__row_set is row_set:
+                self.__release_row_set()
+
+    def __fetch_arrays_from_rows(
+        self, np: typing.Any, pa: typing.Any, size: int | None
+    ) -> typing.Iterator[list[typing.Any]]:
+        first = True
+        while True:
+            rows = self.fetchall() if size is None else self.fetchmany(size)
+            if rows or first:
+                yield self.__arrays_from_rows(np, pa, rows)
+            first = False
+            if size is None or len(rows) < size:
+                return
+
+    def __arrays_from_rows(self, np: typing.Any, pa: typing.Any, rows: list[Row]) -> list[typing.Any]:
+        columns = len(self.__sql_column_descriptions)
+        if pa is not None:
+            return _columnar.arrow_arrays_from_rows(pa, rows, columns)
+        return _columnar.numpy_arrays_from_rows(np, rows, columns)
+
+    def __take_prefetched(self, size: int | None) -> list[Row]:
+        """Take up to `size` (or all, given None) of the rows fetched ahead, waiting for the prefetching thread (if
+        any) to fetch them, until it reaches the end of the result set."""
+        prefetched = self.__prefetched
+        if self.__prefetcher is not None:
+            while size is None or len(prefetched) < size:
+                block = self.__prefetcher.get()
+                self.__took_block(block)
+                if not block.rows:
+                    break
+                prefetched.extend(block.rows)
+        if not prefetched:
+            return []
+        if size is None or size >= len(prefetched):
+            rows = list(prefetched)
+            prefetched.clear()
+            return rows
+        return [prefetched.popleft() for _ in range(size)]
+
+    def __stop_prefetcher(self) -> None:
+        """Stop the prefetching thread, if any, keeping the rows it fetched ahead, and raise the error which followed
+        them, if any."""
+        if self.__prefetcher is not None:
+            blocks, error = self.__prefetcher.stop()
+            self.__prefetcher = None
+            for block in blocks:
+                self.__took_block(block)
+                self.__prefetched.extend(block.rows)
+            if error is not None:
+                raise error
+
+    def __use_block_fetch(self, size: int) -> bool:
+        """Return whether the result set is fetched in blocks, binding arrays with room for at least `size` rows if
+        needed.
+
+        A result set is fetched in blocks unless one of its columns is long or unbounded, in which case each row is
+        fetched individually and its columns are read with SQLGetData. The arrays are bound for at least
+        max(arraysize, iteration_size) rows, and only bound again if a larger block is needed, so that fetches of
+        different sizes neither rebind the columns nor change the row array size. Wide result sets get fewer rows than
+        that, as the arrays are capped at ROW_SET_BUFFER_SIZE bytes, and larger fetches then take several blocks.
+        """
+        if self.__block_fetch is False:
+            return False
+        self.__describe()
+        row_set = self.__row_set
+        if row_set is None or row_set.columnar or (row_set.capacity < size and not row_set.capped):
+            self.__row_set = self._driver_manager.bind_row_set(
+                self, self.__sql_column_descriptions, max(size, self.arraysize, self.iteration_size)
+            )
+            self.__block_fetch = self.__row_set is not None
+        return self.__row_set is not None
+
+    def __fetch_block(self) -> list[Row]:
+        """Fetch the next block of rows, which fills the bound arrays unless it is the last."""
+        row_set = self.__row_set
+        assert row_set is not None
+        count = self._driver_manager.sql_fetch_scroll(self, row_set, self._totals)
+        return self.__rows_from_row_set(row_set, count, self._totals)
+
+    def __rows_from_row_set(self, row_set: RowSetBuffer, count: int, totals: ExecutionStatistics) -> list[Row]:
+        """Build rows from the first `count` rows in the bound arrays, timing their conversion as a whole."""
+        start = time.perf_counter()
+        column_index = self.__column_index
+        rows = [Row(column_index, values) for values in self._driver_manager.row_set_values(row_set, count)]
+        totals.conversion_time += time.perf_counter() - start
+        return rows
+
+    def __keep_surplus(self, rows: list[Row], size: int) -> None:
+        """Keep the rows of a block beyond the first `size`, which were not asked for, for the next fetch.
+
+        They are the first rows fetched ahead, as `rows` only go beyond `size` once the others have all been taken.
+        """
+        if len(rows) > size:
+            self.__prefetched.extend(rows[size:])
+            del rows[size:]
+
+    def __data_buffers(self) -> tuple[GetDataBuffer, ...]:
+        """Return the buffers which columns are read into with SQLGetData, allocating them when first needed."""
+        if self.__get_data_buffers is None:
+            self.__get_data_buffers = self._driver_manager.get_data_buffers(self.__describe())
+        return self.__get_data_buffers
+
+    def __fetch_row(self) -> Row | None:
+        if not self._driver_manager.sql_fetch(self):
+            return None
+        return self.__read_row(self._totals)
+
+    def __read_row(self, totals: ExecutionStatistics) -> Row:
+        """Read the values of the row fetched by SQLFetch with SQLGetData."""
+        buffers = self.__data_buffers()
+        sql_column_descriptions = self.__sql_column_descriptions
+        driver_manager = self._driver_manager
+        raw_values = [
+            driver_manager.sql_get_data_raw(self, x, buffer, totals)
+            for x, buffer in zip(sql_column_descriptions, buffers)
+        ]
+        # The values are converted once they have all been read, so that their conversion is timed once per row.
+        start = time.perf_counter()
+        convert_value = driver_manager.convert_value
+        values = tuple(
+            None if raw is None else convert_value(x, raw) for x, raw in zip(sql_column_descriptions, raw_values)
+        )
+        totals.conversion_time += time.perf_counter() - start
+        return Row(self.__column_index, values)
+
+    def execute_async(self, query_string: str, *params: typing.Any) -> Pending[Cursor]:
+        """Start executing a SQL statement like execute(), with asynchronous execution enabled on the statement.
+
+        The returned Pending is polled until the statement has completed, when its result is the cursor. Statements
+        with parameters are prepared before this returns.
+        """
+        if len(params) == 1 and isinstance(params[0], (list, tuple, Row)):
+            params = tuple(params[0])
+
+        self.__pre_execute()
+        start = self.__begin(query_string)
+        self.connection._catalog_cache.executed(query_string)
+        self.connection._statement_cache.executed(query_string)
+        self.connection._in_transaction = True
+        return self.__start(self.__execute_steps(query_string, params, start))
+
+    def fetchmany_async(self, size: int | None = None) -> Pending[list[Row]]:
+        """Start fetching the next set of rows like fetchmany(), with asynchronous execution enabled on the statement.
+
+        The returned Pending is polled until the fetch has completed, when its result is the rows.
+        """
+        return self.__start(self.__fetchmany_steps(self.arraysize if size is None else size))
+
+    def nextset_async(self) -> Pending[bool | None]:
+        """Start skipping to the next result set like nextset(), with asynchronous execution enabled on the
+        statement."""
+        self.__release_row_set()
+        return self.__start(self.__nextset_steps())
+
+    def __start(self, steps: typing.Generator[None, None, T]) -> Pending[T]:
+        pending = Pending(self, steps)
+        pending.poll()
+        return pending
+
+    def __poll(self, call: typing.Callable[[], T | None]) -> typing.Generator[None, None, T]:
+        """Call an ODBC function with asynchronous execution enabled until it returns something other than None, which
+        it does while it is still executing.
+
+        Asynchronous execution is only enabled on the statement for the duration of the call, so that the other
+        functions called on it (and prepared statements returned to the cache) still execute synchronously.
+        """
+        self._driver_manager.sql_set_stmt_attr(
+            self, StatementAttributeType.SQL_ATTR_ASYNC_ENABLE, AsyncEnable.SQL_ASYNC_ENABLE_ON.value
+        )
+        try:
+            while True:
+                result = call()
+                if result is not None:
+                    return result
+                try:
+                    yield
+                except GeneratorExit:
+                    self.__abandon(call)
+                    raise
+        finally:
+            self._driver_manager.sql_set_stmt_attr(
+                self, StatementAttributeType.SQL_ATTR_ASYNC_ENABLE, AsyncEnable.SQL_ASYNC_ENABLE_OFF.value
+            )
+
+    def __abandon(self, call: typing.Callable[[], typing.Any]) -> None:
+        """Cancel a call whose Pending was discarded before it completed, and poll it until it has, so that the
+        statement can be used again.
+
+        This runs when the Pending is closed or garbage collected, so it gives up after ABANDON_TIMEOUT seconds. The
+        statement is then left to the driver, and calls on it fail (with HY010) until the driver has finished.
+        """
+        deadline = time.monotonic() + ABANDON_TIMEOUT
+        delay = 0.001
+        try:
+            self.cancel()
+            while call() is None:
+                if time.monotonic() >= deadline:
+                    return
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+        except Error:
+            pass
+
+    def __execute_steps(
+        self, query_string: str, params: typing.Sequence[typing.Any], start: float
+    ) -> typing.Generator[None, None, Cursor]:
+        if params:
+            self.__bind_prepared(query_string, params)
+            yield from self.__poll(lambda: self._driver_manager.sql_execute_async(self) or None)
+            self.__post_execute_prepared()
+        else:
+            yield from self.__poll(lambda: self._driver_manager.sql_exec_direct_async(self, query_string) or None)
+            self.__post_execute()
+        self.__executed(start)
+        return self
+
+    def __fetchmany_steps(self, size: int) -> typing.Generator[None, None, list[Row]]:
+        rows = self.__take_prefetched(size)
+        if len(rows) == size or self.__replayed:
+            return rows
+
+        start = time.perf_counter()
+        taken = len(rows)
+        if self.__use_block_fetch(size - len(rows)):
+            row_set = self.__row_set
+            assert row_set is not None
+            while len(rows) < size:
+                count = yield from self.__poll(
+                    lambda: self._driver_manager.sql_fetch_scroll_async(self, row_set, self._totals)
+                )
+                rows.extend(self.__rows_from_row_set(row_set, count, self._totals))
+                if count < row_set.capacity:
+                    break
+        else:
+            while len(rows) < size:
+                if not (yield from self.__poll(lambda: self._driver_manager.sql_fetch_async(self))):
+                    break
+                rows.append(self.__read_row(self._totals))
+
+        self.__fetched(start, len(rows) - taken)
+        self.__keep_surplus(rows, size)
+        return rows
+
+    def __nextset_steps(self) -> typing.Generator[None, None, bool | None]:
+        if self.__replayed:
+            return None
+        if (yield from self.__poll(lambda: self._driver_manager.sql_more_results_async(self))):
+            self.__post_execute()
+            return True
+        return None
+
+    def nextrow(self) -> bool:
+        """Advance to the next row of the result set without reading any of its values, returning False when no more
+        data is available.
+
+        The values of the current row are then read with getvalue(), iterchunks() or copycolumn(), in ascending column
+        order, and each at most once. This allows large character and binary values to be streamed rather than read
+        into memory as a whole. Any rows already fetched ahead, by iterating over the cursor or as the rest of a block
+        fetched by fetchone() or fetchmany(), must be fetched first.
+        """
+        self.__stop_prefetcher()
+        if self.__prefetched:
+            raise ProgrammingError("The rows already fetched ahead must be fetched first.")
+        if self.__replayed:
+            return False
+        if self.__block_fetch is not False:
+            # Rows are fetched one at a time from here on, so that their columns can be read with SQLGetData.
+            self.__release_row_set()
+            self.__block_fetch = False
+        start = time.perf_counter()
+        fetched = self._driver_manager.sql_fetch(self)
+        self.__fetched(start, fetched)
+        return fetched
+
+    def getvalue(self, column: int | str) -> typing.Any:
+        """Read the whole value of a column in the row most recently fetched by nextrow()."""
+        sql_column_description = self.__get_sql_column_description(column)
+        buffer = self.__data_buffers()[sql_column_description.column_number - 1]
+        return self._driver_manager.sql_get_data(self, sql_column_description, buffer, self._totals)
+
+    def iterchunks(
+        self, column: int | str, chunk_size: int = GET_DATA_BUFFER_SIZE
+    ) -> typing.Iterator[str | bytes] | None:
+        """Read a character or binary column in the row most recently fetched by nextrow() in chunks of at most
+        `chunk_size` bytes, or return None if its value is null.
+
+        The chunks are str for character columns and bytes for binary columns. They must be consumed before the next
+        column or row is read.
+        """
+        sql_column_description = self.__get_sql_column_description(column)
+        return self._driver_manager.sql_get_data_stream(self, sql_column_description, chunk_size, self._totals)
+
+    def copycolumn(
+        self,
+        column: int | str,
+        file: SupportsWrite[typing.Any],
+        chunk_size: int = GET_DATA_BUFFER_SIZE,
+    ) -> int | None:
+        """Write a character or binary column in the row most recently fetched by nextrow() to a file chunk by chunk,
+        returning the length of the value written (in characters or bytes), or None if its value is null.
+
+        The file must accept str for character columns and bytes for binary columns; use socket.makefile() to write to
+        a socket.
+        """
+        chunks = self.iterchunks(column, chunk_size)
+        if chunks is None:
+            return None
+        length = 0
+        for chunk in chunks:
+            file.write(chunk)
+            length += len(chunk)
+        return length
+
+    def __get_sql_column_description(self, column: int | str) -> SqlColumnDescription:
+        """Return the description of a column, given its 0-based index or its name."""
+        sql_column_descriptions = self.__describe()
+        if isinstance(column, int):
+            if not 0 <= column < len(sql_column_descriptions):
+                raise ProgrammingError(f"Column index {column} is out of range.")
+            return sql_column_descriptions[column]
+        for sql_column_description in sql_column_descriptions:
+            if sql_column_description.name == column:
+                return sql_column_description
+        raise ProgrammingError(f"There is no column named {column!r}.")
+
+    def cancel(self) -> None:
+        """Cancel the statement which the cursor is executing, from another thread.
+
+        The execute (or fetch) being cancelled raises an OperationalError.
+        """
+        self._driver_manager.sql_cancel(self)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        if not self.connection._closed:
+            self.__pre_execute()
+        self._sync_totals()
+        self.__finalizer()
+        super().close()
+
     def nextset(self) -> bool | None:
+        self.__release_row_set()
+        if self.__replayed:
+            return None
+        start = time.perf_counter()
         if self._driver_manager.sql_more_results(self):
             self.__post_execute()
+            self.__executed(start)
             return True
         return None
 
@@ -108,9 +916,11 @@ class Cursor(Handler):
         schema: str | None = None,
         table_type: str | None = None,
     ) -> Cursor:
-        self._driver_manager.sql_tables(self, catalog, schema, table, table_type)
-        self.__post_execute(lowercase=True)
-        return self
+        return self.__catalog(
+            "SQLTables",
+            ("tables", table, catalog, schema, table_type),
+            lambda: self._driver_manager.sql_tables(self, catalog, schema, table, table_type),
+        )
 
     def procedures(
         self,
@@ -118,9 +928,11 @@ class Cursor(Handler):
         catalog: str | None = None,
         schema: str | None = None,
     ) -> Cursor:
-        self._driver_manager.sql_procedures(self, procedure, catalog, schema)
-        self.__post_execute(lowercase=True)
-        return self
+        return self.__catalog(
+            "SQLProcedures",
+            ("procedures", procedure, catalog, schema),
+            lambda: self._driver_manager.sql_procedures(self, procedure, catalog, schema),
+        )
 
     def foreignKeys(
         self,
@@ -131,6 +943,47 @@ class Cursor(Handler):
         foreignCatalog: str | None = None,
         foreignSchema: str | None = None,
     ) -> Cursor:
-        self._driver_manager.sql_foreign_keys(self, table, catalog, schema, foreignTable, foreignCatalog, foreignSchema)
-        self.__post_execute(lowercase=True)
+        return self.__catalog(
+            "SQLForeignKeys",
+            ("foreignKeys", table, catalog, schema, foreignTable, foreignCatalog, foreignSchema),
+            lambda: self._driver_manager.sql_foreign_keys(
+                self, table, catalog, schema, foreignTable, foreignCatalog, foreignSchema
+            ),
+        )
+
+    def __catalog(self, function: str, key: Hashable, call: typing.Callable[[], None]) -> Cursor:
+        """Call a catalog function, or replay its result set from the connection's catalog cache if it is enabled.
+
+        When the cache is enabled, the result set is fetched in full and cached before it is replayed. The statistics
+        of the call are collected under the name of the function.
+        """
+        self.__pre_execute()
+        start = self.__begin(function)
+        cache = self.connection._catalog_cache
+        result = cache.get(key) if cache.maxsize > 0 else None
+        if result is None:
+            self.connection._in_transaction = True
+            call()
+            self.__post_execute(lowercase=True)
+            self.__executed(start)
+            if cache.maxsize <= 0:
+                return self
+            sql_column_descriptions = self.__describe()
+            rows: list[Row] = []
+            size = max(self.arraysize, self.iteration_size)
+            while True:
+                block = self.__fetch_rows(size)
+                rows.extend(block)
+                if len(block) < size:
+                    break
+            rowcount = self.rowcount
+            self.__pre_execute()
+            result = cache.put(key, sql_column_descriptions, tuple(rows), rowcount)
+        else:
+            self.__executed(start)
+
+        self.__set_description(result.sql_column_descriptions)
+        self.__rowcount = result.rowcount
+        self.__prefetched.extend(result.rows)
+        self.__replayed = True
         return self
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import codecs
 import ctypes
 import datetime
+import decimal
+import functools
+import os
+import struct
 import sys
 import typing
+import uuid
+import warnings
 from _ctypes import Array
 from ctypes import (
     CDLL,
@@ -26,44 +33,81 @@ from typing import TYPE_CHECKING
 
 import purepyodbc
 
-from . import _constants
-from ._dto import SqlColumnDescription
+from . import _constants, _prototypes, _tracing
+from ._buffers import (
+    BoundColumn,
+    BoundParameter,
+    GetDataBuffer,
+    ParameterArray,
+    ParameterSetBuffer,
+    RowSetBuffer,
+)
+from ._dto import ParameterDescription, SqlColumnDescription
 
 if TYPE_CHECKING:
     from ._connection import Connection
     from ._cursor import Cursor
     from ._environment import Environment
     from ._handler import Handler
+    from ._prepared_statement import PreparedStatement
+    from ._statistics import ExecutionStatistics
 from ._enums import (
+    CDataType,
     CompletionType,
     ConnectionAttributeType,
     DriverCompletion,
     EnvironmentAttributeType,
+    FreeStatementOption,
+    FunctionId,
     HandleType,
     InfoType,
+    InputOutputType,
     LengthOrIndicatorType,
     OdbcVersion,
     ReturnCode,
     SqlDataType,
     SqlFetchType,
+    StatementAttributeType,
 )
 from ._errors import (
     DataError,
     Error,
-    IntegrityError,
     InterfaceError,
     NotSupportedError,
     OperationalError,
     ProgrammingError,
+    error_for_sqlstate,
 )
-from ._typedef import SQLLEN, SQLSMALLINT, SQLULEN
+from ._typedef import SQLLEN, SQLSMALLINT, SQLUINTEGER, SQLULEN, SQLUSMALLINT
 
 DEFAULT_ODBC_ENCODING = "utf-16-le" if sys.byteorder == "little" else "utf-16-be"
 
+# Character columns wider than this (or of unknown width) are read with SQLGetData instead of being bound.
+MAX_BOUND_COLUMN_SIZE = 4000
+# The largest buffer allocated for reading a column with SQLGetData. Longer values are read in chunks of this size.
+GET_DATA_BUFFER_SIZE = 65536
+# Row sets bound for fetching rows in blocks are kept below this many bytes of arrays, so that fewer rows are fetched at
+# a time from wider result sets.
+ROW_SET_BUFFER_SIZE = 1024 * 1024
+# String (in characters) and binary parameters longer than this are bound as SQL_WLONGVARCHAR and SQL_LONGVARBINARY.
+MAX_STRING_PARAMETER_SIZE = 4000
+MAX_BINARY_PARAMETER_SIZE = 8000
+# Batches of parameter sets passed to executemany are kept below this many bytes of parameter arrays.
+MAX_PARAMETER_SET_BUFFER_SIZE = 16 * 1024 * 1024
+
+# Environment variables which override the detection of the driver manager's library and of its SQLWCHAR size (in
+# bytes), which otherwise involves searching the library directories and running odbc_config.
+DRIVER_MANAGER_PATH_VARIABLE = "PUREPYODBC_DRIVER_MANAGER"
+SQLWCHAR_SIZE_VARIABLE = "PUREPYODBC_SQLWCHAR_SIZE"
+
 
 def detect_driver_manager() -> DriverManager:
     import platform
 
+    library_path = os.environ.get(DRIVER_MANAGER_PATH_VARIABLE)
+    if library_path:
+        return DriverManager(cdll=cdll.LoadLibrary(library_path))
+
     if platform.system() == "Windows":
         odbc32 = ctypes.windll.odbc32  # type: ignore[attr-defined]
         return DriverManager(cdll=odbc32)
@@ -83,119 +127,118 @@ def detect_driver_manager() -> DriverManager:
         raise FileNotFoundError("No supported driver manager detected!")
 
 
+@functools.cache
+def detect_sqlwchar_size() -> int:
+    """Return the size of the driver manager's SQLWCHAR in bytes.
+
+    The result is cached, as it can only change if the driver manager is rebuilt.
+    """
+    size = os.environ.get(SQLWCHAR_SIZE_VARIABLE)
+    if size:
+        if size not in ("2", "4"):
+            raise InterfaceError(f"{SQLWCHAR_SIZE_VARIABLE} must be 2 or 4, not {size!r}.")
+        return int(size)
+
+    # unixODBC defaults to 2-bytes SQLWCHAR, unless "-DSQL_WCHART_CONVERT" was
+    # added to CFLAGS, in which case it will be the size of wchar_t.
+    # Note that using 4-bytes SQLWCHAR will break most ODBC drivers, as driver
+    # development mostly targets the Windows platform.
+    if sys.platform == "win32":
+        return sizeof(c_ushort)
+
+    import shutil
+
+    odbc_config = shutil.which("odbc_config")
+    if odbc_config is None:
+        _warn_sqlwchar_size_guessed("odbc_config was not found")
+        return sizeof(c_ushort)
+
+    import subprocess  # nosec
+
+    result = subprocess.run([odbc_config, "--cflags"], capture_output=True, text=True)  # nosec
+    if result.returncode != 0:
+        _warn_sqlwchar_size_guessed(f"odbc_config --cflags failed with exit status {result.returncode}")
+        return sizeof(c_ushort)
+    if "SQL_WCHART_CONVERT" in result.stdout.upper():
+        return sizeof(c_wchar)
+    return sizeof(c_ushort)
+
+
+def _warn_sqlwchar_size_guessed(reason: str) -> None:
+    warnings.warn(
+        f"Assuming a 2 byte SQLWCHAR, as {reason}. Set {SQLWCHAR_SIZE_VARIABLE} to 2 or 4 if character data is "
+        f"garbled, or to silence this warning.",
+        RuntimeWarning,
+        stacklevel=3,
+    )
+
+
 @dataclass
 class DriverManager:
     cdll: CDLL
     _sqlwchar_size: int = field(init=False, default=2)
     _odbc_encoding: str = field(init=False, default=DEFAULT_ODBC_ENCODING)
+    _tracer: _tracing.Tracer | None = field(init=False, default=None)
 
     def __post_init__(self) -> None:
-        # Needed for 64-bit Windows, otherwise you get ValueErrors on non-zero ReturnCodes
-        for func_name in (
-            "SQLAllocHandle",
-            "SQLBindParameter",
-            "SQLBindCol",
-            "SQLBrowseConnect",
-            "SQLBrowseConnectW",
-            "SQLCloseCursor",
-            "SQLColAttribute",
-            "SQLColAttributeW",
-            "SQLColAttributes",
-            "SQLColAttributesW",
-            "SQLColumns",
-            "SQLColumnsW",
-            "SQLConnect",
-            "SQLConnectW",
-            "SQLDataSources",
-            "SQLDataSourcesW",
-            "SQLDescribeCol",
-            "SQLDescribeColW",
-            "SQLDescribeParam",
-            "SQLDisconnect",
-            "SQLDriverConnect",
-            "SQLDriverConnectW",
-            "SQLDrivers",
-            "SQLDriversW",
-            "SQLEndTran",
-            "SQLExecDirect",
-            "SQLExecDirectW",
-            "SQLExecute",
-            "SQLFetch",
-            "SQLFetchScroll",
-            "SQLForeignKeys",
-            "SQLForeignKeysW",
-            "SQLFreeHandle",
-            "SQLFreeStmt",
-            "SQLGetConnectAttr",
-            "SQLGetConnectAttrW",
-            "SQLGetConnectOption",
-            "SQLGetConnectOptionW",
-            "SQLGetCursorName",
-            "SQLGetCursorNameW",
-            "SQLGetData",
-            "SQLGetDescField",
-            "SQLGetDescFieldW",
-            "SQLGetDescRec",
-            "SQLGetDescRecW",
-            "SQLGetDiagField",
-            "SQLGetDiagFieldW",
-            "SQLGetDiagRec",
-            "SQLGetDiagRecW",
-            "SQLGetInfo",
-            "SQLGetInfoW",
-            "SQLGetTypeInfo",
-            "SQLGetTypeInfoW",
-            "SQLMoreResults",
-            "SQLNativeSql",
-            "SQLNativeSqlW",
-            "SQLNumParams",
-            "SQLNumResultCols",
-            "SQLPrepare",
-            "SQLPrepareW",
-            "SQLPrimaryKeys",
-            "SQLPrimaryKeysW",
-            "SQLProcedureColumns",
-            "SQLProcedureColumnsW",
-            "SQLProcedures",
-            "SQLProceduresW",
-            "SQLRowCount",
-            "SQLSetConnectAttr",
-            "SQLSetConnectAttrW",
-            "SQLSetConnectOption",
-            "SQLSetConnectOptionW",
-            "SQLSetCursorName",
-            "SQLSetCursorNameW",
-            "SQLSetDescField",
-            "SQLSetDescFieldW",
-            "SQLSetEnvAttr",
-            "SQLSetStmtAttr",
-            "SQLSetStmtAttrW",
-            "SQLSpecialColumns",
-            "SQLSpecialColumnsW",
-            "SQLStatistics",
-            "SQLStatisticsW",
-            "SQLTablePrivileges",
-            "SQLTablePrivilegesW",
-            "SQLTables",
-            "SQLTablesW",
-        ):
+        # Without prototypes, ctypes passes integer arguments as C ints (truncating SQLLEN and SQLULEN values, and
+        # pointers passed as integers, on 64-bit platforms) and expects an int rather than a SQLRETURN to be returned.
+        for func_name, argtypes in _prototypes.ARGTYPES.items():
             func = getattr(self.cdll, func_name)
-            func.restype = c_short
-
-        # unixODBC defaults to 2-bytes SQLWCHAR, unless "-DSQL_WCHART_CONVERT" was
-        # added to CFLAGS, in which case it will be the size of wchar_t.
-        # Note that using 4-bytes SQLWCHAR will break most ODBC drivers, as driver
-        # development mostly targets the Windows platform.
-        from subprocess import getstatusoutput  # nosec
-
-        status, output = getstatusoutput("odbc_config --cflags")
-        sqlwchar_type: type[c_wchar] | type[c_ushort]
-        if status == 0 and "SQL_WCHART_CONVERT" in output.upper():
-            sqlwchar_type = c_wchar
-        else:
-            # TODO: We don't know for sure - should we generate a warning?
-            sqlwchar_type = c_ushort
-        self._sqlwchar_size = sizeof(sqlwchar_type)
+            func.restype = _prototypes.RESTYPE
+            func.argtypes = argtypes
+
+        # While tracing is enabled, cdll is replaced with a stand-in which wraps the library's functions.
+        self._library = self.cdll
+        self._resolve_functions()
+
+        self._sqlwchar_size = detect_sqlwchar_size()
+
+    def _resolve_functions(self) -> None:
+        # The functions called for every execute and fetch are resolved once, rather than looked up on the library for
+        # every call.
+        self._SQLBindCol = self.cdll.SQLBindCol
+        self._SQLBindParameter = self.cdll.SQLBindParameter
+        self._SQLDescribeColW = self.cdll.SQLDescribeColW
+        self._SQLExecDirectW = self.cdll.SQLExecDirectW
+        self._SQLExecute = self.cdll.SQLExecute
+        self._SQLFetch = self.cdll.SQLFetch
+        self._SQLFetchScroll = self.cdll.SQLFetchScroll
+        self._SQLFreeStmt = self.cdll.SQLFreeStmt
+        self._SQLGetData = self.cdll.SQLGetData
+        self._SQLMoreResults = self.cdll.SQLMoreResults
+        self._SQLNumResultCols = self.cdll.SQLNumResultCols
+        self._SQLRowCount = self.cdll.SQLRowCount
+        self._SQLSetStmtAttrW = self.cdll.SQLSetStmtAttrW
+
+    def enable_tracing(self, hooks: typing.Sequence[_tracing.TraceHook]) -> None:
+        """Time every ODBC call from here on, and call `hooks` around each call, replacing any hooks given before.
+
+        Calls are made directly again after disable_tracing(), so that tracing costs nothing while it is disabled. The
+        calls made on each handle, which the execution statistics report, are only counted while it is enabled.
+        """
+        if self._tracer is None:
+            self._tracer = _tracing.Tracer()
+        self._tracer.hooks = tuple(hooks)
+        if self.cdll is self._library:
+            self.cdll = typing.cast(CDLL, _tracing.TracedLibrary(self._library, self._tracer))
+            self._resolve_functions()
+            self.check_success = self._check_success_counted  # type: ignore[method-assign]
+
+    def disable_tracing(self) -> None:
+        """Stop tracing ODBC calls, keeping the statistics collected so far."""
+        if self.cdll is not self._library:
+            self.cdll = self._library
+            self._resolve_functions()
+            del self.check_success
+
+    def call_statistics(self) -> list[_tracing.CallStatistics]:
+        """Return a snapshot of the ODBC calls made while tracing was enabled, in order of function name."""
+        return [] if self._tracer is None else self._tracer.statistics()
+
+    def reset_call_statistics(self) -> None:
+        if self._tracer is not None:
+            self._tracer.reset()
 
     @property
     def _odbc_bytes_per_char(self) -> int:
@@ -220,6 +263,13 @@ class DriverManager:
             return c_char_p(self._odbc_encode(s))
         return c_wchar_p(s)
 
+    @property
+    def _sqlwchar_encoding(self) -> str:
+        """Return the encoding of SQLWCHAR data written into raw buffers by the Driver Manager."""
+        if self._sqlwchar_size == 2:
+            return self._odbc_encoding
+        return "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
     def _odbc_encode(self, s: str) -> bytes:
         return s.encode(self._odbc_encoding)
 
@@ -228,9 +278,14 @@ class DriverManager:
             return create_string_buffer(init, size)
         return create_unicode_buffer(init, size)
 
-    def _from_buffer(self, buffer: Array[c_char] | Array[c_wchar]) -> str:
+    def _from_buffer(self, buffer: Array[c_char] | Array[c_wchar], length: int | None = None) -> str:
+        """Decode a string from a buffer, either up to the given length in characters or to its null terminator."""
         if self._sqlwchar_size == 2:
+            if length is not None:
+                return str(memoryview(buffer).cast("B")[: length * 2], self._odbc_encoding)
             return buffer.raw.decode(self._odbc_encoding).rstrip("\x00")
+        if length is not None:
+            return typing.cast(str, buffer[:length])
         # The ignore is needed because ctypes stubs cannot correctly annotate the `value`.
         # https://github.com/python/typeshed/blob/e92f98ccdaa6e06eb1260e9818590adc0dc8f223/stdlib/_ctypes.pyi#L179-L191
         return buffer.value  # type: ignore[no-any-return]
@@ -244,9 +299,21 @@ class DriverManager:
         self.check_success(return_code, environment)
 
     def set_environment_odbc_version(self, environment: Environment, odbc_version: OdbcVersion) -> None:
-        attribute = EnvironmentAttributeType.SQL_ATTR_ODBC_VERSION
-        return_code = self.cdll.SQLSetEnvAttr(environment.handle, attribute.value, odbc_version.value)
-        self.check_success(return_code, environment)
+        self.sql_set_env_attr(environment, EnvironmentAttributeType.SQL_ATTR_ODBC_VERSION, odbc_version.value)
+
+    def sql_set_env_attr(self, environment: Environment | None, attr: EnvironmentAttributeType, value: int) -> None:
+        """Set an integer valued environment attribute.
+
+        Process-wide attributes (SQL_ATTR_CONNECTION_POOLING) are set with no environment, before any environment is
+        allocated.
+        """
+        handle = None if environment is None else environment.handle
+        return_code = self.cdll.SQLSetEnvAttr(handle, attr.value, value, 0)
+        if environment is not None:
+            self.check_success(return_code, environment)
+        elif return_code not in (_constants.SQL_SUCCESS, _constants.SQL_SUCCESS_WITH_INFO):
+            # There is no handle to read diagnostics from.
+            raise InterfaceError(f"Unable to set {attr.name}.")
 
     def allocate_connection(self, environment: Environment, connection: Connection) -> None:
         return_code = self.cdll.SQLAllocHandle(
@@ -256,13 +323,13 @@ class DriverManager:
         )
         self.check_success(return_code, connection)
 
-    def allocate_statement(self, cursor: Cursor) -> None:
+    def allocate_statement(self, statement: Cursor | PreparedStatement) -> None:
         return_code = self.cdll.SQLAllocHandle(
             HandleType.SQL_HANDLE_STMT.value,
-            cursor.connection.handle,
-            byref(cursor.handle),
+            statement.connection.handle,
+            byref(statement.handle),
         )
-        self.check_success(return_code, cursor)
+        self.check_success(return_code, statement)
 
     def sql_end_tran(self, handler: Handler, completion_type: CompletionType) -> None:
         """Request a commit or rollback operation for all active operations on all statements associated with a
@@ -314,26 +381,364 @@ class DriverManager:
     def sql_exec_direct(self, cursor: Cursor, query_string: str) -> None:
         c_query_string = self._to_wchar_pointer(query_string)
         length = self._count_odbc_encoded_bytes(query_string)
-        return_code = self.cdll.SQLExecDirectW(cursor.handle, c_query_string, length)
+        return_code = self._SQLExecDirectW(cursor.handle, c_query_string, length)
+        self.check_success(return_code, cursor)
+
+    def sql_exec_direct_async(self, cursor: Cursor, query_string: str) -> bool:
+        """Execute a statement with asynchronous execution enabled, returning whether it has completed.
+
+        Until it has, it is polled by calling this again with the same arguments.
+        """
+        c_query_string = self._to_wchar_pointer(query_string)
+        length = self._count_odbc_encoded_bytes(query_string)
+        return self._check_async(self._SQLExecDirectW(cursor.handle, c_query_string, length), cursor)
+
+    def sql_prepare(self, statement: PreparedStatement) -> None:
+        c_query_string = self._to_wchar_pointer(statement.sql)
+        length = self._count_odbc_encoded_bytes(statement.sql)
+        return_code = self.cdll.SQLPrepareW(statement.handle, c_query_string, length)
+        self.check_success(return_code, statement)
+
+    def sql_num_params(self, statement: PreparedStatement) -> int:
+        num_params = SQLSMALLINT(-1)
+        self.check_success(self.cdll.SQLNumParams(statement.handle, byref(num_params)), statement)
+        return num_params.value
+
+    def sql_execute(self, cursor: Cursor) -> None:
+        return_code = self._SQLExecute(cursor.handle)
         self.check_success(return_code, cursor)
 
+    def sql_execute_async(self, cursor: Cursor) -> bool:
+        """Execute a prepared statement with asynchronous execution enabled, returning whether it has completed.
+
+        Until it has, it is polled by calling this again.
+        """
+        return self._check_async(self._SQLExecute(cursor.handle), cursor)
+
+    def sql_get_functions(self, connection: Connection, function_id: FunctionId) -> bool:
+        """Return whether the driver supports an ODBC function."""
+        supported = c_ushort()
+        return_code = self.cdll.SQLGetFunctions(connection.handle, function_id.value, byref(supported))
+        self.check_success(return_code, connection)
+        return bool(supported.value)
+
+    def sql_describe_param(self, statement: PreparedStatement, parameter_number: int) -> ParameterDescription | None:
+        """Describe a parameter of a prepared statement, or return None if the driver cannot describe it."""
+        data_type = SQLSMALLINT()
+        parameter_size = SQLULEN()
+        decimal_digits = SQLSMALLINT()
+        nullable = SQLSMALLINT()
+
+        return_code = self.cdll.SQLDescribeParam(
+            statement.handle,
+            parameter_number,
+            byref(data_type),
+            byref(parameter_size),
+            byref(decimal_digits),
+            byref(nullable),
+        )
+
+        # Some drivers only describe parameters in some statements (if at all), in which case the parameter is bound
+        # without a description.
+        if return_code not in (_constants.SQL_SUCCESS, _constants.SQL_SUCCESS_WITH_INFO):
+            return None
+        return ParameterDescription(data_type.value, parameter_size.value, decimal_digits.value)
+
+    def bind_parameters(
+        self, cursor: Cursor, statement: PreparedStatement, parameters: typing.Sequence[typing.Any]
+    ) -> tuple[BoundParameter, ...]:
+        """Bind the values of the parameters of a prepared statement, and return the buffers which hold them."""
+        bound_parameters = []
+        for parameter_number, value in enumerate(parameters, 1):
+            if value is None:
+                parameter = self._null_parameter(statement.describe_parameter(parameter_number))
+            else:
+                parameter = self._make_parameter(parameter_number, value)
+
+            return_code = self._SQLBindParameter(
+                cursor.handle,
+                parameter_number,
+                InputOutputType.SQL_PARAM_INPUT.value,
+                parameter.c_type.value,
+                parameter.sql_type,
+                parameter.column_size,
+                parameter.decimal_digits,
+                parameter.data,
+                len(parameter.data or b""),
+                byref(parameter.length_or_indicator),
+            )
+            self.check_success(return_code, cursor)
+            bound_parameters.append(parameter)
+
+        return tuple(bound_parameters)
+
+    def _null_parameter(self, description: ParameterDescription | None) -> BoundParameter:
+        # Binding a null as the parameter's own type avoids implicit conversions, which some types don't allow (e.g.
+        # varchar to varbinary in SQL Server).
+        if description is None:
+            description = ParameterDescription(SqlDataType.SQL_VARCHAR.value, 1, 0)
+        return BoundParameter(
+            CDataType.SQL_C_DEFAULT,
+            description.data_type,
+            max(description.size, 1),
+            description.decimal_digits,
+            None,
+            SQLLEN(LengthOrIndicatorType.SQL_NULL_DATA.value),
+        )
+
+    def _make_parameter(self, parameter_number: int, value: typing.Any) -> BoundParameter:
+        """Convert a Python value to the C type which it is bound as."""
+        c_type: CDataType
+        sql_type: SqlDataType
+        column_size = 0
+        decimal_digits = 0
+
+        # bool and datetime.datetime must be checked before the types they are subclasses of.
+        if isinstance(value, str):
+            data = value.encode(self._sqlwchar_encoding)
+            c_type = CDataType.SQL_C_WCHAR
+            column_size = max(len(data) // self._sqlwchar_size, 1)
+            if column_size > MAX_STRING_PARAMETER_SIZE:
+                sql_type = SqlDataType.SQL_WLONGVARCHAR
+            else:
+                sql_type = SqlDataType.SQL_WVARCHAR
+        elif isinstance(value, bool):
+            data = struct.pack("=B", value)
+            c_type, sql_type = CDataType.SQL_C_BIT, SqlDataType.SQL_BIT
+        elif isinstance(value, int):
+            if -(2**63) <= value < 2**63:
+                data = struct.pack("=q", value)
+                c_type, sql_type = CDataType.SQL_C_SBIGINT, SqlDataType.SQL_BIGINT
+            else:
+                data = str(value).encode("ascii")
+                c_type, sql_type = CDataType.SQL_C_CHAR, SqlDataType.SQL_NUMERIC
+                column_size = len(str(abs(value)))
+        elif isinstance(value, float):
+            data = struct.pack("=d", value)
+            c_type, sql_type = CDataType.SQL_C_DOUBLE, SqlDataType.SQL_DOUBLE
+            column_size = 15
+        elif isinstance(value, decimal.Decimal):
+            if not value.is_finite():
+                raise DataError(f"Cannot bind {value} as parameter {parameter_number}.")
+            _, digits, exponent = value.as_tuple()
+            assert isinstance(exponent, int)
+            data = format(value, "f").encode("ascii")
+            c_type, sql_type = CDataType.SQL_C_CHAR, SqlDataType.SQL_NUMERIC
+            decimal_digits = max(-exponent, 0)
+            column_size = max(len(digits) + max(exponent, 0), decimal_digits, 1)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            data = bytes(value)
+            c_type = CDataType.SQL_C_BINARY
+            column_size = max(len(data), 1)
+            if column_size > MAX_BINARY_PARAMETER_SIZE:
+                sql_type = SqlDataType.SQL_LONGVARBINARY
+            else:
+                sql_type = SqlDataType.SQL_VARBINARY
+        elif isinstance(value, datetime.datetime):
+            data = struct.pack(
+                "=hHHHHHI",
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+                # The fraction of a SQL_TIMESTAMP_STRUCT is in nanoseconds.
+                value.microsecond * 1000,
+            )
+            c_type, sql_type = CDataType.SQL_C_TYPE_TIMESTAMP, SqlDataType.SQL_TYPE_TIMESTAMP
+            column_size, decimal_digits = 26, 6
+        elif isinstance(value, datetime.date):
+            data = struct.pack("=hHH", value.year, value.month, value.day)
+            c_type, sql_type = CDataType.SQL_C_TYPE_DATE, SqlDataType.SQL_TYPE_DATE
+            column_size = 10
+        elif isinstance(value, datetime.time):
+            # A SQL_TIME_STRUCT has no fraction of a second, so times are passed as text.
+            data = value.strftime("%H:%M:%S.%f").encode("ascii")
+            c_type, sql_type = CDataType.SQL_C_CHAR, SqlDataType.SQL_TYPE_TIME
+            column_size, decimal_digits = 15, 6
+        elif isinstance(value, uuid.UUID):
+            # The first three fields of a SQLGUID are native-endian integers.
+            data = value.bytes_le if sys.byteorder == "little" else value.bytes
+            c_type, sql_type = CDataType.SQL_C_GUID, SqlDataType.SQL_GUID
+            column_size = 16
+        else:
+            raise ProgrammingError(
+                f"Invalid parameter type. param-index={parameter_number - 1} param-type={type(value).__name__}"
+            )
+
+        return BoundParameter(c_type, sql_type.value, column_size, decimal_digits, data, SQLLEN(len(data)))
+
+    def parameter_batches(
+        self,
+        statement: PreparedStatement,
+        seq_of_parameters: typing.Iterable[typing.Sequence[typing.Any]],
+        batch_size: int,
+    ) -> typing.Iterator[list[list[BoundParameter | None]]]:
+        """Convert sets of parameter values to C types, grouped into batches of up to `batch_size` sets which can each
+        be bound as arrays.
+
+        A batch ends early where the C type of a parameter changes (e.g. from int to Decimal), or where its arrays would
+        grow beyond MAX_PARAMETER_SET_BUFFER_SIZE. Null values are None.
+        """
+        parameter_count = statement.parameter_count
+        batch: list[list[BoundParameter | None]] = []
+        c_types: list[CDataType | None] = [None] * parameter_count
+        element_sizes = [0] * parameter_count
+
+        for parameters in seq_of_parameters:
+            if len(parameters) != parameter_count:
+                raise ProgrammingError(
+                    f"The SQL contains {parameter_count} parameter markers, but {len(parameters)} parameters were "
+                    f"supplied"
+                )
+            parameter_set = [
+                None if value is None else self._make_parameter(parameter_number, value)
+                for parameter_number, value in enumerate(parameters, 1)
+            ]
+
+            if batch:
+                fits = len(batch) < batch_size and all(
+                    parameter is None or c_type is None or parameter.c_type is c_type
+                    for parameter, c_type in zip(parameter_set, c_types)
+                )
+                new_element_sizes = [
+                    size if parameter is None else max(size, len(parameter.data or b""))
+                    for parameter, size in zip(parameter_set, element_sizes)
+                ]
+                if not fits or (len(batch) + 1) * sum(new_element_sizes) > MAX_PARAMETER_SET_BUFFER_SIZE:
+                    yield batch
+                    batch = []
+                    c_types = [None] * parameter_count
+                    element_sizes = [0] * parameter_count
+
+            batch.append(parameter_set)
+            for i, parameter in enumerate(parameter_set):
+                if parameter is not None:
+                    c_types[i] = parameter.c_type
+                    element_sizes[i] = max(element_sizes[i], len(parameter.data or b""))
+
+        if batch:
+            yield batch
+
+    def set_paramset_size(self, cursor: Cursor, size: int) -> int:
+        """Set the number of parameter sets executed at once, returning the number which the driver accepted.
+
+        Drivers which don't support arrays of parameters either reject the attribute or change its value to 1.
+        """
+        attr = StatementAttributeType.SQL_ATTR_PARAMSET_SIZE
+        return_code = self._SQLSetStmtAttrW(cursor.handle, attr.value, size, 0)
+        if return_code == _constants.SQL_SUCCESS:
+            return size
+        if return_code == _constants.SQL_SUCCESS_WITH_INFO:
+            return max(self.sql_get_stmt_attr(cursor, attr), 1)
+        return 1
+
+    def bind_parameter_sets(
+        self,
+        cursor: Cursor,
+        statement: PreparedStatement,
+        batch: typing.Sequence[typing.Sequence[BoundParameter | None]],
+    ) -> ParameterSetBuffer:
+        """Bind a batch of parameter sets as column-wise arrays, so that they are all executed by the next
+        SQLExecute."""
+        parameter_set_buffer = ParameterSetBuffer(
+            tuple(
+                self._make_parameter_array(statement, i + 1, [parameter_set[i] for parameter_set in batch])
+                for i in range(statement.parameter_count)
+            ),
+            len(batch),
+        )
+
+        self.sql_set_stmt_attr(cursor, StatementAttributeType.SQL_ATTR_PARAMSET_SIZE, parameter_set_buffer.size)
+        self.sql_set_stmt_attr(
+            cursor,
+            StatementAttributeType.SQL_ATTR_PARAM_STATUS_PTR,
+            ctypes.addressof(parameter_set_buffer.statuses),
+        )
+        self.sql_set_stmt_attr(
+            cursor,
+            StatementAttributeType.SQL_ATTR_PARAMS_PROCESSED_PTR,
+            ctypes.addressof(parameter_set_buffer.params_processed),
+        )
+
+        for parameter_number, parameter in enumerate(parameter_set_buffer.parameters, 1):
+            return_code = self._SQLBindParameter(
+                cursor.handle,
+                parameter_number,
+                InputOutputType.SQL_PARAM_INPUT.value,
+                parameter.c_type.value,
+                parameter.sql_type,
+                parameter.column_size,
+                parameter.decimal_digits,
+                parameter.data,
+                parameter.element_size,
+                parameter.indicators,
+            )
+            self.check_success(return_code, cursor)
+
+        return parameter_set_buffer
+
+    def unbind_parameter_sets(self, cursor: Cursor) -> None:
+        """Release the bound parameter arrays, so that the statement executes single parameter sets again."""
+        self.sql_free_stmt(cursor, FreeStatementOption.SQL_RESET_PARAMS)
+        self.sql_set_stmt_attr(cursor, StatementAttributeType.SQL_ATTR_PARAM_STATUS_PTR, 0)
+        self.sql_set_stmt_attr(cursor, StatementAttributeType.SQL_ATTR_PARAMS_PROCESSED_PTR, 0)
+        self.sql_set_stmt_attr(cursor, StatementAttributeType.SQL_ATTR_PARAMSET_SIZE, 1)
+
+    def _make_parameter_array(
+        self, statement: PreparedStatement, parameter_number: int, parameters: typing.Sequence[BoundParameter | None]
+    ) -> ParameterArray:
+        indicators = (SQLLEN * len(parameters))(
+            *(
+                LengthOrIndicatorType.SQL_NULL_DATA.value if parameter is None else len(parameter.data or b"")
+                for parameter in parameters
+            )
+        )
+
+        values = [parameter for parameter in parameters if parameter is not None]
+        if not values:
+            null = self._null_parameter(statement.describe_parameter(parameter_number))
+            return ParameterArray(
+                null.c_type, null.sql_type, null.column_size, null.decimal_digits, 0, None, indicators
+            )
+
+        # The values share a C type, but may differ in length (and so in SQL type) and scale.
+        sql_type = values[0].sql_type
+        for value in values:
+            if SqlDataType(value.sql_type) in LONG_DATA_TYPES:
+                sql_type = value.sql_type
+        decimal_digits = max(value.decimal_digits for value in values)
+        column_size = max(value.column_size - value.decimal_digits for value in values) + decimal_digits
+        element_size = max(max(len(value.data or b"") for value in values), 1)
+
+        data = create_string_buffer(
+            b"".join(
+                bytes(element_size) if parameter is None else (parameter.data or b"").ljust(element_size, b"\0")
+                for parameter in parameters
+            ),
+            element_size * len(parameters),
+        )
+        return ParameterArray(values[0].c_type, sql_type, column_size, decimal_digits, element_size, data, indicators)
+
     def sql_row_count(self, cursor: Cursor) -> int:
         rowcount: SQLLEN = SQLLEN(-1)
-        return_code = self.cdll.SQLRowCount(cursor.handle, byref(rowcount))
+        return_code = self._SQLRowCount(cursor.handle, byref(rowcount))
         self.check_success(return_code, cursor)
         return rowcount.value
 
     def sql_num_result_cols(self, cursor: Cursor) -> int:
         num_cols = SQLSMALLINT(-1)
-        self.check_success(self.cdll.SQLNumResultCols(cursor.handle, byref(num_cols)), cursor)
+        self.check_success(self._SQLNumResultCols(cursor.handle, byref(num_cols)), cursor)
         return num_cols.value
 
-    def sql_describe_col(
+    def sql_describe_cols(
         self,
         cursor: Cursor,
-        column_number: int,
+        column_count: int,
         lowercase: bool | None = None,
-    ) -> SqlColumnDescription:
+    ) -> tuple[SqlColumnDescription, ...]:
+        """Describe the columns of a result set with SQLDescribeCol, reusing the same buffers for all of them."""
         buffer_length = 1024
         column_name = self._to_buffer(buffer_length)
         name_length = SQLSMALLINT()
@@ -341,116 +746,481 @@ class DriverManager:
         column_size = SQLULEN()
         decimal_digits = SQLSMALLINT()
         nullable = SQLSMALLINT()
+        lowercase = lowercase is True or purepyodbc.lowercase is True
+        max_name_length = buffer_length // self._sqlwchar_size - 1
 
-        return_code = self.cdll.SQLDescribeColW(
-            cursor.handle,
-            column_number,
-            byref(column_name),
-            buffer_length,
-            byref(name_length),
-            byref(data_type),
-            byref(column_size),
-            byref(decimal_digits),
-            byref(nullable),
-        )
-
-        self.check_success(return_code, cursor)
+        column_descriptions = []
+        for column_number in range(1, column_count + 1):
+            return_code = self._SQLDescribeColW(
+                cursor.handle,
+                column_number,
+                byref(column_name),
+                buffer_length,
+                byref(name_length),
+                byref(data_type),
+                byref(column_size),
+                byref(decimal_digits),
+                byref(nullable),
+            )
 
-        sql_type = SqlDataType(data_type.value)
-        python_type = SQL_DATA_TYPE_MAP[sql_type].python_type
-
-        name = self._from_buffer(column_name)
-        if lowercase is True or purepyodbc.lowercase is True:
-            name = name.lower()
-
-        column_description = SqlColumnDescription(
-            name,
-            sql_type,
-            python_type,
-            column_size.value,
-            decimal_digits.value,
-            bool(nullable.value),
-            column_number,
-        )
+            self.check_success(return_code, cursor)
+
+            try:
+                sql_type = SqlDataType(data_type.value)
+            except ValueError:
+                # Other types, such as driver specific ones, are read with SQLGetData as character strings.
+                sql_type = SqlDataType.SQL_UNKNOWN_TYPE
+            python_type: type = get_sql_data_type_handling(sql_type).python_type
+            if sql_type is SqlDataType.SQL_GUID and not purepyodbc.native_uuid:
+                python_type = str
+
+            name = self._from_buffer(column_name, min(name_length.value, max_name_length))
+            if lowercase:
+                name = name.lower()
+
+            column_descriptions.append(
+                SqlColumnDescription(
+                    name,
+                    sql_type,
+                    python_type,
+                    column_size.value,
+                    decimal_digits.value,
+                    bool(nullable.value),
+                    column_number,
+                )
+            )
 
-        return column_description
+        return tuple(column_descriptions)
 
     def sql_fetch(self, cursor: Cursor) -> bool:
-        return_code = ReturnCode(self.cdll.SQLFetch(cursor.handle))
+        return_code = self._SQLFetch(cursor.handle)
         self.check_success(return_code, cursor)
-        return return_code is not ReturnCode.SQL_NO_DATA
+        return bool(return_code != _constants.SQL_NO_DATA)
+
+    def sql_fetch_async(self, cursor: Cursor) -> bool | None:
+        """Like sql_fetch(), with asynchronous execution enabled, returning None while the fetch is still executing."""
+        return_code = self._SQLFetch(cursor.handle)
+        if not self._check_async(return_code, cursor):
+            return None
+        return bool(return_code != _constants.SQL_NO_DATA)
+
+    def get_data_buffers(self, column_descriptions: typing.Sequence[SqlColumnDescription]) -> tuple[GetDataBuffer, ...]:
+        """Allocate a reusable SQLGetData buffer for each column, sized to fit the column's values where possible."""
+        buffers = []
+        for column_description in column_descriptions:
+            size = self._value_buffer_size(column_description)
+            if not 0 < size <= GET_DATA_BUFFER_SIZE:
+                size = GET_DATA_BUFFER_SIZE
+            buffers.append(GetDataBuffer(size))
+        return tuple(buffers)
+
+    def sql_get_data(
+        self,
+        cursor: Cursor,
+        column_description: SqlColumnDescription,
+        buffer: GetDataBuffer,
+        totals: ExecutionStatistics,
+    ) -> typing.Any:
+        """Read the value of a column in the current row, adding its length to `totals`."""
+        raw = self.sql_get_data_raw(cursor, column_description, buffer, totals)
+        return None if raw is None else self.convert_value(column_description, raw)
+
+    def sql_get_data_raw(
+        self,
+        cursor: Cursor,
+        column_description: SqlColumnDescription,
+        buffer: GetDataBuffer,
+        totals: ExecutionStatistics,
+    ) -> memoryview | None:
+        """Read the C value of a column in the current row, without converting it, or return None if it is null.
+
+        Values which do not fit into the buffer are read in as many further chunks as needed. Otherwise, the value
+        returned is a view of the buffer, which is only valid until the buffer is read into again.
+        """
+        c_type = get_sql_data_type_handling(column_description.data_type).c_type
+        chunk = self._sql_get_data_chunk(cursor, column_description, c_type, buffer, totals)
+        if chunk is None:
+            return None
+
+        data = memoryview(buffer.data).cast("B")
+        length, more = chunk
+        if not more:
+            return data[:length]
+        chunks = [data[:length].tobytes()]
+        while more:
+            next_chunk = self._sql_get_data_chunk(cursor, column_description, c_type, buffer, totals)
+            if next_chunk is None:
+                break
+            length, more = next_chunk
+            chunks.append(data[:length].tobytes())
+        return memoryview(b"".join(chunks))
+
+    def convert_value(self, column_description: SqlColumnDescription, raw: memoryview) -> typing.Any:
+        """Build a Python object from a C value read by sql_get_data_raw()."""
+        return self._convert_value(get_sql_data_type_handling(column_description.data_type), raw)
+
+    def sql_get_data_stream(
+        self, cursor: Cursor, column_description: SqlColumnDescription, chunk_size: int, totals: ExecutionStatistics
+    ) -> typing.Iterator[str | bytes] | None:
+        """Read the value of a character or binary column in the current row as an iterator of chunks, or return None
+        if the value is null.
+
+        Each chunk is read with SQLGetData into the same buffer of `chunk_size` bytes, so the value is never held in
+        memory as a whole.
+        """
+        handling = get_sql_data_type_handling(column_description.data_type)
+        if handling.c_type not in (CDataType.SQL_C_WCHAR, CDataType.SQL_C_BINARY):
+            raise ProgrammingError(f"Column {column_description.name} is not a character or binary column.")
+
+        if handling.c_type is CDataType.SQL_C_WCHAR:
+            chunk_size -= chunk_size % self._sqlwchar_size
+        buffer = GetDataBuffer(max(chunk_size, self._sqlwchar_size) + self._terminator_size(handling.c_type))
+
+        chunk = self._sql_get_data_chunk(cursor, column_description, handling.c_type, buffer, totals)
+        if chunk is None:
+            return None
+        return self._iter_data_chunks(cursor, column_description, handling.c_type, buffer, chunk, totals)
 
-    def sql_get_data(self, cursor: Cursor, column_description: SqlColumnDescription) -> typing.Any:
-        buffer_size = 4096
-        buffer = self._to_buffer(buffer_size)
-        length_or_indicator = SQLLEN()
+    def _iter_data_chunks(
+        self,
+        cursor: Cursor,
+        column_description: SqlColumnDescription,
+        c_type: CDataType,
+        buffer: GetDataBuffer,
+        chunk: tuple[int, bool],
+        totals: ExecutionStatistics,
+    ) -> typing.Iterator[str | bytes]:
+        data = memoryview(buffer.data).cast("B")
+        # A character outside the BMP may be split across two chunks.
+        decoder = codecs.getincrementaldecoder(self._sqlwchar_encoding)() if c_type is CDataType.SQL_C_WCHAR else None
 
-        return_code = self.cdll.SQLGetData(
+        while True:
+            length, more = chunk
+            if decoder is None:
+                if length:
+                    yield data[:length].tobytes()
+            else:
+                text = decoder.decode(data[:length], final=not more)
+                if text:
+                    yield text
+            if not more:
+                return
+            next_chunk = self._sql_get_data_chunk(cursor, column_description, c_type, buffer, totals)
+            if next_chunk is None:
+                return
+            chunk = next_chunk
+
+    def _sql_get_data_chunk(
+        self,
+        cursor: Cursor,
+        column_description: SqlColumnDescription,
+        c_type: CDataType,
+        buffer: GetDataBuffer,
+        totals: ExecutionStatistics,
+    ) -> tuple[int, bool] | None:
+        """Read (the next part of) a column's value into the buffer with SQLGetData, adding its length to `totals`.
+
+        Returns the number of bytes read and whether the value was truncated to fit the buffer, in which case the rest
+        is returned by subsequent calls. Returns None if the value is null or has already been read.
+        """
+        return_code = self._SQLGetData(
             cursor.handle,
             column_description.column_number,
-            -8,  # TODO: Don't hardcode SQL_C_WCHAR for SQLGetData..? Enum?
-            buffer,
-            buffer_size,
-            byref(length_or_indicator),
+            c_type.value,
+            buffer.data,
+            buffer.size,
+            byref(buffer.length_or_indicator),
         )
-
         self.check_success(return_code, cursor)
+        if return_code == _constants.SQL_NO_DATA:
+            return None
+
+        length: int = buffer.length_or_indicator.value
+        if length == LengthOrIndicatorType.SQL_NULL_DATA.value:
+            return None
+
+        available = buffer.size - self._terminator_size(c_type)
+        more = return_code == _constants.SQL_SUCCESS_WITH_INFO and (
+            length == LengthOrIndicatorType.SQL_NO_TOTAL.value or length > available
+        )
+        if more:
+            length = available
+        totals.bytes_fetched += length
+        return length, more
+
+    def _convert_value(self, handling: SqlDataTypeHandling[typing.Any], raw: memoryview) -> typing.Any:
+        """Build a Python object from a single, non-null C value."""
+        converter = handling.output_converter
+        if handling.layout is not None:
+            fields = handling.layout.unpack(raw)
+            return fields[0] if converter is None else converter(*fields)
+        value: typing.Any = str(raw, self._sqlwchar_encoding) if handling.c_type is CDataType.SQL_C_WCHAR else raw
+        return value if converter is None else converter(value)
+
+    def _terminator_size(self, c_type: CDataType) -> int:
+        """Return the size of the null terminator the driver appends to values of the given C type."""
+        if c_type is CDataType.SQL_C_WCHAR:
+            return self._sqlwchar_size
+        if c_type is CDataType.SQL_C_CHAR:
+            return 1
+        return 0
+
+    def _convert_values(
+        self,
+        handling: SqlDataTypeHandling[typing.Any],
+        column_description: SqlColumnDescription,
+        data: memoryview,
+        element_size: int,
+        lengths: typing.Sequence[int],
+    ) -> list[typing.Any]:
+        """Build Python objects from C values laid out every `element_size` bytes, each with its length/indicator."""
+        null_data = LengthOrIndicatorType.SQL_NULL_DATA.value
+        converter = handling.output_converter
+        values: list[typing.Any] = []
+
+        if handling.layout is not None:
+            for fields, length in zip(handling.layout.iter_unpack(data[: element_size * len(lengths)]), lengths):
+                if length == null_data:
+                    values.append(None)
+                elif converter is None:
+                    values.append(fields[0])
+                else:
+                    values.append(converter(*fields))
+            return values
+
+        max_length = element_size - self._terminator_size(handling.c_type)
+        encoding = self._sqlwchar_encoding if handling.c_type is CDataType.SQL_C_WCHAR else None
+
+        for i, length in enumerate(lengths):
+            if length == null_data:
+                values.append(None)
+                continue
+            if not 0 <= length <= max_length:
+                raise DataError(f"Value of column {column_description.name} was truncated")
+            start = i * element_size
+            raw = data[start : start + length]
+            value: typing.Any = raw if encoding is None else str(raw, encoding)
+            values.append(value if converter is None else converter(value))
+
+        return values
+
+    def _value_buffer_size(self, column_description: SqlColumnDescription) -> int:
+        """Return the size in bytes of a buffer which fits any value of the column, or 0 if its values are unbounded."""
+        data_type = column_description.data_type
+        handling = get_sql_data_type_handling(data_type)
+        if handling.layout is not None:
+            return handling.layout.size
+        size = column_description.size
+        if data_type in TIME_DATA_TYPES:
+            # Times as text, with up to nine digits of fraction, which not all drivers count in the column size.
+            return max(size, 18) + 1
+        if data_type in LONG_DATA_TYPES or size <= 0:
+            return 0
+        if handling.c_type is CDataType.SQL_C_WCHAR:
+            # Leave room for characters outside the BMP, which take two UTF-16 code units.
+            return (size * 2 + 1) * self._sqlwchar_size
+        if handling.c_type is CDataType.SQL_C_CHAR:
+            # Numeric text: the digits plus a sign, a decimal point, a leading zero and the null terminator.
+            return size + 4
+        return size
+
+    def _bound_column_size(self, column_description: SqlColumnDescription) -> int | None:
+        """Return the size in bytes of each element of an array bound to the column, or None if the column is long or
+        unbounded and so must be read with SQLGetData."""
+        handling = get_sql_data_type_handling(column_description.data_type)
+        if handling.layout is None and column_description.size > MAX_BOUND_COLUMN_SIZE:
+            return None
+        return self._value_buffer_size(column_description) or None
+
+    def bind_row_set(
+        self,
+        cursor: Cursor,
+        column_descriptions: typing.Sequence[SqlColumnDescription],
+        capacity: int,
+    ) -> RowSetBuffer | None:
+        """Bind column-wise arrays so that up to `capacity` rows can be fetched with each call to SQLFetchScroll, or
+        fewer if the arrays would not fit in ROW_SET_BUFFER_SIZE.
 
-        # TODO: check return code for SQL_SUCCESS_WITH_INFO (partial data in buffer)
+        Returns None, binding nothing, if any of the columns has to be read with SQLGetData instead.
+        """
+        element_sizes = [self._bound_column_size(x) for x in column_descriptions]
+        if not element_sizes or None in element_sizes:
+            return None
+        row_size = sum(typing.cast(int, x) + ctypes.sizeof(SQLLEN) for x in element_sizes)
+        capped = capacity > max(1, ROW_SET_BUFFER_SIZE // row_size)
+        if capped:
+            capacity = max(1, ROW_SET_BUFFER_SIZE // row_size)
+
+        row_set = RowSetBuffer(
+            columns=tuple(
+                BoundColumn(
+                    description,
+                    get_sql_data_type_handling(description.data_type).c_type,
+                    typing.cast(int, element_size),
+                    capacity,
+                )
+                for description, element_size in zip(column_descriptions, element_sizes)
+            ),
+            capacity=capacity,
+            capped=capped,
+        )
+        self.bind_columns(cursor, row_set)
+        return row_set
+
+    def bind_columns(self, cursor: Cursor, row_set: RowSetBuffer) -> None:
+        """Bind the column-wise arrays of a row set, so that SQLFetchScroll fetches up to its capacity into them."""
+        for column in row_set.columns:
+            return_code = self._SQLBindCol(
+                cursor.handle,
+                column.description.column_number,
+                column.c_type.value,
+                column.data,
+                column.element_size,
+                column.indicators,
+            )
+            self.check_success(return_code, cursor)
+
+        self.sql_set_stmt_attr(cursor, StatementAttributeType.SQL_ATTR_ROW_ARRAY_SIZE, row_set.capacity)
+        row_set.row_array_size = row_set.capacity
+        self.sql_set_stmt_attr(
+            cursor, StatementAttributeType.SQL_ATTR_ROWS_FETCHED_PTR, ctypes.addressof(row_set.rows_fetched)
+        )
+
+    def unbind_row_set(self, cursor: Cursor) -> None:
+        """Release the arrays bound by bind_row_set(), returning the statement to fetching a single row at a time."""
+        self.sql_free_stmt(cursor, FreeStatementOption.SQL_UNBIND)
+        self.sql_set_stmt_attr(cursor, StatementAttributeType.SQL_ATTR_ROWS_FETCHED_PTR, 0)
+        self.sql_set_stmt_attr(cursor, StatementAttributeType.SQL_ATTR_ROW_ARRAY_SIZE, 1)
+
+    def sql_fetch_scroll(self, cursor: Cursor, row_set: RowSetBuffer, totals: ExecutionStatistics) -> int:
+        """Fetch the next rowset into the bound arrays, filling them unless it is the last, and return the number of
+        rows fetched, adding the lengths of their values to `totals`.
+
+        Their values are then returned by row_set_values().
+        """
+        if row_set.capacity != row_set.row_array_size:
+            self.sql_set_stmt_attr(cursor, StatementAttributeType.SQL_ATTR_ROW_ARRAY_SIZE, row_set.capacity)
+            row_set.row_array_size = row_set.capacity
 
-        try:
-            indicator = LengthOrIndicatorType(length_or_indicator.value)
-            if indicator is LengthOrIndicatorType.SQL_NULL_DATA:
-                return None
-        except ValueError:
-            pass
+        return_code = self._SQLFetchScroll(cursor.handle, SqlFetchType.SQL_FETCH_NEXT.value, 0)
+        self.check_success(return_code, cursor)
+        return self._rows_fetched(row_set, return_code, totals)
+
+    def sql_fetch_scroll_async(self, cursor: Cursor, row_set: RowSetBuffer, totals: ExecutionStatistics) -> int | None:
+        """Like sql_fetch_scroll(), with asynchronous execution enabled, returning None while the fetch is still
+        executing."""
+        if row_set.capacity != row_set.row_array_size:
+            self.sql_set_stmt_attr(cursor, StatementAttributeType.SQL_ATTR_ROW_ARRAY_SIZE, row_set.capacity)
+            row_set.row_array_size = row_set.capacity
+
+        return_code = self._SQLFetchScroll(cursor.handle, SqlFetchType.SQL_FETCH_NEXT.value, 0)
+        if not self._check_async(return_code, cursor):
+            return None
+        return self._rows_fetched(row_set, return_code, totals)
+
+    def _rows_fetched(self, row_set: RowSetBuffer, return_code: int, totals: ExecutionStatistics) -> int:
+        if return_code == _constants.SQL_NO_DATA:
+            return 0
+        row_count: int = row_set.rows_fetched.value
+        totals.bytes_fetched += sum(self._count_bytes(x.indicators[:row_count]) for x in row_set.columns)
+        return row_count
+
+    def row_set_values(self, row_set: RowSetBuffer, row_count: int) -> list[tuple[typing.Any, ...]]:
+        """Return the values of the first `row_count` rows in the bound arrays."""
+        if not row_count:
+            return []
+        columns = [
+            self._convert_values(
+                get_sql_data_type_handling(column.description.data_type),
+                column.description,
+                memoryview(column.data).cast("B"),
+                column.element_size,
+                column.indicators[:row_count],
+            )
+            for column in row_set.columns
+        ]
+        return list(zip(*columns))
+
+    @staticmethod
+    def _count_bytes(lengths: list[int]) -> int:
+        """Return the total length of the values with the given lengths/indicators, in which nulls are -1."""
+        return sum(lengths) + lengths.count(LengthOrIndicatorType.SQL_NULL_DATA.value)
+
+    def sql_set_stmt_attr(self, cursor: Cursor, attr: StatementAttributeType, value: int) -> None:
+        """Set an integer (or pointer) valued statement attribute."""
+        return_code = self._SQLSetStmtAttrW(cursor.handle, attr.value, value, 0)
+        self.check_success(return_code, cursor)
 
-        raw_value = self._from_buffer(buffer)
+    def sql_get_stmt_attr(self, cursor: Cursor, attr: StatementAttributeType) -> int:
+        value = SQLULEN()
+        return_code = self.cdll.SQLGetStmtAttrW(cursor.handle, attr.value, byref(value), 0, None)
+        self.check_success(return_code, cursor)
+        return value.value
 
-        try:
-            handling = SQL_DATA_TYPE_MAP[column_description.data_type]
-        except KeyError:
-            raise InterfaceError(f"No output converter for SQL data type {column_description.data_type.name}")
+    def sql_cancel(self, cursor: Cursor) -> None:
+        """Cancel the processing on a statement, which may be executing in another thread."""
+        self.check_success(self.cdll.SQLCancel(cursor.handle), cursor)
 
-        value = handling.output_converter(raw_value)
-        return value
+    def sql_free_stmt(self, cursor: Cursor, option: FreeStatementOption) -> None:
+        self.check_success(self._SQLFreeStmt(cursor.handle, option.value), cursor)
 
     def sql_more_results(self, cursor: Cursor) -> bool:
-        return_code = ReturnCode(self.cdll.SQLMoreResults(cursor.handle))
+        return_code = self._SQLMoreResults(cursor.handle)
         self.check_success(return_code, cursor)
-        return return_code != ReturnCode.SQL_NO_DATA
+        return bool(return_code != _constants.SQL_NO_DATA)
+
+    def sql_more_results_async(self, cursor: Cursor) -> bool | None:
+        """Like sql_more_results(), with asynchronous execution enabled, returning None while the function is still
+        executing."""
+        return_code = self._SQLMoreResults(cursor.handle)
+        if not self._check_async(return_code, cursor):
+            return None
+        return bool(return_code != _constants.SQL_NO_DATA)
+
+    def get_info(self, connection: Connection, info_type: InfoType) -> str | int | bool:
+        """Return the value of an information type, as a str, an int (possibly a bitmask) or a bool, depending on
+        the type."""
+        if info_type in STRING_INFO_TYPES:
+            return self.sql_get_info(connection, info_type)
+        if info_type in YES_NO_INFO_TYPES:
+            return self.sql_get_info(connection, info_type) == "Y"
+        value = SQLUSMALLINT() if info_type in USMALLINT_INFO_TYPES else SQLUINTEGER()
+        return_code = self.cdll.SQLGetInfoW(connection.handle, info_type.value, byref(value), sizeof(value), None)
+        self.check_success(return_code, connection)
+        return value.value
 
     def sql_get_info(self, connection: Connection, info_type: InfoType) -> str:
-        buffer_size = 4096
-        buffer = self._to_buffer(buffer_size)
-        string_len = SQLSMALLINT()
+        """Return the value of a character string information type."""
+        buffer_size = 256
+        while True:
+            buffer = self._to_buffer(buffer_size)
+            string_len = SQLSMALLINT()
 
-        return_code = ReturnCode(
-            self.cdll.SQLGetInfoW(
+            return_code = self.cdll.SQLGetInfoW(
                 connection.handle,
                 info_type.value,
                 buffer,
                 buffer_size,
                 byref(string_len),
             )
-        )
 
-        self.check_success(return_code, connection)
+            self.check_success(return_code, connection)
 
-        return self._from_buffer(buffer)
+            # The value was truncated if its length (in bytes) left no room for the null terminator.
+            if string_len.value + self._sqlwchar_size <= buffer_size:
+                return self._from_buffer(buffer)
+            buffer_size = string_len.value + self._sqlwchar_size
 
     def sql_get_connect_attr(self, connection: Connection, attr: ConnectionAttributeType) -> int:
         """Returns the current setting of a connection attribute."""
         foo = ctypes.c_int()
         bar = ctypes.c_int()
-        return_code = ReturnCode(
-            self.cdll.SQLGetConnectAttrW(
-                connection.handle,  # ConnectionHandle
-                attr.value,  # Attribute
-                byref(foo),
-                sizeof(foo),
-                byref(bar),
-            )
+        return_code = self.cdll.SQLGetConnectAttrW(
+            connection.handle,  # ConnectionHandle
+            attr.value,  # Attribute
+            byref(foo),
+            sizeof(foo),
+            byref(bar),
         )
 
         self.check_success(return_code, connection)
@@ -483,7 +1253,7 @@ class DriverManager:
                 byref(attributes_length),
             )
             self.check_success(return_code, environment)
-            if ReturnCode(return_code) is ReturnCode.SQL_NO_DATA:
+            if return_code == _constants.SQL_NO_DATA:
                 break
 
             driver = self._from_buffer(driver_description)
@@ -536,19 +1306,39 @@ class DriverManager:
         self.check_success(return_code, cursor)
 
     def check_success(self, return_code: int | ReturnCode, handler: Handler) -> None:
-        if isinstance(return_code, int):
-            return_code = ReturnCode(return_code)
-
-        success_codes = (
-            ReturnCode.SQL_SUCCESS,
-            ReturnCode.SQL_SUCCESS_WITH_INFO,
-            ReturnCode.SQL_NO_DATA,
-        )
-
-        if return_code not in success_codes:
-            self._handle_error(handler)
+        # This is called after almost every ODBC call, so the return code is checked against a set of ints before
+        # anything else is done with it.
+        if return_code in _constants.SUCCESS_RETURN_CODES:
+            return
+        if isinstance(return_code, ReturnCode):
+            if return_code.value in _constants.SUCCESS_RETURN_CODES:
+                return
+            return_code = return_code.value
+        self._handle_error(return_code, handler)
+
+    def _check_success_counted(self, return_code: int | ReturnCode, handler: Handler) -> None:
+        """check_success() while tracing is enabled, which also counts the calls made on each handle."""
+        handler._odbc_calls += 1
+        DriverManager.check_success(self, return_code, handler)
+
+    def _check_async(self, return_code: int, handler: Handler) -> bool:
+        """Check the return code of a function called with asynchronous execution enabled, returning False if the
+        function is still executing."""
+        if return_code == _constants.SQL_STILL_EXECUTING:
+            return False
+        self.check_success(return_code, handler)
+        return True
+
+    def _handle_error(self, return_code: int, handler: Handler) -> None:
+        if return_code == _constants.SQL_INVALID_HANDLE:
+            raise ProgrammingError("", ReturnCode.SQL_INVALID_HANDLE.name)
+        if return_code == _constants.SQL_STILL_EXECUTING:
+            raise OperationalError("The function is still executing asynchronously.")
+        if return_code == _constants.SQL_NEED_DATA:
+            raise NotSupportedError("Data-at-execution parameters are not supported.")
+        if return_code != _constants.SQL_ERROR:
+            raise Error(f"Unhandled return code: {return_code}")
 
-    def _handle_error(self, handler: Handler) -> None:
         state = self._to_buffer(24)
         message = self._to_buffer(1024 * 4)
         native_error = c_int()
@@ -557,19 +1347,17 @@ class DriverManager:
 
         while True:
             err_number = len(err_list) + 1
-            return_code = ReturnCode(
-                self.cdll.SQLGetDiagRecW(
-                    handler.handle_type.value,
-                    handler.handle,
-                    err_number,
-                    state,
-                    byref(native_error),
-                    message,
-                    1024,
-                    byref(buffer_len),
-                )
+            diag_return_code = self.cdll.SQLGetDiagRecW(
+                handler.handle_type.value,
+                handler.handle,
+                err_number,
+                state,
+                byref(native_error),
+                message,
+                1024,
+                byref(buffer_len),
             )
-            if return_code is ReturnCode.SQL_SUCCESS:
+            if diag_return_code == _constants.SQL_SUCCESS:
                 err_list.append(
                     (
                         self._from_buffer(state),
@@ -577,43 +1365,16 @@ class DriverManager:
                         native_error.value,
                     )
                 )
-            elif return_code is ReturnCode.SQL_INVALID_HANDLE:
-                raise ProgrammingError("", return_code.name)
-            elif return_code == ReturnCode.SQL_NO_DATA:
+            elif diag_return_code == _constants.SQL_INVALID_HANDLE:
+                raise ProgrammingError("", ReturnCode.SQL_INVALID_HANDLE.name)
+            elif diag_return_code == _constants.SQL_NO_DATA:
+                if not err_list:
+                    raise Error("The ODBC function failed without returning any diagnostic records.")
                 first_state = err_list[0][0]
                 first_msg = err_list[0][1]
-                sql_state_exc_map = {
-                    "01002": OperationalError,
-                    "08001": OperationalError,
-                    "08003": OperationalError,
-                    "08004": OperationalError,
-                    "08007": OperationalError,
-                    "08S01": OperationalError,
-                    "0A000": NotSupportedError,
-                    "28000": InterfaceError,
-                    "40002": IntegrityError,
-                    "22": DataError,
-                    "23": IntegrityError,
-                    "24": ProgrammingError,
-                    "25": ProgrammingError,
-                    "42": ProgrammingError,
-                    "HY001": OperationalError,
-                    "HY014": OperationalError,
-                    "HYT00": OperationalError,
-                    "HYT01": OperationalError,
-                    "IM001": InterfaceError,
-                    "IM002": InterfaceError,
-                    "IM003": InterfaceError,
-                }
-                for k, v in sql_state_exc_map.items():
-                    if first_state.startswith(k):
-                        exc_type = v
-                        break
-                else:
-                    exc_type = Error
-                raise exc_type(f"{first_state} {first_msg}")
+                raise error_for_sqlstate(first_state)(f"{first_state} {first_msg}")
             else:
-                raise Error(f"Unhandled return code: {return_code}")
+                raise Error(f"Unhandled return code: {diag_return_code}")
 
     def sql_procedures(
         self,
@@ -622,16 +1383,14 @@ class DriverManager:
         catalog: str | None = None,
         schema: str | None = None,
     ) -> None:
-        return_code = ReturnCode(
-            self.cdll.SQLProcedures(
-                cursor.handle,
-                procedure,
-                _constants.SQL_NTS,
-                catalog,
-                _constants.SQL_NTS,
-                schema,
-                _constants.SQL_NTS,
-            )
+        return_code = self.cdll.SQLProcedures(
+            cursor.handle,
+            procedure,
+            _constants.SQL_NTS,
+            catalog,
+            _constants.SQL_NTS,
+            schema,
+            _constants.SQL_NTS,
         )
         self.check_success(return_code, cursor)
 
@@ -664,52 +1423,255 @@ class DriverManager:
         foreignSchema_p, foreignSchema_len = get_pointer_and_len(foreignSchema)
         foreignTable_p, foreignTable_len = get_pointer_and_len(foreignTable)
 
-        return_code = ReturnCode(
-            self.cdll.SQLForeignKeysW(
-                cursor.handle,
-                catalog_p,
-                catalog_len,
-                schema_p,
-                schema_len,
-                table_p,
-                table_len,
-                foreignCatalog_p,
-                foreignCatalog_len,
-                foreignSchema_p,
-                foreignSchema_len,
-                foreignTable_p,
-                foreignTable_len,
-            )
+        return_code = self.cdll.SQLForeignKeysW(
+            cursor.handle,
+            catalog_p,
+            catalog_len,
+            schema_p,
+            schema_len,
+            table_p,
+            table_len,
+            foreignCatalog_p,
+            foreignCatalog_len,
+            foreignSchema_p,
+            foreignSchema_len,
+            foreignTable_p,
+            foreignTable_len,
         )
         self.check_success(return_code, cursor)
 
 
-def parse_sql_bit(value: str) -> bool:
-    return bool(int(value))
-
-
 T = typing.TypeVar("T")
 
 
 @dataclass(frozen=True)
 class SqlDataTypeHandling(typing.Generic[T]):
+    """How values of a SQL data type are fetched.
+
+    The driver is asked to convert values to `c_type`. Fixed size C values are unpacked according to `layout` and the
+    fields passed to `output_converter`. Variable length values are sliced to their returned length (and decoded, for
+    SQL_C_WCHAR) before being passed to `output_converter`. No converter means the value is used as it is.
+    """
+
     python_type: type[T]
-    output_converter: typing.Callable[[str], T]
-
-
-# TODO: Revisit this...
-SQL_DATA_TYPE_MAP: dict[SqlDataType, SqlDataTypeHandling[str | int | bool | datetime.datetime]] = {
-    SqlDataType.SQL_CHAR: SqlDataTypeHandling(python_type=str, output_converter=str),
-    SqlDataType.SQL_VARCHAR: SqlDataTypeHandling(python_type=str, output_converter=str),
-    SqlDataType.SQL_WCHAR: SqlDataTypeHandling(python_type=str, output_converter=str),
-    SqlDataType.SQL_WVARCHAR: SqlDataTypeHandling(python_type=str, output_converter=str),
-    SqlDataType.SQL_WLONGVARCHAR: SqlDataTypeHandling(python_type=str, output_converter=str),
-    SqlDataType.SQL_BIT: SqlDataTypeHandling(python_type=bool, output_converter=parse_sql_bit),
-    SqlDataType.SQL_INTEGER: SqlDataTypeHandling(python_type=int, output_converter=int),
-    SqlDataType.SQL_BIGINT: SqlDataTypeHandling(python_type=int, output_converter=int),
-    SqlDataType.SQL_TINYINT: SqlDataTypeHandling(python_type=int, output_converter=int),
-    SqlDataType.SQL_TYPE_TIMESTAMP: SqlDataTypeHandling(
-        python_type=datetime.datetime, output_converter=datetime.datetime.fromisoformat
+    c_type: CDataType
+    layout: struct.Struct | None = None
+    output_converter: typing.Callable[..., T] | None = None
+
+
+def _timestamp_from_fields(
+    year: int, month: int, day: int, hour: int, minute: int, second: int, fraction: int
+) -> datetime.datetime:
+    # The fraction of a SQL_TIMESTAMP_STRUCT is in nanoseconds.
+    return datetime.datetime(year, month, day, hour, minute, second, fraction // 1000)
+
+
+def _parse_time(text: str) -> datetime.time:
+    whole, _, fraction = text.partition(".")
+    hour, minute, second = whole.split(":")
+    # Drivers return up to nine digits of fraction, of which a time keeps six.
+    return datetime.time(int(hour), int(minute), int(second), int((fraction + "000000")[:6]))
+
+
+def _time_from_text(value: memoryview) -> datetime.time:
+    return _parse_time(str(value, "ascii"))
+
+
+def _datetimeoffset_from_text(value: memoryview) -> datetime.datetime:
+    # As in "2024-01-02 03:04:05.1234567 +01:00", where the offset may also directly follow the time.
+    date, _, time_and_offset = str(value, "ascii").strip().partition(" ")
+    split = max(time_and_offset.rfind("+"), time_and_offset.rfind("-"))
+    offset = time_and_offset[split:].replace(" ", "")
+    hours, minutes = offset[1:].split(":")
+    delta = datetime.timedelta(hours=int(hours), minutes=int(minutes))
+    return datetime.datetime.combine(
+        datetime.date.fromisoformat(date),
+        _parse_time(time_and_offset[:split].strip()),
+        datetime.timezone(-delta if offset[0] == "-" else delta),
+    )
+
+
+def _guid_from_bytes(value: bytes) -> uuid.UUID | str:
+    # The first three fields of a SQLGUID are native-endian integers.
+    guid = uuid.UUID(bytes_le=value) if sys.byteorder == "little" else uuid.UUID(bytes=value)
+    if purepyodbc.native_uuid:
+        return guid
+    return str(guid).upper()
+
+
+def _decimal_from_text(value: memoryview) -> decimal.Decimal:
+    return decimal.Decimal(str(value, "ascii"))
+
+
+_STRING = SqlDataTypeHandling(python_type=str, c_type=CDataType.SQL_C_WCHAR)
+_INTEGER = SqlDataTypeHandling(python_type=int, c_type=CDataType.SQL_C_SBIGINT, layout=struct.Struct("=q"))
+_FLOAT = SqlDataTypeHandling(python_type=float, c_type=CDataType.SQL_C_DOUBLE, layout=struct.Struct("=d"))
+_DECIMAL = SqlDataTypeHandling(
+    python_type=decimal.Decimal, c_type=CDataType.SQL_C_CHAR, output_converter=_decimal_from_text
+)
+_BINARY = SqlDataTypeHandling(python_type=bytes, c_type=CDataType.SQL_C_BINARY, output_converter=bytes)
+_DATE = SqlDataTypeHandling(
+    python_type=datetime.date,
+    c_type=CDataType.SQL_C_TYPE_DATE,
+    layout=struct.Struct("=hHH"),
+    output_converter=datetime.date,
+)
+# Times are read as text, as a SQL_TIME_STRUCT has no fraction of a second.
+_TIME = SqlDataTypeHandling(python_type=datetime.time, c_type=CDataType.SQL_C_CHAR, output_converter=_time_from_text)
+_TIMESTAMP = SqlDataTypeHandling(
+    python_type=datetime.datetime,
+    c_type=CDataType.SQL_C_TYPE_TIMESTAMP,
+    layout=struct.Struct("=hHHHHHI"),
+    output_converter=_timestamp_from_fields,
+)
+
+SQL_DATA_TYPE_MAP: dict[SqlDataType, SqlDataTypeHandling[typing.Any]] = {
+    SqlDataType.SQL_CHAR: _STRING,
+    SqlDataType.SQL_VARCHAR: _STRING,
+    SqlDataType.SQL_LONGVARCHAR: _STRING,
+    SqlDataType.SQL_WCHAR: _STRING,
+    SqlDataType.SQL_WVARCHAR: _STRING,
+    SqlDataType.SQL_WLONGVARCHAR: _STRING,
+    SqlDataType.SQL_SS_XML: _STRING,
+    SqlDataType.SQL_UNKNOWN_TYPE: _STRING,
+    SqlDataType.SQL_BIT: SqlDataTypeHandling(
+        python_type=bool, c_type=CDataType.SQL_C_BIT, layout=struct.Struct("=B"), output_converter=bool
+    ),
+    SqlDataType.SQL_TINYINT: _INTEGER,
+    SqlDataType.SQL_SMALLINT: _INTEGER,
+    SqlDataType.SQL_INTEGER: _INTEGER,
+    SqlDataType.SQL_BIGINT: _INTEGER,
+    SqlDataType.SQL_REAL: _FLOAT,
+    SqlDataType.SQL_FLOAT: _FLOAT,
+    SqlDataType.SQL_DOUBLE: _FLOAT,
+    SqlDataType.SQL_DECIMAL: _DECIMAL,
+    SqlDataType.SQL_NUMERIC: _DECIMAL,
+    SqlDataType.SQL_TYPE_DATE: _DATE,
+    SqlDataType.SQL_DATE: _DATE,
+    SqlDataType.SQL_TYPE_TIME: _TIME,
+    SqlDataType.SQL_TIME: _TIME,
+    SqlDataType.SQL_SS_TIME2: _TIME,
+    SqlDataType.SQL_TYPE_TIMESTAMP: _TIMESTAMP,
+    SqlDataType.SQL_TIMESTAMP: _TIMESTAMP,
+    SqlDataType.SQL_SS_TIMESTAMPOFFSET: SqlDataTypeHandling(
+        python_type=datetime.datetime, c_type=CDataType.SQL_C_CHAR, output_converter=_datetimeoffset_from_text
+    ),
+    SqlDataType.SQL_BINARY: _BINARY,
+    SqlDataType.SQL_VARBINARY: _BINARY,
+    SqlDataType.SQL_LONGVARBINARY: _BINARY,
+    SqlDataType.SQL_GUID: SqlDataTypeHandling(
+        python_type=uuid.UUID,
+        c_type=CDataType.SQL_C_GUID,
+        layout=struct.Struct("=16s"),
+        output_converter=_guid_from_bytes,
     ),
-    SqlDataType.SQL_SMALLINT: SqlDataTypeHandling(python_type=int, output_converter=int),
 }
+
+
+def get_sql_data_type_handling(data_type: SqlDataType) -> SqlDataTypeHandling[typing.Any]:
+    try:
+        return SQL_DATA_TYPE_MAP[data_type]
+    except KeyError:
+        raise InterfaceError(f"No output converter for SQL data type {data_type.name}")
+
+
+LONG_DATA_TYPES = frozenset(
+    {
+        SqlDataType.SQL_LONGVARCHAR,
+        SqlDataType.SQL_WLONGVARCHAR,
+        SqlDataType.SQL_LONGVARBINARY,
+        SqlDataType.SQL_SS_XML,
+        SqlDataType.SQL_UNKNOWN_TYPE,
+    }
+)
+
+TIME_DATA_TYPES = frozenset({SqlDataType.SQL_TYPE_TIME, SqlDataType.SQL_TIME, SqlDataType.SQL_SS_TIME2})
+
+
+# The information types whose values are character strings.
+STRING_INFO_TYPES = frozenset(
+    {
+        InfoType.SQL_DATA_SOURCE_NAME,
+        InfoType.SQL_DRIVER_NAME,
+        InfoType.SQL_DRIVER_VER,
+        InfoType.SQL_ODBC_VER,
+        InfoType.SQL_SERVER_NAME,
+        InfoType.SQL_SEARCH_PATTERN_ESCAPE,
+        InfoType.SQL_DATABASE_NAME,
+        InfoType.SQL_DBMS_NAME,
+        InfoType.SQL_DBMS_VER,
+        InfoType.SQL_IDENTIFIER_QUOTE_CHAR,
+        InfoType.SQL_SCHEMA_TERM,
+        InfoType.SQL_PROCEDURE_TERM,
+        InfoType.SQL_CATALOG_NAME_SEPARATOR,
+        InfoType.SQL_CATALOG_TERM,
+        InfoType.SQL_TABLE_TERM,
+        InfoType.SQL_USER_NAME,
+        InfoType.SQL_DRIVER_ODBC_VER,
+        InfoType.SQL_KEYWORDS,
+        InfoType.SQL_SPECIAL_CHARACTERS,
+        InfoType.SQL_DM_VER,
+        InfoType.SQL_XOPEN_CLI_YEAR,
+        InfoType.SQL_COLLATION_SEQ,
+    }
+)
+
+
+# The information types whose values are "Y" or "N", which are returned as bools.
+YES_NO_INFO_TYPES = frozenset(
+    {
+        InfoType.SQL_ROW_UPDATES,
+        InfoType.SQL_ACCESSIBLE_TABLES,
+        InfoType.SQL_ACCESSIBLE_PROCEDURES,
+        InfoType.SQL_PROCEDURES,
+        InfoType.SQL_DATA_SOURCE_READ_ONLY,
+        InfoType.SQL_EXPRESSIONS_IN_ORDERBY,
+        InfoType.SQL_MULT_RESULT_SETS,
+        InfoType.SQL_MULTIPLE_ACTIVE_TXN,
+        InfoType.SQL_INTEGRITY,
+        InfoType.SQL_COLUMN_ALIAS,
+        InfoType.SQL_ORDER_BY_COLUMNS_IN_SELECT,
+        InfoType.SQL_MAX_ROW_SIZE_INCLUDES_LONG,
+        InfoType.SQL_NEED_LONG_DATA_LEN,
+        InfoType.SQL_LIKE_ESCAPE_CLAUSE,
+        InfoType.SQL_DESCRIBE_PARAMETER,
+        InfoType.SQL_CATALOG_NAME,
+    }
+)
+
+
+# The information types whose values are SQLUSMALLINTs. The values of the others are SQLUINTEGERs, many
+# of which are bitmasks.
+USMALLINT_INFO_TYPES = frozenset(
+    {
+        InfoType.SQL_MAX_DRIVER_CONNECTIONS,
+        InfoType.SQL_MAX_CONCURRENT_ACTIVITIES,
+        InfoType.SQL_CONCAT_NULL_BEHAVIOR,
+        InfoType.SQL_CURSOR_COMMIT_BEHAVIOR,
+        InfoType.SQL_CURSOR_ROLLBACK_BEHAVIOR,
+        InfoType.SQL_IDENTIFIER_CASE,
+        InfoType.SQL_MAX_COLUMN_NAME_LEN,
+        InfoType.SQL_MAX_CURSOR_NAME_LEN,
+        InfoType.SQL_MAX_SCHEMA_NAME_LEN,
+        InfoType.SQL_MAX_PROCEDURE_NAME_LEN,
+        InfoType.SQL_MAX_CATALOG_NAME_LEN,
+        InfoType.SQL_MAX_TABLE_NAME_LEN,
+        InfoType.SQL_TXN_CAPABLE,
+        InfoType.SQL_CORRELATION_NAME,
+        InfoType.SQL_NON_NULLABLE_COLUMNS,
+        InfoType.SQL_FILE_USAGE,
+        InfoType.SQL_NULL_COLLATION,
+        InfoType.SQL_GROUP_BY,
+        InfoType.SQL_QUOTED_IDENTIFIER_CASE,
+        InfoType.SQL_MAX_COLUMNS_IN_GROUP_BY,
+        InfoType.SQL_MAX_COLUMNS_IN_INDEX,
+        InfoType.SQL_MAX_COLUMNS_IN_ORDER_BY,
+        InfoType.SQL_MAX_COLUMNS_IN_SELECT,
+        InfoType.SQL_MAX_COLUMNS_IN_TABLE,
+        InfoType.SQL_MAX_TABLES_IN_SELECT,
+        InfoType.SQL_MAX_USER_NAME_LEN,
+        InfoType.SQL_CATALOG_LOCATION,
+        InfoType.SQL_ACTIVE_ENVIRONMENTS,
+        InfoType.SQL_MAX_IDENTIFIER_LEN,
+    }
+)
@@ -46,3 +46,12 @@ class SqlColumnDescription:
             null_ok=self.is_nullable,
         )
         return column_description
+
+
+@dataclass(frozen=True)
+class ParameterDescription:
+    """Internal object which describes a statement parameter, as returned by SQLDescribeParam."""
+
+    data_type: int
+    size: int
+    decimal_digits: int
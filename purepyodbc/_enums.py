@@ -10,18 +10,41 @@ class OdbcVersion(Enum):
 
 
 class SqlDataType(Enum):
-    """https://docs.microsoft.com/en-us/sql/odbc/reference/appendixes/sql-data-types"""
+    """https://docs.microsoft.com/en-us/sql/odbc/reference/appendixes/sql-data-types
 
+    Includes the SQL Server specific types (SQL_SS_*), the ODBC 2 date and time types, and SQL_UNKNOWN_TYPE, which
+    stands for any type code not listed here.
+    """
+
+    SQL_SS_TIMESTAMPOFFSET = -155
+    SQL_SS_TIME2 = -154
+    SQL_SS_XML = -152
+    SQL_GUID = -11
+    SQL_WLONGVARCHAR = -10
+    SQL_WVARCHAR = -9
+    SQL_WCHAR = -8
+    SQL_BIT = -7
     SQL_TINYINT = -6
     SQL_BIGINT = -5
-    SQL_BIT = -7
-    SQL_WCHAR = -8
-    SQL_WVARCHAR = -9
-    SQL_WLONGVARCHAR = -10
+    SQL_LONGVARBINARY = -4
+    SQL_VARBINARY = -3
+    SQL_BINARY = -2
+    SQL_LONGVARCHAR = -1
+    SQL_UNKNOWN_TYPE = 0
     SQL_CHAR = 1
+    SQL_NUMERIC = 2
+    SQL_DECIMAL = 3
     SQL_INTEGER = 4
     SQL_SMALLINT = 5
+    SQL_FLOAT = 6
+    SQL_REAL = 7
+    SQL_DOUBLE = 8
+    SQL_DATE = 9
+    SQL_TIME = 10
+    SQL_TIMESTAMP = 11
     SQL_VARCHAR = 12
+    SQL_TYPE_DATE = 91
+    SQL_TYPE_TIME = 92
     SQL_TYPE_TIMESTAMP = 93
 
 
@@ -76,6 +99,38 @@ class EnvironmentAttributeType(Enum):
     SQL_ATTR_OUTPUT_NTS = 10001
 
 
+class ConnectionPooling(Enum):
+    """Values of SQL_ATTR_CONNECTION_POOLING.
+
+    https://learn.microsoft.com/en-us/sql/odbc/reference/syntax/sqlsetenvattr-function
+    """
+
+    SQL_CP_OFF = 0
+    SQL_CP_ONE_PER_DRIVER = 1
+    SQL_CP_ONE_PER_HENV = 2
+    SQL_CP_DRIVER_AWARE = 3
+
+
+class ConnectionPoolMatch(Enum):
+    """Values of SQL_ATTR_CP_MATCH.
+
+    https://learn.microsoft.com/en-us/sql/odbc/reference/syntax/sqlsetenvattr-function
+    """
+
+    SQL_CP_STRICT_MATCH = 0
+    SQL_CP_RELAXED_MATCH = 1
+
+
+class AsyncEnable(Enum):
+    """Values of SQL_ATTR_ASYNC_ENABLE.
+
+    https://learn.microsoft.com/en-us/sql/odbc/reference/syntax/sqlsetstmtattr-function
+    """
+
+    SQL_ASYNC_ENABLE_OFF = 0
+    SQL_ASYNC_ENABLE_ON = 1
+
+
 class DriverCompletion(Enum):
     SQL_DRIVER_NOPROMPT = 0
     SQL_DRIVER_COMPLETE = 1
@@ -90,6 +145,7 @@ class ReturnCode(Enum):
     SQL_SUCCESS_WITH_INFO = 1
     SQL_NO_DATA = 100
     SQL_STILL_EXECUTING = 2
+    SQL_NEED_DATA = 99
 
 
 class HandleType(Enum):
@@ -107,10 +163,177 @@ class InfoType(Enum):
     https://docs.microsoft.com/en-us/sql/odbc/reference/syntax/sqlgetinfo-function?view=sql-server-ver16#information-types
     """
 
+    SQL_MAX_DRIVER_CONNECTIONS = 0
+    SQL_MAX_CONCURRENT_ACTIVITIES = 1
+    SQL_DATA_SOURCE_NAME = 2
+    SQL_DRIVER_NAME = 6
+    SQL_DRIVER_VER = 7
+    SQL_ODBC_VER = 10
+    SQL_ROW_UPDATES = 11
+    SQL_SERVER_NAME = 13
     SQL_SEARCH_PATTERN_ESCAPE = 14
+    SQL_DATABASE_NAME = 16
     SQL_DBMS_NAME = 17
+    SQL_DBMS_VER = 18
+    SQL_ACCESSIBLE_TABLES = 19
+    SQL_ACCESSIBLE_PROCEDURES = 20
+    SQL_PROCEDURES = 21
+    SQL_CONCAT_NULL_BEHAVIOR = 22
+    SQL_CURSOR_COMMIT_BEHAVIOR = 23
+    SQL_CURSOR_ROLLBACK_BEHAVIOR = 24
+    SQL_DATA_SOURCE_READ_ONLY = 25
+    SQL_DEFAULT_TXN_ISOLATION = 26
+    SQL_EXPRESSIONS_IN_ORDERBY = 27
+    SQL_IDENTIFIER_CASE = 28
     SQL_IDENTIFIER_QUOTE_CHAR = 29
+    SQL_MAX_COLUMN_NAME_LEN = 30
+    SQL_MAX_CURSOR_NAME_LEN = 31
+    SQL_MAX_SCHEMA_NAME_LEN = 32
+    SQL_MAX_PROCEDURE_NAME_LEN = 33
+    SQL_MAX_CATALOG_NAME_LEN = 34
+    SQL_MAX_TABLE_NAME_LEN = 35
+    SQL_MULT_RESULT_SETS = 36
+    SQL_MULTIPLE_ACTIVE_TXN = 37
     SQL_SCHEMA_TERM = 39
+    SQL_PROCEDURE_TERM = 40
+    SQL_CATALOG_NAME_SEPARATOR = 41
+    SQL_CATALOG_TERM = 42
+    SQL_SCROLL_OPTIONS = 44
+    SQL_TABLE_TERM = 45
+    SQL_TXN_CAPABLE = 46
+    SQL_USER_NAME = 47
+    SQL_CONVERT_FUNCTIONS = 48
+    SQL_NUMERIC_FUNCTIONS = 49
+    SQL_STRING_FUNCTIONS = 50
+    SQL_SYSTEM_FUNCTIONS = 51
+    SQL_TIMEDATE_FUNCTIONS = 52
+    SQL_CONVERT_BIGINT = 53
+    SQL_CONVERT_BINARY = 54
+    SQL_CONVERT_BIT = 55
+    SQL_CONVERT_CHAR = 56
+    SQL_CONVERT_DATE = 57
+    SQL_CONVERT_DECIMAL = 58
+    SQL_CONVERT_DOUBLE = 59
+    SQL_CONVERT_FLOAT = 60
+    SQL_CONVERT_INTEGER = 61
+    SQL_CONVERT_LONGVARCHAR = 62
+    SQL_CONVERT_NUMERIC = 63
+    SQL_CONVERT_REAL = 64
+    SQL_CONVERT_SMALLINT = 65
+    SQL_CONVERT_TIME = 66
+    SQL_CONVERT_TIMESTAMP = 67
+    SQL_CONVERT_TINYINT = 68
+    SQL_CONVERT_VARBINARY = 69
+    SQL_CONVERT_VARCHAR = 70
+    SQL_CONVERT_LONGVARBINARY = 71
+    SQL_TXN_ISOLATION_OPTION = 72
+    SQL_INTEGRITY = 73
+    SQL_CORRELATION_NAME = 74
+    SQL_NON_NULLABLE_COLUMNS = 75
+    SQL_DRIVER_ODBC_VER = 77
+    SQL_POS_OPERATIONS = 79
+    SQL_GETDATA_EXTENSIONS = 81
+    SQL_BOOKMARK_PERSISTENCE = 82
+    SQL_FILE_USAGE = 84
+    SQL_NULL_COLLATION = 85
+    SQL_ALTER_TABLE = 86
+    SQL_COLUMN_ALIAS = 87
+    SQL_GROUP_BY = 88
+    SQL_KEYWORDS = 89
+    SQL_ORDER_BY_COLUMNS_IN_SELECT = 90
+    SQL_SCHEMA_USAGE = 91
+    SQL_CATALOG_USAGE = 92
+    SQL_QUOTED_IDENTIFIER_CASE = 93
+    SQL_SPECIAL_CHARACTERS = 94
+    SQL_SUBQUERIES = 95
+    SQL_UNION = 96
+    SQL_MAX_COLUMNS_IN_GROUP_BY = 97
+    SQL_MAX_COLUMNS_IN_INDEX = 98
+    SQL_MAX_COLUMNS_IN_ORDER_BY = 99
+    SQL_MAX_COLUMNS_IN_SELECT = 100
+    SQL_MAX_COLUMNS_IN_TABLE = 101
+    SQL_MAX_INDEX_SIZE = 102
+    SQL_MAX_ROW_SIZE_INCLUDES_LONG = 103
+    SQL_MAX_ROW_SIZE = 104
+    SQL_MAX_STATEMENT_LEN = 105
+    SQL_MAX_TABLES_IN_SELECT = 106
+    SQL_MAX_USER_NAME_LEN = 107
+    SQL_MAX_CHAR_LITERAL_LEN = 108
+    SQL_TIMEDATE_ADD_INTERVALS = 109
+    SQL_TIMEDATE_DIFF_INTERVALS = 110
+    SQL_NEED_LONG_DATA_LEN = 111
+    SQL_MAX_BINARY_LITERAL_LEN = 112
+    SQL_LIKE_ESCAPE_CLAUSE = 113
+    SQL_CATALOG_LOCATION = 114
+    SQL_OJ_CAPABILITIES = 115
+    SQL_ACTIVE_ENVIRONMENTS = 116
+    SQL_ALTER_DOMAIN = 117
+    SQL_SQL_CONFORMANCE = 118
+    SQL_DATETIME_LITERALS = 119
+    SQL_BATCH_ROW_COUNT = 120
+    SQL_BATCH_SUPPORT = 121
+    SQL_CONVERT_WCHAR = 122
+    SQL_CONVERT_INTERVAL_DAY_TIME = 123
+    SQL_CONVERT_INTERVAL_YEAR_MONTH = 124
+    SQL_CONVERT_WLONGVARCHAR = 125
+    SQL_CONVERT_WVARCHAR = 126
+    SQL_CREATE_ASSERTION = 127
+    SQL_CREATE_CHARACTER_SET = 128
+    SQL_CREATE_COLLATION = 129
+    SQL_CREATE_DOMAIN = 130
+    SQL_CREATE_SCHEMA = 131
+    SQL_CREATE_TABLE = 132
+    SQL_CREATE_TRANSLATION = 133
+    SQL_CREATE_VIEW = 134
+    SQL_DROP_ASSERTION = 136
+    SQL_DROP_CHARACTER_SET = 137
+    SQL_DROP_COLLATION = 138
+    SQL_DROP_DOMAIN = 139
+    SQL_DROP_SCHEMA = 140
+    SQL_DROP_TABLE = 141
+    SQL_DROP_TRANSLATION = 142
+    SQL_DROP_VIEW = 143
+    SQL_DYNAMIC_CURSOR_ATTRIBUTES1 = 144
+    SQL_DYNAMIC_CURSOR_ATTRIBUTES2 = 145
+    SQL_FORWARD_ONLY_CURSOR_ATTRIBUTES1 = 146
+    SQL_FORWARD_ONLY_CURSOR_ATTRIBUTES2 = 147
+    SQL_INDEX_KEYWORDS = 148
+    SQL_INFO_SCHEMA_VIEWS = 149
+    SQL_KEYSET_CURSOR_ATTRIBUTES1 = 150
+    SQL_KEYSET_CURSOR_ATTRIBUTES2 = 151
+    SQL_ODBC_INTERFACE_CONFORMANCE = 152
+    SQL_PARAM_ARRAY_ROW_COUNTS = 153
+    SQL_PARAM_ARRAY_SELECTS = 154
+    SQL_SQL92_DATETIME_FUNCTIONS = 155
+    SQL_SQL92_FOREIGN_KEY_DELETE_RULE = 156
+    SQL_SQL92_FOREIGN_KEY_UPDATE_RULE = 157
+    SQL_SQL92_GRANT = 158
+    SQL_SQL92_NUMERIC_VALUE_FUNCTIONS = 159
+    SQL_SQL92_PREDICATES = 160
+    SQL_SQL92_RELATIONAL_JOIN_OPERATORS = 161
+    SQL_SQL92_REVOKE = 162
+    SQL_SQL92_ROW_VALUE_CONSTRUCTOR = 163
+    SQL_SQL92_STRING_FUNCTIONS = 164
+    SQL_SQL92_VALUE_EXPRESSIONS = 165
+    SQL_STANDARD_CLI_CONFORMANCE = 166
+    SQL_STATIC_CURSOR_ATTRIBUTES1 = 167
+    SQL_STATIC_CURSOR_ATTRIBUTES2 = 168
+    SQL_AGGREGATE_FUNCTIONS = 169
+    SQL_DDL_INDEX = 170
+    SQL_DM_VER = 171
+    SQL_INSERT_STATEMENT = 172
+    SQL_CONVERT_GUID = 173
+    SQL_XOPEN_CLI_YEAR = 10000
+    SQL_CURSOR_SENSITIVITY = 10001
+    SQL_DESCRIBE_PARAMETER = 10002
+    SQL_CATALOG_NAME = 10003
+    SQL_COLLATION_SEQ = 10004
+    SQL_MAX_IDENTIFIER_LEN = 10005
+    SQL_ASYNC_MODE = 10021
+    SQL_MAX_ASYNC_CONCURRENT_STATEMENTS = 10022
+    SQL_ASYNC_DBC_FUNCTIONS = 10023
+    SQL_DRIVER_AWARE_POOLING_SUPPORTED = 10024
+    SQL_ASYNC_NOTIFICATION = 10025
 
 
 class SqlColumnAttrType(Enum):
@@ -145,3 +368,80 @@ class SqlFetchType(Enum):
 
 class LengthOrIndicatorType(Enum):
     SQL_NULL_DATA = -1
+    SQL_NO_TOTAL = -4
+
+
+class CDataType(Enum):
+    """C data types used to describe application buffers to the driver.
+
+    https://learn.microsoft.com/en-us/sql/odbc/reference/appendixes/c-data-types
+    """
+
+    SQL_C_SBIGINT = -25
+    SQL_C_SLONG = -16
+    SQL_C_SSHORT = -15
+    SQL_C_GUID = -11
+    SQL_C_WCHAR = -8
+    SQL_C_BIT = -7
+    SQL_C_BINARY = -2
+    SQL_C_CHAR = 1
+    SQL_C_FLOAT = 7
+    SQL_C_DOUBLE = 8
+    SQL_C_TYPE_DATE = 91
+    SQL_C_TYPE_TIME = 92
+    SQL_C_TYPE_TIMESTAMP = 93
+    SQL_C_DEFAULT = 99
+
+
+class StatementAttributeType(Enum):
+    """Enumeration of ODBC statement attribute types.
+
+    https://learn.microsoft.com/en-us/sql/odbc/reference/syntax/sqlsetstmtattr-function
+    """
+
+    SQL_ATTR_ASYNC_ENABLE = 4
+    SQL_ATTR_ROW_BIND_TYPE = 5
+    SQL_ATTR_PARAM_BIND_TYPE = 18
+    SQL_ATTR_PARAM_STATUS_PTR = 20
+    SQL_ATTR_PARAMS_PROCESSED_PTR = 21
+    SQL_ATTR_PARAMSET_SIZE = 22
+    SQL_ATTR_ROW_STATUS_PTR = 25
+    SQL_ATTR_ROWS_FETCHED_PTR = 26
+    SQL_ATTR_ROW_ARRAY_SIZE = 27
+
+
+class InputOutputType(Enum):
+    """The type of a parameter bound with SQLBindParameter."""
+
+    SQL_PARAM_INPUT = 1
+
+
+class ParameterStatus(Enum):
+    """The status of a set of parameters executed as part of an array, as returned in the SQL_ATTR_PARAM_STATUS_PTR
+    array.
+
+    https://learn.microsoft.com/en-us/sql/odbc/reference/syntax/sqlsetstmtattr-function#sql_attr_param_status_ptr
+    """
+
+    SQL_PARAM_SUCCESS = 0
+    SQL_PARAM_DIAG_UNAVAILABLE = 1
+    SQL_PARAM_ERROR = 5
+    SQL_PARAM_SUCCESS_WITH_INFO = 6
+    SQL_PARAM_UNUSED = 7
+
+
+class FunctionId(Enum):
+    """Identifiers of ODBC functions passed to SQLGetFunctions.
+
+    https://learn.microsoft.com/en-us/sql/odbc/reference/syntax/sqlgetfunctions-function
+    """
+
+    SQL_API_SQLDESCRIBEPARAM = 58
+
+
+class FreeStatementOption(Enum):
+    """Options accepted by SQLFreeStmt."""
+
+    SQL_CLOSE = 0
+    SQL_UNBIND = 2
+    SQL_RESET_PARAMS = 3
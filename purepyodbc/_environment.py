@@ -4,17 +4,32 @@ from collections.abc import Sequence
 
 from ._connection import Connection
 from ._driver_manager import DriverManager, detect_driver_manager
-from ._enums import HandleType, OdbcVersion
+from ._enums import ConnectionPooling, ConnectionPoolMatch, EnvironmentAttributeType, HandleType, OdbcVersion
 from ._handler import Handler
 
 
 class Environment(Handler):
+    """An ODBC environment, from which connections are allocated.
+
+    If `pooling` is set, the driver manager keeps the physical connections of closed connections and reuses them for
+    new connections with the same connection string and attributes. As this is a process-wide setting, it only takes
+    effect if it is set for the first environment allocated in the process.
+    """
+
     def __init__(self, driver_manager: DriverManager | None = None, pooling: bool = False) -> None:
         if driver_manager is None:
             driver_manager = detect_driver_manager()
         super().__init__(driver_manager)
+        if pooling:
+            self._driver_manager.sql_set_env_attr(
+                None, EnvironmentAttributeType.SQL_ATTR_CONNECTION_POOLING, ConnectionPooling.SQL_CP_ONE_PER_HENV.value
+            )
         self._driver_manager.allocate_environment(self)
         self._driver_manager.set_environment_odbc_version(self, OdbcVersion.SQL_OV_ODBC3_80)
+        if pooling:
+            self._driver_manager.sql_set_env_attr(
+                self, EnvironmentAttributeType.SQL_ATTR_CP_MATCH, ConnectionPoolMatch.SQL_CP_STRICT_MATCH.value
+            )
 
     def connection(
         self,
@@ -35,6 +50,8 @@ class Environment(Handler):
         # case we don't have to do anything).
         if not autocommit:
             connection.autocommit = autocommit
+        else:
+            connection._autocommit = autocommit
 
         self._driver_manager.sql_driver_connect(connection, connection_string, ansi=ansi)
         return connection
@@ -39,3 +39,42 @@ class ProgrammingError(DatabaseError):
 
 class NotSupportedError(DatabaseError):
     pass
+
+
+# The exceptions raised for SQLSTATEs, looked up by the whole SQLSTATE and then by its class (the first two
+# characters).
+SQLSTATE_ERRORS: dict[str, type[Error]] = {
+    "01002": OperationalError,
+    "08001": OperationalError,
+    "08003": OperationalError,
+    "08004": OperationalError,
+    "08007": OperationalError,
+    "08S01": OperationalError,
+    "0A000": NotSupportedError,
+    "28000": InterfaceError,
+    "40002": IntegrityError,
+    "HY001": OperationalError,
+    "HY008": OperationalError,
+    "HY014": OperationalError,
+    "HYC00": NotSupportedError,
+    "HYT00": OperationalError,
+    "HYT01": OperationalError,
+    "IM001": InterfaceError,
+    "IM002": InterfaceError,
+    "IM003": InterfaceError,
+}
+SQLSTATE_CLASS_ERRORS: dict[str, type[Error]] = {
+    "22": DataError,
+    "23": IntegrityError,
+    "24": ProgrammingError,
+    "25": ProgrammingError,
+    "42": ProgrammingError,
+}
+
+
+def error_for_sqlstate(sqlstate: str) -> type[Error]:
+    """Return the exception to raise for a SQLSTATE."""
+    error = SQLSTATE_ERRORS.get(sqlstate)
+    if error is None:
+        error = SQLSTATE_CLASS_ERRORS.get(sqlstate[:2], Error)
+    return error
@@ -18,6 +18,8 @@ class Handler:
     def __init__(self, driver_manager: DriverManager) -> None:
         self._closed = False
         self.handle = SQLHANDLE()
+        # The number of ODBC calls checked by DriverManager.check_success() while tracing is enabled.
+        self._odbc_calls = 0
         self._driver_manager: DriverManager = driver_manager
 
     def __enter__(self) -> Self:
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import typing
+from collections.abc import Generator
+
+from ._errors import ProgrammingError
+
+if typing.TYPE_CHECKING:
+    from ._cursor import Cursor
+
+T = typing.TypeVar("T")
+
+
+class Pending(typing.Generic[T]):
+    """An operation on a cursor which executes asynchronously (with SQL_ATTR_ASYNC_ENABLE), so that no thread waits
+    for it to complete.
+
+    poll() is called until it returns True, after which result() returns the result of the operation. Errors are raised
+    by the poll() which finds them. The cursor must not be used for anything else until the operation has completed.
+
+        pending = cursor.execute_async("select ...")
+        while not pending.poll():
+            ...  # Do something else, such as polling other operations.
+        pending.result()
+
+    Starting an operation raises NotSupportedError (HYC00) if the driver does not support asynchronous execution.
+    """
+
+    def __init__(self, cursor: Cursor, steps: Generator[None, None, T]) -> None:
+        self.cursor = cursor
+        # Each step calls the ODBC function again, and yields while it is still executing.
+        self.__steps = steps
+        self.__done = False
+        self.__result: T | None = None
+        self.__error: BaseException | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.__done
+
+    def poll(self) -> bool:
+        """Check whether the operation has completed, returning True if it has."""
+        if self.__done:
+            return True
+        try:
+            next(self.__steps)
+        except StopIteration as e:
+            self.__done = True
+            self.__result = e.value
+        except BaseException as e:
+            self.__done = True
+            self.__error = e
+            raise
+        return self.__done
+
+    def result(self) -> T:
+        """Return the result of the completed operation, or raise its error."""
+        if not self.__done:
+            raise ProgrammingError("The operation has not completed yet.")
+        if self.__error is not None:
+            raise self.__error
+        return typing.cast(T, self.__result)
+
+    def cancel(self) -> None:
+        """Cancel the operation with SQLCancel.
+
+        poll() must still be called until it returns True, which it does by raising an OperationalError if the
+        operation was cancelled before it completed.
+        """
+        if not self.__done:
+            self.cursor.cancel()
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import collections
+import threading
+import time
+import weakref
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ._connection import Connection
+from ._enums import CompletionType, ConnectionAttributeType, InfoType
+from ._errors import Error, OperationalError
+from ._typedef import SQLHANDLE
+
+if TYPE_CHECKING:
+    from ._driver_manager import DriverManager
+
+# The value of SQL_ATTR_CONNECTION_DEAD for a connection which has been lost.
+SQL_CD_TRUE = 1
+
+
+@dataclass(frozen=True)
+class PoolStatistics:
+    """A snapshot of the state and usage of a connection pool.
+
+    Wait times are in seconds.
+    """
+
+    max_size: int
+    idle: int
+    in_use: int
+    peak_in_use: int
+    checkouts: int
+    waits: int
+    timeouts: int
+    total_wait_time: float
+    max_wait_time: float
+    connections_created: int
+    connections_closed: int
+    connection_string: str = field(repr=False)
+
+    @property
+    def size(self) -> int:
+        """The number of open connections, idle or in use."""
+        return self.idle + self.in_use
+
+    @property
+    def saturation(self) -> float:
+        """The fraction of the pool's maximum size which is in use."""
+        return self.in_use / self.max_size if self.max_size else 1.0
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.total_wait_time / self.checkouts if self.checkouts else 0.0
+
+
+@dataclass
+class PooledConnection:
+    """A physical connection owned by a pool, which is lent to one Connection object at a time."""
+
+    pool: ConnectionPool
+    handle: SQLHANDLE
+    created: float
+    released: float = 0.0
+    # Incremented whenever the connection is lent or taken back, so that a lease can tell whether it is current.
+    lease: int = 0
+    # The values of the information types read from the connection, which are shared by the Connections it is lent to.
+    info: dict[InfoType, str | int | bool] = field(default_factory=dict)
+
+
+class ConnectionPool:
+    """A pool of connections opened with the same connection string and options.
+
+    Closing a connection checked out of the pool returns it to the pool (after a rollback), from which it is handed out
+    again wrapped in a new Connection object. Idle connections are reused most recently released first, and are closed
+    when they have been idle for longer than `idle_timeout` (keeping at least `min_idle` of them) or open for longer
+    than `max_lifetime`. Timeouts of None are unlimited. When connections are returned or closed, new ones are opened
+    until at least `min_idle` are idle again, as far as `max_size` allows.
+
+    At most `max_size` connections are open at once; checking out a connection waits up to `checkout_timeout` seconds
+    for one to be returned when they are all in use.
+    """
+
+    def __init__(
+        self,
+        driver_manager: DriverManager,
+        factory: Callable[[], Connection],
+        connection_string: str,
+        autocommit: bool = False,
+        max_size: int = 10,
+        min_idle: int = 0,
+        idle_timeout: float | None = 600.0,
+        max_lifetime: float | None = 1800.0,
+        checkout_timeout: float | None = 30.0,
+    ) -> None:
+        self._driver_manager = driver_manager
+        self.__factory = factory
+        self.__connection_string = connection_string
+        self.autocommit = autocommit
+        self.max_size = max_size
+        self.min_idle = min_idle
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.checkout_timeout = checkout_timeout
+
+        self.__closed = False
+        self.__condition = threading.Condition()
+        self.__idle: collections.deque[PooledConnection] = collections.deque()
+        self.__in_use = 0
+        # Connections being opened to top the pool up to min_idle, which count towards its size.
+        self.__opening = 0
+        self.__peak_in_use = 0
+        self.__checkouts = 0
+        self.__waits = 0
+        self.__timeouts = 0
+        self.__total_wait_time = 0.0
+        self.__max_wait_time = 0.0
+        self.__connections_created = 0
+        self.__connections_closed = 0
+
+        for _ in range(min(min_idle, max_size)):
+            now = time.monotonic()
+            self.__idle.append(PooledConnection(self, self.__create().handle, created=now, released=now))
+
+    def checkout(self) -> Connection:
+        """Return an idle connection, opening a new one if there is none and the pool is not full."""
+        while True:
+            pooled = self.__reserve()
+            if pooled is None:
+                try:
+                    connection = self.__create()
+                except BaseException:
+                    self.__unreserve()
+                    raise
+                now = time.monotonic()
+                self.__track(connection, PooledConnection(self, connection.handle, created=now, released=now))
+                return connection
+
+            connection = self.__lend(pooled)
+            if self.__is_alive(connection):
+                return connection
+            # The connection was lost while it was idle, so discard it and try again.
+            connection._pooled = None
+            pooled.lease += 1
+            self.__unreserve()
+            self.__discard(pooled)
+
+    def release(self, connection: Connection, reusable: bool = True) -> None:
+        """Take back the physical connection of a Connection object which has been rolled back, which can no longer be
+        used.
+
+        The physical connection is closed instead if it is not `reusable`, or has reached its maximum lifetime.
+        """
+        pooled = connection._pooled
+        assert pooled is not None and pooled.pool is self
+        connection._pooled = None
+        connection.handle = SQLHANDLE()
+        pooled.lease += 1
+
+        now = time.monotonic()
+        pooled.released = now
+        with self.__condition:
+            if self.__closed or (self.max_lifetime is not None and now - pooled.created > self.max_lifetime):
+                reusable = False
+            self.__in_use -= 1
+            if reusable:
+                self.__idle.append(pooled)
+            evicted = self.__evict_idle(now)
+            self.__condition.notify()
+
+        if not reusable:
+            evicted.append(pooled)
+        for x in evicted:
+            self.__discard(x)
+        self.__top_up()
+
+    def close(self) -> None:
+        """Close all idle connections. Connections in use are closed when they are returned."""
+        with self.__condition:
+            idle = list(self.__idle)
+            self.__idle.clear()
+            self.__closed = True
+        for pooled in idle:
+            self.__discard(pooled)
+
+    def statistics(self) -> PoolStatistics:
+        with self.__condition:
+            return PoolStatistics(
+                max_size=self.max_size,
+                idle=len(self.__idle),
+                in_use=self.__in_use,
+                peak_in_use=self.__peak_in_use,
+                checkouts=self.__checkouts,
+                waits=self.__waits,
+                timeouts=self.__timeouts,
+                total_wait_time=self.__total_wait_time,
+                max_wait_time=self.__max_wait_time,
+                connections_created=self.__connections_created,
+                connections_closed=self.__connections_closed,
+                connection_string=self.__connection_string,
+            )
+
+    def __reserve(self) -> PooledConnection | None:
+        """Reserve a place in the pool, returning an idle connection to fill it with if there is one, or None if a new
+        connection must be opened.
+
+        Waits for a connection to be returned if the pool is full.
+        """
+        start = time.monotonic()
+        deadline = None if self.checkout_timeout is None else start + self.checkout_timeout
+        waited = False
+        evicted: list[PooledConnection] = []
+        with self.__condition:
+            while True:
+                now = time.monotonic()
+                evicted.extend(self.__evict_idle(now))
+                if self.__idle or self.__in_use + len(self.__idle) + self.__opening < self.max_size:
+                    break
+                if deadline is not None and now >= deadline:
+                    self.__timeouts += 1
+                    raise OperationalError(
+                        f"Timed out after {self.checkout_timeout} seconds waiting for a connection from the pool."
+                    )
+                if not waited:
+                    waited = True
+                    self.__waits += 1
+                self.__condition.wait(None if deadline is None else deadline - now)
+
+            pooled = self.__idle.pop() if self.__idle else None
+            self.__in_use += 1
+            self.__peak_in_use = max(self.__peak_in_use, self.__in_use)
+            wait_time = time.monotonic() - start
+            self.__checkouts += 1
+            self.__total_wait_time += wait_time
+            self.__max_wait_time = max(self.__max_wait_time, wait_time)
+
+        for x in evicted:
+            self.__discard(x)
+        if evicted:
+            self.__top_up()
+        return pooled
+
+    def __unreserve(self) -> None:
+        with self.__condition:
+            self.__in_use -= 1
+            self.__condition.notify()
+
+    def __evict_idle(self, now: float) -> list[PooledConnection]:
+        """Remove the idle connections which have been idle or open for too long, and return them."""
+        evicted = []
+        for pooled in list(self.__idle):
+            if self.max_lifetime is not None and now - pooled.created > self.max_lifetime:
+                evicted.append(pooled)
+        # The least recently released connections are at the left.
+        while len(self.__idle) - len(evicted) > self.min_idle and self.idle_timeout is not None:
+            oldest = next(x for x in self.__idle if x not in evicted)
+            if now - oldest.released <= self.idle_timeout:
+                break
+            evicted.append(oldest)
+        for pooled in evicted:
+            self.__idle.remove(pooled)
+        return evicted
+
+    def __top_up(self) -> None:
+        """Open connections until at least `min_idle` are idle, or the pool is full.
+
+        Stops at the first connection which fails to open, so that returning a connection does not raise when the
+        database cannot be reached. The next checkout raises instead.
+        """
+        while True:
+            with self.__condition:
+                size = self.__in_use + len(self.__idle) + self.__opening
+                if self.__closed or len(self.__idle) + self.__opening >= self.min_idle or size >= self.max_size:
+                    return
+                self.__opening += 1
+            try:
+                connection = self.__create()
+            except Error:
+                with self.__condition:
+                    self.__opening -= 1
+                    self.__condition.notify()
+                return
+
+            now = time.monotonic()
+            pooled = PooledConnection(self, connection.handle, created=now, released=now)
+            with self.__condition:
+                self.__opening -= 1
+                closed = self.__closed
+                if not closed:
+                    self.__idle.append(pooled)
+                self.__condition.notify()
+            if closed:
+                self.__discard(pooled)
+                return
+
+    def __create(self) -> Connection:
+        connection = self.__factory()
+        with self.__condition:
+            self.__connections_created += 1
+        return connection
+
+    def __lend(self, pooled: PooledConnection) -> Connection:
+        connection = Connection(self._driver_manager)
+        connection.handle = pooled.handle
+        # Connections are only returned to the pool in its autocommit mode.
+        connection._autocommit = self.autocommit
+        self.__track(connection, pooled)
+        return connection
+
+    def __track(self, connection: Connection, pooled: PooledConnection) -> None:
+        connection._pooled = pooled
+        connection._info = pooled.info
+        pooled.lease += 1
+        # A connection which is never closed is closed (rather than returned) when it is garbage collected, so that
+        # its place in the pool is not lost.
+        weakref.finalize(connection, self.__abandon, pooled, pooled.lease)
+
+    def __abandon(self, pooled: PooledConnection, lease: int) -> None:
+        if pooled.lease == lease:
+            self.__unreserve()
+            self.__discard(pooled)
+
+    def __is_alive(self, connection: Connection) -> bool:
+        try:
+            dead = self._driver_manager.sql_get_connect_attr(
+                connection, ConnectionAttributeType.SQL_ATTR_CONNECTION_DEAD
+            )
+        except Error:
+            # The driver can't tell, so assume the connection is alive.
+            return True
+        return dead != SQL_CD_TRUE
+
+    def __discard(self, pooled: PooledConnection) -> None:
+        """Close a physical connection, which may have been lost or abandoned in a transaction."""
+        connection = Connection(self._driver_manager)
+        connection.handle = pooled.handle
+        steps: list[Callable[[], None]] = [
+            lambda: self._driver_manager.sql_end_tran(connection, CompletionType.SQL_ROLLBACK),
+            lambda: self._driver_manager.sql_disconnect(connection),
+            lambda: self._driver_manager.sql_free_handle(connection),
+        ]
+        for close in steps:
+            try:
+                close()
+            except Error:
+                pass
+        with self.__condition:
+            self.__connections_closed += 1
+
+
+_pools: dict[Hashable, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key: Hashable, create: Callable[[], ConnectionPool]) -> ConnectionPool:
+    """Return the pool for a connection string and options, creating it if there is none yet."""
+    with _pools_lock:
+        pool = _pools.get(key)
+    if pool is None:
+        # Created outside the lock, as filling the pool to its minimum idle size opens connections.
+        new_pool = create()
+        with _pools_lock:
+            pool = _pools.setdefault(key, new_pool)
+        if pool is not new_pool:
+            new_pool.close()
+    return pool
+
+
+def get_pool_statistics() -> list[PoolStatistics]:
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [x.statistics() for x in pools]
+
+
+def close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
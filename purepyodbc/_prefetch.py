@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import collections
+import threading
+import typing
+from dataclasses import dataclass, field
+
+from ._row import Row
+from ._statistics import ExecutionStatistics
+
+
+@dataclass
+class PrefetchedBlock:
+    """A block of rows fetched by the helper thread, and the time spent and bytes read fetching it, which the caller
+    adds to the cursor's statistics when it takes the block."""
+
+    rows: list[Row]
+    totals: ExecutionStatistics = field(default_factory=ExecutionStatistics)
+
+
+class Prefetcher:
+    """Fetches blocks of rows on a helper thread, up to `blocks` blocks ahead of the caller, so that the fetching (in
+    which ctypes releases the GIL) overlaps with the caller's processing of the rows.
+
+    The helper thread waits while `blocks` blocks are waiting to be taken. An error raised by a fetch is raised by the
+    get() which reaches it, after the blocks fetched before it. The helper thread exits at the end of the result set,
+    after an error, or when stop() is called, and the statement must not be used by any other thread until it has.
+
+    `fetch` runs on the helper thread, so it only fetches and converts rows. It leaves the cursor's state, statistics
+    and callbacks to the caller.
+    """
+
+    def __init__(self, fetch: typing.Callable[[], PrefetchedBlock], blocks: int) -> None:
+        self.__fetch = fetch
+        self.__blocks = blocks
+        # The blocks fetched and not yet taken, followed by an empty block at the end of the result set or the error
+        # which ended it.
+        self.__queue: collections.deque[PrefetchedBlock | BaseException] = collections.deque()
+        self.__condition = threading.Condition()
+        self.__stopping = False
+        self.__thread = threading.Thread(target=self.__run, name="purepyodbc-prefetch", daemon=True)
+        self.__thread.start()
+
+    def __run(self) -> None:
+        while True:
+            block: PrefetchedBlock | BaseException
+            try:
+                block = self.__fetch()
+            except BaseException as e:
+                block = e
+            with self.__condition:
+                self.__queue.append(block)
+                self.__condition.notify_all()
+                if not isinstance(block, PrefetchedBlock) or not block.rows:
+                    return
+                while len(self.__queue) >= self.__blocks and not self.__stopping:
+                    self.__condition.wait()
+                if self.__stopping:
+                    return
+
+    def get(self) -> PrefetchedBlock:
+        """Take the next block of rows, waiting for it to be fetched, or return an empty block at the end of the result
+        set (or after an error has been raised)."""
+        with self.__condition:
+            while not self.__queue:
+                self.__condition.wait()
+            block = self.__queue[0]
+            if isinstance(block, PrefetchedBlock) and block.rows:
+                self.__queue.popleft()
+                self.__condition.notify_all()
+                return block
+        # The helper thread has exited, or is about to. The block which ended the result set is only taken once, so
+        # that its statistics are only added once.
+        self.__thread.join()
+        self.__queue[0] = PrefetchedBlock([])
+        if isinstance(block, BaseException):
+            raise block
+        return block
+
+    def stop(self) -> tuple[list[PrefetchedBlock], BaseException | None]:
+        """Stop fetching, waiting for any fetch in progress to finish, and return the blocks fetched but not taken, and
+        the error which followed them, if any."""
+        with self.__condition:
+            self.__stopping = True
+            self.__condition.notify_all()
+        self.__thread.join()
+        blocks: list[PrefetchedBlock] = []
+        error = None
+        for block in self.__queue:
+            if isinstance(block, BaseException):
+                error = block
+            else:
+                blocks.append(block)
+        self.__queue.clear()
+        return blocks, error
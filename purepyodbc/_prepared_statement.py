@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+from ._catalog_cache import is_ddl
+from ._dto import ParameterDescription, SqlColumnDescription
+from ._enums import FunctionId, HandleType
+from ._handler import Handler
+
+if TYPE_CHECKING:
+    from ._connection import Connection
+
+DEFAULT_STATEMENT_CACHE_SIZE = 32
+
+
+class PreparedStatement(Handler):
+    """A statement handle on which a SQL statement has been prepared with SQLPrepare, so that it can be executed
+    repeatedly with different parameter values.
+
+    Descriptions of its parameters and result set columns are kept with it, so that they are only requested from the
+    driver once.
+    """
+
+    def __init__(self, connection: Connection, sql: str) -> None:
+        super().__init__(connection._driver_manager)
+        self.connection = connection
+        self.sql = sql
+        # The first result set's column descriptions, which may depend on the types of the parameters (as in
+        # "select ?"), keyed by those and any other settings that they depend on.
+        self.column_descriptions: dict[Hashable, tuple[SqlColumnDescription, ...]] = {}
+        # The number of DDL statements which the connection had executed when this was prepared.
+        self.generation = 0
+        self.__parameter_descriptions: dict[int, ParameterDescription | None] = {}
+        self._driver_manager.allocate_statement(self)
+        try:
+            self._driver_manager.sql_prepare(self)
+            self.parameter_count = self._driver_manager.sql_num_params(self)
+        except Exception:
+            self.close()
+            raise
+
+    @property
+    def handle_type(self) -> HandleType:
+        return HandleType.SQL_HANDLE_STMT
+
+    def describe_parameter(self, parameter_number: int) -> ParameterDescription | None:
+        """Return the description of a parameter, or None if the driver cannot describe it."""
+        if parameter_number not in self.__parameter_descriptions:
+            description = None
+            if self.connection._supports(FunctionId.SQL_API_SQLDESCRIBEPARAM):
+                description = self._driver_manager.sql_describe_param(self, parameter_number)
+            self.__parameter_descriptions[parameter_number] = description
+        return self.__parameter_descriptions[parameter_number]
+
+
+class StatementCache:
+    """A least recently used cache of the statements prepared on a connection, keyed by their SQL text.
+
+    A statement is checked out of the cache by the cursor which executes it, and checked back in when the cursor is
+    done with it, so that a cached statement is never used by two cursors at once.
+
+    When the connection executes a statement which looks like DDL, all statements prepared before it are freed rather
+    than reused, as the columns of their result sets (which are kept with them) may have changed.
+    """
+
+    def __init__(self, connection: Connection, maxsize: int = DEFAULT_STATEMENT_CACHE_SIZE) -> None:
+        self.connection = connection
+        self.__maxsize = maxsize
+        self.__statements: OrderedDict[str, PreparedStatement] = OrderedDict()
+        self.__generation = 0
+
+    def __len__(self) -> int:
+        return len(self.__statements)
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of statements kept prepared. Zero disables the cache."""
+        return self.__maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        self.__maxsize = maxsize
+        self.__evict()
+
+    def checkout(self, sql: str) -> PreparedStatement:
+        """Take the statement prepared for `sql` out of the cache, preparing it if it is not cached."""
+        statement = self.__statements.pop(sql, None)
+        if statement is None:
+            statement = PreparedStatement(self.connection, sql)
+            statement.generation = self.__generation
+        return statement
+
+    def checkin(self, statement: PreparedStatement) -> None:
+        """Return a statement to the cache, as the most recently used one."""
+        if statement.generation != self.__generation or statement.sql in self.__statements:
+            # DDL was executed, or another cursor prepared the same statement, in the meantime.
+            statement.close()
+            return
+        self.__statements[statement.sql] = statement
+        self.__evict()
+
+    def executed(self, sql: str) -> None:
+        """Free all cached statements, and those checked out when they are checked in, if `sql`, which the connection
+        is executing, looks like DDL."""
+        if is_ddl(sql):
+            self.__generation += 1
+            self.clear()
+
+    def clear(self) -> None:
+        """Free all cached statements."""
+        while self.__statements:
+            _, statement = self.__statements.popitem()
+            statement.close()
+
+    def __evict(self) -> None:
+        while len(self.__statements) > max(self.__maxsize, 0):
+            _, statement = self.__statements.popitem(last=False)
+            statement.close()
@@ -0,0 +1,132 @@
+"""This module is more or less a transcription of the function prototypes in sql.h, sqlext.h and sqlucode.h."""
+
+from __future__ import annotations
+
+from ._typedef import (
+    SQLHANDLE,
+    SQLHDBC,
+    SQLHDESC,
+    SQLHENV,
+    SQLHSTMT,
+    SQLHWND,
+    SQLINTEGER,
+    SQLLEN,
+    SQLPOINTER,
+    SQLRETURN,
+    SQLSMALLINT,
+    SQLULEN,
+    SQLUSMALLINT,
+)
+
+# Pointer arguments (to strings, buffers and output values) are all declared as SQLPOINTER. Strings are passed as
+# arrays of either SQLCHAR or SQLWCHAR (whose size depends on the driver manager), and ctypes converts arguments to a
+# plain pointer type faster than to a typed one. The integer arguments are declared with their exact types, so that
+# (for example) a SQLLEN argument is passed as a 64-bit value on 64-bit platforms.
+_STRING = (SQLPOINTER, SQLSMALLINT)
+_INTEGER_STRING = (SQLPOINTER, SQLINTEGER)
+
+RESTYPE = SQLRETURN
+
+ARGTYPES: dict[str, tuple[type, ...]] = {
+    "SQLAllocHandle": (SQLSMALLINT, SQLHANDLE, SQLPOINTER),
+    "SQLBindCol": (SQLHSTMT, SQLUSMALLINT, SQLSMALLINT, SQLPOINTER, SQLLEN, SQLPOINTER),
+    "SQLBindParameter": (
+        SQLHSTMT,
+        SQLUSMALLINT,
+        SQLSMALLINT,
+        SQLSMALLINT,
+        SQLSMALLINT,
+        SQLULEN,
+        SQLSMALLINT,
+        SQLPOINTER,
+        SQLLEN,
+        SQLPOINTER,
+    ),
+    "SQLBrowseConnect": (SQLHDBC, *_STRING, SQLPOINTER, SQLSMALLINT, SQLPOINTER),
+    "SQLBrowseConnectW": (SQLHDBC, *_STRING, SQLPOINTER, SQLSMALLINT, SQLPOINTER),
+    "SQLCancel": (SQLHSTMT,),
+    "SQLCloseCursor": (SQLHSTMT,),
+    "SQLColAttribute": (SQLHSTMT, SQLUSMALLINT, SQLUSMALLINT, SQLPOINTER, SQLSMALLINT, SQLPOINTER, SQLPOINTER),
+    "SQLColAttributeW": (SQLHSTMT, SQLUSMALLINT, SQLUSMALLINT, SQLPOINTER, SQLSMALLINT, SQLPOINTER, SQLPOINTER),
+    "SQLColAttributes": (SQLHSTMT, SQLUSMALLINT, SQLUSMALLINT, SQLPOINTER, SQLSMALLINT, SQLPOINTER, SQLPOINTER),
+    "SQLColAttributesW": (SQLHSTMT, SQLUSMALLINT, SQLUSMALLINT, SQLPOINTER, SQLSMALLINT, SQLPOINTER, SQLPOINTER),
+    "SQLColumns": (SQLHSTMT, *(_STRING * 4)),
+    "SQLColumnsW": (SQLHSTMT, *(_STRING * 4)),
+    "SQLConnect": (SQLHDBC, *(_STRING * 3)),
+    "SQLConnectW": (SQLHDBC, *(_STRING * 3)),
+    "SQLDataSources": (SQLHENV, SQLUSMALLINT, *((SQLPOINTER, SQLSMALLINT, SQLPOINTER) * 2)),
+    "SQLDataSourcesW": (SQLHENV, SQLUSMALLINT, *((SQLPOINTER, SQLSMALLINT, SQLPOINTER) * 2)),
+    "SQLDescribeCol": (SQLHSTMT, SQLUSMALLINT, SQLPOINTER, SQLSMALLINT, *((SQLPOINTER,) * 5)),
+    "SQLDescribeColW": (SQLHSTMT, SQLUSMALLINT, SQLPOINTER, SQLSMALLINT, *((SQLPOINTER,) * 5)),
+    "SQLDescribeParam": (SQLHSTMT, SQLUSMALLINT, *((SQLPOINTER,) * 4)),
+    "SQLDisconnect": (SQLHDBC,),
+    "SQLDriverConnect": (SQLHDBC, SQLHWND, *_STRING, SQLPOINTER, SQLSMALLINT, SQLPOINTER, SQLUSMALLINT),
+    "SQLDriverConnectW": (SQLHDBC, SQLHWND, *_STRING, SQLPOINTER, SQLSMALLINT, SQLPOINTER, SQLUSMALLINT),
+    "SQLDrivers": (SQLHENV, SQLUSMALLINT, *((SQLPOINTER, SQLSMALLINT, SQLPOINTER) * 2)),
+    "SQLDriversW": (SQLHENV, SQLUSMALLINT, *((SQLPOINTER, SQLSMALLINT, SQLPOINTER) * 2)),
+    "SQLEndTran": (SQLSMALLINT, SQLHANDLE, SQLSMALLINT),
+    "SQLExecDirect": (SQLHSTMT, *_INTEGER_STRING),
+    "SQLExecDirectW": (SQLHSTMT, *_INTEGER_STRING),
+    "SQLExecute": (SQLHSTMT,),
+    "SQLFetch": (SQLHSTMT,),
+    "SQLFetchScroll": (SQLHSTMT, SQLSMALLINT, SQLLEN),
+    "SQLForeignKeys": (SQLHSTMT, *(_STRING * 6)),
+    "SQLForeignKeysW": (SQLHSTMT, *(_STRING * 6)),
+    "SQLFreeHandle": (SQLSMALLINT, SQLHANDLE),
+    "SQLFreeStmt": (SQLHSTMT, SQLUSMALLINT),
+    "SQLGetConnectAttr": (SQLHDBC, SQLINTEGER, SQLPOINTER, SQLINTEGER, SQLPOINTER),
+    "SQLGetConnectAttrW": (SQLHDBC, SQLINTEGER, SQLPOINTER, SQLINTEGER, SQLPOINTER),
+    "SQLGetConnectOption": (SQLHDBC, SQLUSMALLINT, SQLPOINTER),
+    "SQLGetConnectOptionW": (SQLHDBC, SQLUSMALLINT, SQLPOINTER),
+    "SQLGetCursorName": (SQLHSTMT, SQLPOINTER, SQLSMALLINT, SQLPOINTER),
+    "SQLGetCursorNameW": (SQLHSTMT, SQLPOINTER, SQLSMALLINT, SQLPOINTER),
+    "SQLGetData": (SQLHSTMT, SQLUSMALLINT, SQLSMALLINT, SQLPOINTER, SQLLEN, SQLPOINTER),
+    "SQLGetDescField": (SQLHDESC, SQLSMALLINT, SQLSMALLINT, SQLPOINTER, SQLINTEGER, SQLPOINTER),
+    "SQLGetDescFieldW": (SQLHDESC, SQLSMALLINT, SQLSMALLINT, SQLPOINTER, SQLINTEGER, SQLPOINTER),
+    "SQLGetDescRec": (SQLHDESC, SQLSMALLINT, SQLPOINTER, SQLSMALLINT, *((SQLPOINTER,) * 7)),
+    "SQLGetDescRecW": (SQLHDESC, SQLSMALLINT, SQLPOINTER, SQLSMALLINT, *((SQLPOINTER,) * 7)),
+    "SQLGetDiagField": (SQLSMALLINT, SQLHANDLE, SQLSMALLINT, SQLSMALLINT, SQLPOINTER, SQLSMALLINT, SQLPOINTER),
+    "SQLGetDiagFieldW": (SQLSMALLINT, SQLHANDLE, SQLSMALLINT, SQLSMALLINT, SQLPOINTER, SQLSMALLINT, SQLPOINTER),
+    "SQLGetDiagRec": (SQLSMALLINT, SQLHANDLE, SQLSMALLINT, *((SQLPOINTER,) * 3), SQLSMALLINT, SQLPOINTER),
+    "SQLGetDiagRecW": (SQLSMALLINT, SQLHANDLE, SQLSMALLINT, *((SQLPOINTER,) * 3), SQLSMALLINT, SQLPOINTER),
+    "SQLGetFunctions": (SQLHDBC, SQLUSMALLINT, SQLPOINTER),
+    "SQLGetInfo": (SQLHDBC, SQLUSMALLINT, SQLPOINTER, SQLSMALLINT, SQLPOINTER),
+    "SQLGetInfoW": (SQLHDBC, SQLUSMALLINT, SQLPOINTER, SQLSMALLINT, SQLPOINTER),
+    "SQLGetStmtAttr": (SQLHSTMT, SQLINTEGER, SQLPOINTER, SQLINTEGER, SQLPOINTER),
+    "SQLGetStmtAttrW": (SQLHSTMT, SQLINTEGER, SQLPOINTER, SQLINTEGER, SQLPOINTER),
+    "SQLGetTypeInfo": (SQLHSTMT, SQLSMALLINT),
+    "SQLGetTypeInfoW": (SQLHSTMT, SQLSMALLINT),
+    "SQLMoreResults": (SQLHSTMT,),
+    "SQLNativeSql": (SQLHDBC, *_INTEGER_STRING, SQLPOINTER, SQLINTEGER, SQLPOINTER),
+    "SQLNativeSqlW": (SQLHDBC, *_INTEGER_STRING, SQLPOINTER, SQLINTEGER, SQLPOINTER),
+    "SQLNumParams": (SQLHSTMT, SQLPOINTER),
+    "SQLNumResultCols": (SQLHSTMT, SQLPOINTER),
+    "SQLPrepare": (SQLHSTMT, *_INTEGER_STRING),
+    "SQLPrepareW": (SQLHSTMT, *_INTEGER_STRING),
+    "SQLPrimaryKeys": (SQLHSTMT, *(_STRING * 3)),
+    "SQLPrimaryKeysW": (SQLHSTMT, *(_STRING * 3)),
+    "SQLProcedureColumns": (SQLHSTMT, *(_STRING * 4)),
+    "SQLProcedureColumnsW": (SQLHSTMT, *(_STRING * 4)),
+    "SQLProcedures": (SQLHSTMT, *(_STRING * 3)),
+    "SQLProceduresW": (SQLHSTMT, *(_STRING * 3)),
+    "SQLRowCount": (SQLHSTMT, SQLPOINTER),
+    "SQLSetConnectAttr": (SQLHDBC, SQLINTEGER, SQLPOINTER, SQLINTEGER),
+    "SQLSetConnectAttrW": (SQLHDBC, SQLINTEGER, SQLPOINTER, SQLINTEGER),
+    "SQLSetConnectOption": (SQLHDBC, SQLUSMALLINT, SQLULEN),
+    "SQLSetConnectOptionW": (SQLHDBC, SQLUSMALLINT, SQLULEN),
+    "SQLSetCursorName": (SQLHSTMT, *_STRING),
+    "SQLSetCursorNameW": (SQLHSTMT, *_STRING),
+    "SQLSetDescField": (SQLHDESC, SQLSMALLINT, SQLSMALLINT, SQLPOINTER, SQLINTEGER),
+    "SQLSetDescFieldW": (SQLHDESC, SQLSMALLINT, SQLSMALLINT, SQLPOINTER, SQLINTEGER),
+    "SQLSetEnvAttr": (SQLHENV, SQLINTEGER, SQLPOINTER, SQLINTEGER),
+    "SQLSetStmtAttr": (SQLHSTMT, SQLINTEGER, SQLPOINTER, SQLINTEGER),
+    "SQLSetStmtAttrW": (SQLHSTMT, SQLINTEGER, SQLPOINTER, SQLINTEGER),
+    "SQLSpecialColumns": (SQLHSTMT, SQLUSMALLINT, *(_STRING * 3), SQLUSMALLINT, SQLUSMALLINT),
+    "SQLSpecialColumnsW": (SQLHSTMT, SQLUSMALLINT, *(_STRING * 3), SQLUSMALLINT, SQLUSMALLINT),
+    "SQLStatistics": (SQLHSTMT, *(_STRING * 3), SQLUSMALLINT, SQLUSMALLINT),
+    "SQLStatisticsW": (SQLHSTMT, *(_STRING * 3), SQLUSMALLINT, SQLUSMALLINT),
+    "SQLTablePrivileges": (SQLHSTMT, *(_STRING * 3)),
+    "SQLTablePrivilegesW": (SQLHSTMT, *(_STRING * 3)),
+    "SQLTables": (SQLHSTMT, *(_STRING * 4)),
+    "SQLTablesW": (SQLHSTMT, *(_STRING * 4)),
+}
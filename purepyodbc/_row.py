@@ -1,11 +1,50 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from typing import Any
 
 
 class Row:
-    def __getitem__(self, key: int | str, /) -> Any:
-        if isinstance(key, int):
-            # TODO: Calling list() here is... yeesh
-            return list(self.__dict__.values())[key]
-        return self.__dict__[key]
+    """A row of a result set, whose values can be accessed by index or by column name (as an item or an attribute).
+
+    The values are held in a tuple, and the mapping of column names to indexes is shared by all rows of a result set.
+    """
+
+    __slots__ = ("_columns", "_values")
+
+    def __init__(self, columns: Mapping[str, int], values: tuple[Any, ...]) -> None:
+        self._columns = columns
+        self._values = values
+
+    def __getitem__(self, key: int | slice | str, /) -> Any:
+        if isinstance(key, str):
+            return self._values[self._columns[key]]
+        return self._values[key]
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails, which includes the slots of a row that has not been initialized yet
+        # (when it is copied or unpickled).
+        if name in Row.__slots__:
+            raise AttributeError(name)
+        try:
+            return self._values[self._columns[name]]
+        except KeyError:
+            raise AttributeError(f"'Row' object has no attribute {name!r}") from None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Row):
+            return self._values == other._values
+        if isinstance(other, tuple):
+            return self._values == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self._values)
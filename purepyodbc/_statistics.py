@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ExecutionStatistics:
+    """The time spent executing statements and fetching their results, and what was fetched.
+
+    Times are in seconds. The fetch time includes the conversion time, which is the time spent building Python objects
+    from the values fetched. The bytes fetched are the lengths of the (non-null) values the driver returned. The ODBC
+    calls are only counted while tracing is enabled (with purepyodbc.enable_tracing()), as counting them is not free.
+    """
+
+    execute_time: float = 0.0
+    fetch_time: float = 0.0
+    conversion_time: float = 0.0
+    rows_fetched: int = 0
+    bytes_fetched: int = 0
+    odbc_calls: int = 0
+
+    def _add(self, other: ExecutionStatistics, sign: int = 1) -> None:
+        """Add the times and counts of another, or subtract them given a sign of -1."""
+        self.execute_time += sign * other.execute_time
+        self.fetch_time += sign * other.fetch_time
+        self.conversion_time += sign * other.conversion_time
+        self.rows_fetched += sign * other.rows_fetched
+        self.bytes_fetched += sign * other.bytes_fetched
+        self.odbc_calls += sign * other.odbc_calls
+
+
+@dataclass
+class StatementStatistics(ExecutionStatistics):
+    """The statistics of the statement last executed by a cursor.
+
+    The first row time is the time from the start of the execution until the first row was fetched, or None if no row
+    has been fetched yet.
+    """
+
+    sql: str = ""
+    first_row_time: float | None = None
+
+    @property
+    def elapsed_time(self) -> float:
+        """The time spent executing the statement and fetching its results so far."""
+        return self.execute_time + self.fetch_time
+
+
+@dataclass
+class ConnectionStatistics(ExecutionStatistics):
+    """The statistics of all the statements executed by the cursors of a connection, including the number of
+    statements which reached the connection's slow statement threshold."""
+
+    statements: int = 0
+    slow_statements: int = 0
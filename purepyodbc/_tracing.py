@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import threading
+import time
+import typing
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from . import _constants
+
+# A function called before each ODBC call with the name of the ODBC function, which returns a function called after it
+# with its return code (or None if the call raised an exception), such as one which starts and ends a span.
+TraceHook = Callable[[str], Callable[[typing.Optional[int]], None]]
+
+# The return codes counted as errors.
+ERROR_RETURN_CODES = frozenset((_constants.SQL_ERROR, _constants.SQL_INVALID_HANDLE))
+
+
+@dataclass(frozen=True)
+class CallStatistics:
+    """A snapshot of the calls made to an ODBC function while tracing was enabled.
+
+    Times are in seconds, and include the time spent in the driver manager and the driver, but not the time spent
+    converting arguments and results in Python.
+    """
+
+    function: str
+    calls: int
+    errors: int
+    total_time: float
+    min_time: float
+    max_time: float
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+class _Counters:
+    __slots__ = ("calls", "errors", "total_time", "min_time", "max_time")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.min_time = float("inf")
+        self.max_time = 0.0
+
+
+class Tracer:
+    """Times the calls made to ODBC functions, counting the calls, errors and total, minimum and maximum times of each
+    function, and calls the hooks around each call."""
+
+    def __init__(self) -> None:
+        self.hooks: tuple[TraceHook, ...] = ()
+        self.__counters: dict[str, _Counters] = {}
+        self.__lock = threading.Lock()
+
+    def wrap(self, name: str, func: Callable[..., int]) -> Callable[..., int]:
+        """Return a function which calls the ODBC function `func`, named `name`, and traces the call."""
+        perf_counter = time.perf_counter
+
+        def call(*args: typing.Any) -> int:
+            hooks = self.hooks
+            ends = [hook(name) for hook in hooks] if hooks else None
+            start = perf_counter()
+            try:
+                return_code = func(*args)
+            except BaseException:
+                self.__record(name, perf_counter() - start, True)
+                if ends is not None:
+                    for end in ends:
+                        end(None)
+                raise
+            self.__record(name, perf_counter() - start, return_code in ERROR_RETURN_CODES)
+            if ends is not None:
+                for end in ends:
+                    end(return_code)
+            return return_code
+
+        return call
+
+    def __record(self, name: str, duration: float, error: bool) -> None:
+        with self.__lock:
+            counters = self.__counters.get(name)
+            if counters is None:
+                counters = self.__counters[name] = _Counters()
+            counters.calls += 1
+            counters.errors += error
+            counters.total_time += duration
+            if duration < counters.min_time:
+                counters.min_time = duration
+            if duration > counters.max_time:
+                counters.max_time = duration
+
+    def statistics(self) -> list[CallStatistics]:
+        """Return a snapshot of the calls made to each function, in order of function name."""
+        with self.__lock:
+            return [
+                CallStatistics(
+                    function=name,
+                    calls=x.calls,
+                    errors=x.errors,
+                    total_time=x.total_time,
+                    min_time=x.min_time,
+                    max_time=x.max_time,
+                )
+                for name, x in sorted(self.__counters.items())
+            ]
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__counters.clear()
+
+
+class TracedLibrary:
+    """Stands in for the driver manager's library while tracing is enabled, returning its functions wrapped by the
+    tracer."""
+
+    def __init__(self, library: typing.Any, tracer: Tracer) -> None:
+        self.__library = library
+        self.__tracer = tracer
+
+    def __getattr__(self, name: str) -> Callable[..., int]:
+        func = self.__tracer.wrap(name, getattr(self.__library, name))
+        # Later lookups find the wrapped function without calling __getattr__.
+        setattr(self, name, func)
+        return func
@@ -15,8 +15,9 @@ SQLDOUBLE = c.c_double
 SQLFLOAT = c.c_double
 SQLINTEGER = c.c_int
 SQLUINTEGER = c.c_uint
-SQLLEN = c.c_long
-SQLULEN = c.c_ulong
+# SQLLEN and SQLULEN are pointer sized (64-bit on Windows too, where a long is 32-bit).
+SQLLEN = c.c_ssize_t
+SQLULEN = c.c_size_t
 SQLSETPOSIROW = c.c_ulong
 SQLROWCOUNT = SQLULEN
 SQLROWSETSIZE = SQLULEN
@@ -0,0 +1,363 @@
+"""An asyncio API, in which the blocking ODBC calls run on a bounded pool of threads rather than in the event loop.
+
+Each connection is pinned to one thread, on which all of its calls (and those of its cursors) run one at a time, so
+that a connection is never used by two threads at once. Connections beyond `max_workers` share threads.
+
+    connection = await purepyodbc.aio.connect(connection_string)
+    async with connection:
+        cursor = await connection.cursor()
+        await cursor.execute("select ...")
+        async for row in cursor:
+            ...
+
+Cancelling a task which is waiting for an execute or fetch cancels the statement with SQLCancel.
+
+A cursor's description and rowcount are read from the driver on the worker thread when they are first needed, rather
+than after every execute: the description by the first fetch, or either of them by awaiting get_description() or
+get_rowcount(). Until then, the description and rowcount properties are None and -1.
+
+Connections opened with `native_async=True` execute and fetch with asynchronous execution enabled on the statement
+(SQL_ATTR_ASYNC_ENABLE), polling the driver from the worker thread until the call completes, rather than blocking the
+thread while it executes. This lets many statements be in flight on each thread, with drivers which support it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import typing
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import purepyodbc
+
+from ._connection import Connection
+from ._cursor import Cursor
+from ._dto import ColumnDescription
+from ._errors import Error
+from ._pending import Pending
+from ._row import Row
+from ._statistics import ConnectionStatistics, StatementStatistics
+
+T = typing.TypeVar("T")
+
+# The maximum number of threads which run the calls of async connections. This must be set before the first connection
+# is opened.
+max_workers: int = 32
+# The longest time between polls of a statement executing asynchronously, in seconds. The interval starts at a
+# millisecond and doubles after each poll up to this.
+max_poll_interval: float = 0.05
+
+
+class _Worker:
+    """A thread, which runs the calls of the connections pinned to it one at a time."""
+
+    def __init__(self, number: int) -> None:
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"purepyodbc-aio-{number}")
+        self.connections = 0
+
+    async def run(self, func: Callable[[], T], cancel: Callable[[], None] | None = None) -> T:
+        """Run a blocking call on the worker's thread.
+
+        If the awaiting task is cancelled while the call is running, `cancel` is called to make the call return early.
+        The cancellation is only propagated once the call has returned, so that the next call on the connection does
+        not run while it is still in use.
+        """
+        future = self.executor.submit(func)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A call which has not started yet is simply not run.
+            if not future.cancel():
+                if not future.done() and cancel is not None:
+                    try:
+                        cancel()
+                    except Error:
+                        pass
+                finished = asyncio.wrap_future(future)
+                await asyncio.wait([finished])
+                # The call's outcome (usually an error saying that it was cancelled) is discarded.
+                if not finished.cancelled():
+                    finished.exception()
+            raise
+
+
+class _Workers:
+    """A bounded pool of worker threads, to which connections are pinned."""
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self.__workers: list[_Worker] = []
+        self.__lock = threading.Lock()
+
+    def acquire(self) -> _Worker:
+        """Return the worker to pin a new connection to: an idle one, a new one if the pool is not full, or else the
+        one with the fewest connections."""
+        with self.__lock:
+            worker = min(self.__workers, key=lambda x: x.connections, default=None)
+            if (worker is None or worker.connections) and len(self.__workers) < self.max_workers:
+                worker = _Worker(len(self.__workers))
+                self.__workers.append(worker)
+            assert worker is not None
+            worker.connections += 1
+            return worker
+
+    def release(self, worker: _Worker) -> None:
+        with self.__lock:
+            worker.connections -= 1
+
+
+__workers: _Workers | None = None
+__workers_lock = threading.Lock()
+
+
+def __get_workers() -> _Workers:
+    global __workers
+    with __workers_lock:
+        if __workers is None:
+            __workers = _Workers(max_workers)
+        return __workers
+
+
+async def connect(
+    connection_string: str,
+    autocommit: bool = False,
+    ansi: bool = False,
+    timeout: int = 0,
+    readonly: bool = False,
+    attrs_before: dict[int, int | bytes | bytearray | str | Sequence[str]] | None = None,
+    encoding: str | None = None,
+    native_async: bool = False,
+) -> AsyncConnection:
+    """Open a connection (with purepyodbc.connect) on a worker thread.
+
+    If `native_async` is true, statements are executed with the driver's asynchronous execution instead of blocking
+    the worker thread.
+    """
+    workers = __get_workers()
+    worker = workers.acquire()
+    future: Future[Connection] = worker.executor.submit(
+        purepyodbc.connect, connection_string, autocommit, ansi, timeout, readonly, attrs_before, encoding
+    )
+
+    def close_connection(future: Future[Connection]) -> None:
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+
+    try:
+        connection = await asyncio.wrap_future(future)
+    except BaseException:
+        # The connection may still be opened if the task was cancelled, in which case it is closed on its thread.
+        future.add_done_callback(close_connection)
+        workers.release(worker)
+        raise
+    return AsyncConnection(connection, worker, workers, native_async)
+
+
+class AsyncConnection:
+    """A connection whose calls run on the worker thread it is pinned to."""
+
+    def __init__(self, connection: Connection, worker: _Worker, workers: _Workers, native_async: bool = False) -> None:
+        self.connection = connection
+        self.native_async = native_async
+        self.__worker = worker
+        self.__workers = workers
+        self.__released = False
+
+    async def __aenter__(self) -> AsyncConnection:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self.connection._closed
+
+    @property
+    def statistics(self) -> ConnectionStatistics:
+        return self.connection.statistics
+
+    async def _run(self, func: Callable[[], T], cancel: Callable[[], None] | None = None) -> T:
+        return await self.__worker.run(func, cancel)
+
+    async def cursor(self) -> AsyncCursor:
+        return AsyncCursor(self, await self._run(self.connection.cursor))
+
+    async def commit(self) -> None:
+        await self._run(self.connection.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self.connection.rollback)
+
+    async def close(self) -> None:
+        if self.__released:
+            return
+        try:
+            await self._run(self.connection.close)
+        finally:
+            self.__released = True
+            self.__workers.release(self.__worker)
+
+
+class AsyncCursor:
+    """A cursor whose calls run on its connection's worker thread.
+
+    Iterating over the cursor with `async for` fetches `iteration_size` rows per call to the worker thread.
+    """
+
+    def __init__(self, connection: AsyncConnection, cursor: Cursor) -> None:
+        self.connection = connection
+        self.cursor = cursor
+        # The description and rowcount of the result, once they have been read on the worker thread.
+        self.__description: Sequence[ColumnDescription] | None = None
+        self.__rowcount: int | None = None
+
+    async def __aenter__(self) -> AsyncCursor:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def __aiter__(self) -> AsyncIterator[Row]:
+        return self.__iterate()
+
+    async def __iterate(self) -> AsyncIterator[Row]:
+        while True:
+            rows = await self.fetchmany(max(self.iteration_size, self.arraysize))
+            if not rows:
+                return
+            for row in rows:
+                yield row
+
+    @property
+    def arraysize(self) -> int:
+        return self.cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self, arraysize: int) -> None:
+        self.cursor.arraysize = arraysize
+
+    @property
+    def iteration_size(self) -> int:
+        return self.cursor.iteration_size
+
+    @iteration_size.setter
+    def iteration_size(self, iteration_size: int) -> None:
+        self.cursor.iteration_size = iteration_size
+
+    @property
+    def description(self) -> Sequence[ColumnDescription] | None:
+        """The description of the result's columns, or None until it has been read by a fetch or get_description()."""
+        return self.__description
+
+    @property
+    def rowcount(self) -> int:
+        """The number of rows affected by the statement, or -1 until it has been read by get_rowcount()."""
+        return -1 if self.__rowcount is None else self.__rowcount
+
+    async def get_description(self) -> Sequence[ColumnDescription]:
+        """Return the description of the result's columns, reading it from the driver if it has not been yet."""
+        if self.__description is None:
+            self.__description = await self.connection._run(lambda: self.cursor.description)
+        return self.__description
+
+    async def get_rowcount(self) -> int:
+        """Return the number of rows affected by the statement, reading it from the driver if it has not been yet."""
+        if self.__rowcount is None:
+            self.__rowcount = await self.connection._run(lambda: self.cursor.rowcount)
+        return self.__rowcount
+
+    @property
+    def statistics(self) -> StatementStatistics:
+        return self.cursor.statistics
+
+    async def __run(self, func: Callable[[], T]) -> T:
+        return await self.connection._run(func, self.cursor.cancel)
+
+    async def __poll(self, start: Callable[[], Pending[T]]) -> T:
+        """Start an operation with asynchronous execution enabled, and poll it until it completes."""
+        pending = await self.connection._run(start)
+        interval = 0.001
+        try:
+            while not pending.done:
+                await asyncio.sleep(interval)
+                interval = min(interval * 2, max_poll_interval)
+                await self.connection._run(pending.poll)
+        except asyncio.CancelledError:
+            await self.connection._run(lambda: self.__cancel(pending))
+            raise
+        return pending.result()
+
+    def __executed(self) -> None:
+        self.__description = None
+        self.__rowcount = None
+
+    def __fetched(self, rows: T) -> T:
+        """Keep the description of the result, which fetching it has read from the driver, on the worker thread."""
+        if self.__description is None:
+            self.__description = self.cursor.description
+        return rows
+
+    async def __fetched_async(self, rows: T) -> T:
+        if self.__description is None:
+            await self.connection._run(lambda: self.__fetched(rows))
+        return rows
+
+    @staticmethod
+    def __cancel(pending: Pending[typing.Any]) -> None:
+        try:
+            pending.cancel()
+            while not pending.poll():
+                time.sleep(0.001)
+        except Error:
+            pass
+
+    async def execute(self, query_string: str, *params: typing.Any) -> AsyncCursor:
+        self.__executed()
+        if self.connection.native_async:
+            await self.__poll(lambda: self.cursor.execute_async(query_string, *params))
+        else:
+            await self.__run(lambda: self.cursor.execute(query_string, *params))
+        return self
+
+    async def executemany(self, query_string: str, seq_of_parameters: Iterable[Sequence[typing.Any]]) -> None:
+        def executemany() -> None:
+            self.cursor.executemany(query_string, seq_of_parameters)
+            # executemany() leaves no result set, and counts the rows affected itself, so neither reads the driver.
+            self.__description = self.cursor.description
+            self.__rowcount = self.cursor.rowcount
+
+        self.__executed()
+        await self.__run(executemany)
+
+    async def fetchone(self) -> Row | None:
+        if self.connection.native_async:
+            rows = await self.fetchmany(1)
+            return rows[0] if rows else None
+        return await self.__run(lambda: self.__fetched(self.cursor.fetchone()))
+
+    async def fetchmany(self, size: int | None = None) -> list[Row]:
+        if self.connection.native_async:
+            return await self.__fetched_async(await self.__poll(lambda: self.cursor.fetchmany_async(size)))
+        return await self.__run(lambda: self.__fetched(self.cursor.fetchmany(size)))
+
+    async def fetchall(self) -> list[Row]:
+        if self.connection.native_async:
+            rows: list[Row] = []
+            while True:
+                block = await self.fetchmany(max(self.iteration_size, self.arraysize))
+                if not block:
+                    return rows
+                rows.extend(block)
+        return await self.__run(lambda: self.__fetched(self.cursor.fetchall()))
+
+    async def nextset(self) -> bool | None:
+        self.__executed()
+        if self.connection.native_async:
+            return await self.__poll(self.cursor.nextset_async)
+        return await self.__run(self.cursor.nextset)
+
+    async def close(self) -> None:
+        await self.connection._run(self.cursor.close)
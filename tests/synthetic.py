@@ -0,0 +1,814 @@
+"""An in-process stand-in for the driver manager library, for measuring purepyodbc's own overhead.
+
+SyntheticDriver takes the place of the CDLL given to DriverManager. It implements the ODBC functions which purepyodbc
+calls as ctypes callbacks, serving result sets held in memory, so that executing and fetching costs no more than the
+calls themselves, bar any latency injected into them. Functions it does not implement fail with SQLSTATE IM001.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import datetime
+import decimal
+import itertools
+import struct
+import threading
+import time
+import typing
+import uuid
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from ctypes import CDLL, CFUNCTYPE, c_int, c_void_p
+from dataclasses import dataclass, field
+
+from purepyodbc import _constants, _prototypes
+from purepyodbc._connection import Connection
+from purepyodbc._driver_manager import DriverManager, detect_sqlwchar_size
+from purepyodbc._enums import (
+    CDataType,
+    ConnectionAttributeType,
+    FreeStatementOption,
+    HandleType,
+    LengthOrIndicatorType,
+    ParameterStatus,
+    SqlDataType,
+    SqlFetchType,
+    StatementAttributeType,
+)
+from purepyodbc._environment import Environment
+from purepyodbc._typedef import SQLINTEGER, SQLLEN, SQLSMALLINT, SQLULEN, SQLUSMALLINT
+
+SQL_NULL_DATA = LengthOrIndicatorType.SQL_NULL_DATA.value
+SQL_ROW_SUCCESS = 0
+SQL_ROW_NOROW = 3
+
+# The sizes of the values of fixed size C types, which are also the strides of arrays of them.
+FIXED_SIZES = {
+    CDataType.SQL_C_SBIGINT.value: 8,
+    CDataType.SQL_C_SLONG.value: 4,
+    CDataType.SQL_C_SSHORT.value: 2,
+    CDataType.SQL_C_DOUBLE.value: 8,
+    CDataType.SQL_C_FLOAT.value: 4,
+    CDataType.SQL_C_BIT.value: 1,
+    CDataType.SQL_C_TYPE_DATE.value: 6,
+    CDataType.SQL_C_TYPE_TIME.value: 6,
+    CDataType.SQL_C_TYPE_TIMESTAMP.value: 16,
+    CDataType.SQL_C_GUID.value: 16,
+}
+
+_STRUCTS = {
+    CDataType.SQL_C_SBIGINT.value: struct.Struct("=q"),
+    CDataType.SQL_C_SLONG.value: struct.Struct("=i"),
+    CDataType.SQL_C_SSHORT.value: struct.Struct("=h"),
+    CDataType.SQL_C_DOUBLE.value: struct.Struct("=d"),
+    CDataType.SQL_C_FLOAT.value: struct.Struct("=f"),
+    CDataType.SQL_C_BIT.value: struct.Struct("=B"),
+    CDataType.SQL_C_TYPE_DATE.value: struct.Struct("=hHH"),
+    CDataType.SQL_C_TYPE_TIME.value: struct.Struct("=HHH"),
+    CDataType.SQL_C_TYPE_TIMESTAMP.value: struct.Struct("=hHHHHHI"),
+}
+
+# The C types which SQL_C_DEFAULT stands for, by SQL type, where they are not character strings.
+_DEFAULT_C_TYPES = {
+    SqlDataType.SQL_BIT.value: CDataType.SQL_C_BIT.value,
+    SqlDataType.SQL_TINYINT.value: CDataType.SQL_C_SSHORT.value,
+    SqlDataType.SQL_SMALLINT.value: CDataType.SQL_C_SSHORT.value,
+    SqlDataType.SQL_INTEGER.value: CDataType.SQL_C_SLONG.value,
+    SqlDataType.SQL_BIGINT.value: CDataType.SQL_C_SBIGINT.value,
+    SqlDataType.SQL_REAL.value: CDataType.SQL_C_FLOAT.value,
+    SqlDataType.SQL_FLOAT.value: CDataType.SQL_C_DOUBLE.value,
+    SqlDataType.SQL_DOUBLE.value: CDataType.SQL_C_DOUBLE.value,
+    SqlDataType.SQL_BINARY.value: CDataType.SQL_C_BINARY.value,
+    SqlDataType.SQL_VARBINARY.value: CDataType.SQL_C_BINARY.value,
+    SqlDataType.SQL_LONGVARBINARY.value: CDataType.SQL_C_BINARY.value,
+    SqlDataType.SQL_TYPE_DATE.value: CDataType.SQL_C_TYPE_DATE.value,
+    SqlDataType.SQL_TYPE_TIME.value: CDataType.SQL_C_TYPE_TIME.value,
+    SqlDataType.SQL_TYPE_TIMESTAMP.value: CDataType.SQL_C_TYPE_TIMESTAMP.value,
+    SqlDataType.SQL_GUID.value: CDataType.SQL_C_GUID.value,
+}
+
+# The columns of the result sets of the catalog functions, when no result set has been given for them.
+_CATALOG_COLUMNS = {
+    "SQLTables": ("TABLE_CAT", "TABLE_SCHEM", "TABLE_NAME", "TABLE_TYPE", "REMARKS"),
+    "SQLProcedures": (
+        "PROCEDURE_CAT",
+        "PROCEDURE_SCHEM",
+        "PROCEDURE_NAME",
+        "NUM_INPUT_PARAMS",
+        "NUM_OUTPUT_PARAMS",
+        "NUM_RESULT_SETS",
+        "REMARKS",
+        "PROCEDURE_TYPE",
+    ),
+    "SQLForeignKeys": (
+        "PKTABLE_CAT",
+        "PKTABLE_SCHEM",
+        "PKTABLE_NAME",
+        "PKCOLUMN_NAME",
+        "FKTABLE_CAT",
+        "FKTABLE_SCHEM",
+        "FKTABLE_NAME",
+        "FKCOLUMN_NAME",
+        "KEY_SEQ",
+        "UPDATE_RULE",
+        "DELETE_RULE",
+        "FK_NAME",
+        "PK_NAME",
+        "DEFERRABILITY",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str
+    # A SqlDataType value.
+    sql_type: int
+    size: int = 0
+    decimal_digits: int = 0
+    nullable: bool = True
+
+
+@dataclass
+class ResultSet:
+    """A result set served by the synthetic driver. A rowcount of -1 means the number of rows is not known, as is
+    usual for queries."""
+
+    columns: Sequence[Column]
+    rows: Sequence[Sequence[typing.Any]] = ()
+    rowcount: int = -1
+    # The values of each column encoded as each C type they were fetched as, so that they are only encoded once.
+    _encoded: dict[tuple[int, int], list[bytes | None]] = field(default_factory=dict, init=False, repr=False)
+
+    def encoded(self, column: int, c_type: int, encoding: str) -> list[bytes | None]:
+        """Return the values of the (zero based) column encoded as the C type, or None where they are null."""
+        key = (column, c_type)
+        values = self._encoded.get(key)
+        if values is None:
+            sql_type = self.columns[column].sql_type
+            values = self._encoded[key] = [
+                None if row[column] is None else encode(row[column], c_type, sql_type, encoding) for row in self.rows
+            ]
+        return values
+
+
+ResultSpec = typing.Union[ResultSet, Sequence[ResultSet], Callable[[list[typing.Any]], typing.Any]]
+
+
+def synthetic_rows(columns: Sequence[Column], count: int, nulls: int = 0) -> list[tuple[typing.Any, ...]]:
+    """Return `count` rows of values for the columns, which are the same every time. If `nulls` is given, every nulls-th
+    value of each column is null instead."""
+    base = datetime.datetime(2000, 1, 1)
+    rows = []
+    for i in range(count):
+        row: list[typing.Any] = []
+        for j, column in enumerate(columns):
+            n = i * len(columns) + j
+            sql_type = column.sql_type
+            if nulls and n % nulls == nulls - 1:
+                value: typing.Any = None
+            elif sql_type in (
+                SqlDataType.SQL_TINYINT.value,
+                SqlDataType.SQL_SMALLINT.value,
+                SqlDataType.SQL_INTEGER.value,
+                SqlDataType.SQL_BIGINT.value,
+            ):
+                value = n % 32768
+            elif sql_type in (SqlDataType.SQL_REAL.value, SqlDataType.SQL_FLOAT.value, SqlDataType.SQL_DOUBLE.value):
+                value = n + 0.5
+            elif sql_type in (SqlDataType.SQL_NUMERIC.value, SqlDataType.SQL_DECIMAL.value):
+                value = decimal.Decimal(n).scaleb(-column.decimal_digits)
+            elif sql_type == SqlDataType.SQL_BIT.value:
+                value = bool(n % 2)
+            elif sql_type in (
+                SqlDataType.SQL_BINARY.value,
+                SqlDataType.SQL_VARBINARY.value,
+                SqlDataType.SQL_LONGVARBINARY.value,
+            ):
+                value = bytes((n + k) % 256 for k in range(column.size or 16))
+            elif sql_type == SqlDataType.SQL_TYPE_TIMESTAMP.value:
+                value = base + datetime.timedelta(seconds=n)
+            elif sql_type == SqlDataType.SQL_TYPE_DATE.value:
+                value = base.date() + datetime.timedelta(days=n % 10000)
+            elif sql_type == SqlDataType.SQL_TYPE_TIME.value:
+                value = datetime.time(n % 24, n % 60, n % 60)
+            elif sql_type == SqlDataType.SQL_GUID.value:
+                value = uuid.UUID(int=n)
+            else:
+                size = column.size or 16
+                value = (str(n) + "abcdefghijklmnopqrstuvwxyz" * (size // 26 + 1))[:size]
+            row.append(value)
+        rows.append(tuple(row))
+    return rows
+
+
+def encode(value: typing.Any, c_type: int, sql_type: int, encoding: str) -> bytes:
+    """Return a value as the bytes of the C type, with character strings in `encoding`."""
+    if c_type == CDataType.SQL_C_DEFAULT.value:
+        c_type = _DEFAULT_C_TYPES.get(sql_type, CDataType.SQL_C_WCHAR.value)
+    if c_type in (CDataType.SQL_C_WCHAR.value, CDataType.SQL_C_CHAR.value):
+        if isinstance(value, bool):
+            text = "1" if value else "0"
+        elif isinstance(value, datetime.datetime):
+            text = value.isoformat(sep=" ")
+        elif isinstance(value, (bytes, bytearray)):
+            text = value.hex()
+        else:
+            text = str(value)
+        return text.encode(encoding if c_type == CDataType.SQL_C_WCHAR.value else "utf-8")
+    if c_type == CDataType.SQL_C_BINARY.value:
+        return bytes(value)
+    if c_type == CDataType.SQL_C_GUID.value:
+        return bytes(value.bytes_le)
+    if c_type == CDataType.SQL_C_TYPE_DATE.value:
+        return _STRUCTS[c_type].pack(value.year, value.month, value.day)
+    if c_type == CDataType.SQL_C_TYPE_TIME.value:
+        return _STRUCTS[c_type].pack(value.hour, value.minute, value.second)
+    if c_type == CDataType.SQL_C_TYPE_TIMESTAMP.value:
+        if not isinstance(value, datetime.datetime):
+            value = datetime.datetime(value.year, value.month, value.day)
+        return _STRUCTS[c_type].pack(
+            value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond * 1000
+        )
+    if c_type in (CDataType.SQL_C_DOUBLE.value, CDataType.SQL_C_FLOAT.value):
+        return _STRUCTS[c_type].pack(float(value))
+    if c_type in _STRUCTS:
+        return _STRUCTS[c_type].pack(int(value))
+    raise ValueError(f"Unsupported C type {c_type}")
+
+
+def decode(data: bytes, c_type: int, encoding: str) -> typing.Any:
+    """Return the value of the bytes of the C type, with character strings in `encoding`."""
+    if c_type == CDataType.SQL_C_WCHAR.value:
+        return data.decode(encoding)
+    if c_type == CDataType.SQL_C_CHAR.value:
+        return data.decode("utf-8")
+    if c_type == CDataType.SQL_C_BINARY.value:
+        return data
+    if c_type == CDataType.SQL_C_GUID.value:
+        return uuid.UUID(bytes_le=data)
+    if c_type == CDataType.SQL_C_BIT.value:
+        return bool(data[0])
+    if c_type == CDataType.SQL_C_TYPE_DATE.value:
+        return datetime.date(*_STRUCTS[c_type].unpack(data))
+    if c_type == CDataType.SQL_C_TYPE_TIME.value:
+        return datetime.time(*_STRUCTS[c_type].unpack(data))
+    if c_type == CDataType.SQL_C_TYPE_TIMESTAMP.value:
+        year, month, day, hour, minute, second, fraction = _STRUCTS[c_type].unpack(data)
+        return datetime.datetime(year, month, day, hour, minute, second, fraction // 1000)
+    if c_type in _STRUCTS:
+        return _STRUCTS[c_type].unpack(data)[0]
+    raise ValueError(f"Unsupported C type {c_type}")
+
+
+@dataclass
+class _Handle:
+    handle_type: int
+    diagnostics: list[tuple[str, str]] = field(default_factory=list)
+    attributes: dict[int, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Statement(_Handle):
+    sql: str = ""
+    # The result sets still to be fetched, of which the first is the current one.
+    result_sets: list[ResultSet] = field(default_factory=list)
+    # The position of the current row set in the current result set, and its size, or -1 before the first fetch.
+    position: int = -1
+    rowset_size: int = 0
+    # The buffers bound with SQLBindCol and SQLBindParameter.
+    columns: dict[int, tuple[int, int, int, int]] = field(default_factory=dict)
+    parameters: dict[int, tuple[int, int, int, int, int]] = field(default_factory=dict)
+    # The number of bytes of each column already returned by SQLGetData for the current row.
+    offsets: dict[int, int] = field(default_factory=dict)
+    # Held for the duration of each call on the statement.
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class SyntheticDriver:
+    """Serves result sets held in memory through the ODBC API.
+
+    Statements are looked up in `results` by their SQL, the value of which is a ResultSet, a list of them (for
+    statements which return several result sets), or a function called with the statement's parameters which returns
+    either. Statements not found there succeed without a result set. Statements found in `errors` fail with the
+    SQLSTATE given there. Catalog functions are looked up by their names (such as "SQLTables"), and return no rows if
+    they are not found.
+
+    `latency` maps the names of functions (such as "SQLFetch") to a number of seconds slept during each call to them.
+    `calls` counts the calls made to each function, and `executed` lists the statements executed with their
+    parameters.
+
+    Character strings are exchanged in UTF-16, or UTF-32 if the driver manager's SQLWCHAR is 4 bytes wide. Bound
+    columns must be bound column-wise, and asynchronous execution is not supported. A call on a statement made while
+    another thread's call on it is in progress, other than to SQLCancel, fails with SQLSTATE HY010.
+    """
+
+    def __init__(
+        self,
+        results: Mapping[str, ResultSpec] | None = None,
+        latency: Mapping[str, float] | None = None,
+        info: Mapping[int, str | int] | None = None,
+        sqlwchar_size: int | None = None,
+    ) -> None:
+        self.results: dict[str, ResultSpec] = dict(results or {})
+        self.errors: dict[str, str] = {}
+        self.latency: dict[str, float] = dict(latency or {})
+        self.info: dict[int, str | int] = dict(info or {})
+        self.calls: Counter[str] = Counter()
+        self.executed: list[tuple[str, list[typing.Any]]] = []
+        self.sqlwchar_size = sqlwchar_size or detect_sqlwchar_size()
+        self.__encoding = "utf-16-le" if self.sqlwchar_size == 2 else "utf-32-le"
+        self.__handles: dict[int, _Handle] = {}
+        self.__handle_ids = itertools.count(0x1000)
+        self.__environment: Environment | None = None
+
+        # Every function which DriverManager gives a prototype gets one, with the same argument types, whether it is
+        # implemented or not. Keep references to them, as ctypes does not.
+        self.__functions: dict[str, typing.Any] = {}
+        for name, argtypes in _prototypes.ARGTYPES.items():
+            func = CFUNCTYPE(_prototypes.RESTYPE, *argtypes)(self.__wrap(name, getattr(self, f"_{name}", None)))
+            self.__functions[name] = func
+            setattr(self, name, func)
+
+    def connect(self, connection_string: str = "", autocommit: bool = False, **kwargs: typing.Any) -> Connection:
+        """Open a connection through a DriverManager using this driver, allocating one environment for all of
+        them."""
+        if self.__environment is None:
+            self.__environment = Environment(driver_manager=DriverManager(cdll=typing.cast(CDLL, self)))
+        return self.__environment.connection(connection_string, autocommit, **kwargs)
+
+    def reset_counts(self) -> None:
+        self.calls.clear()
+        self.executed.clear()
+
+    def __wrap(self, name: str, impl: Callable[..., int] | None) -> Callable[..., int]:
+        calls = self.calls
+        latency = self.latency
+        handles = self.__handles
+
+        def call(*args: typing.Any) -> int:
+            calls[name] += 1
+            statement = handles.get(args[0]) if args and isinstance(args[0], int) and name != "SQLCancel" else None
+            lock = statement.lock if isinstance(statement, _Statement) else None
+            if lock is not None and not lock.acquire(blocking=False):
+                return self.__error(args[0], "HY010", f"{name} called while another function was executing")
+            try:
+                delay = latency.get(name)
+                if delay:
+                    time.sleep(delay)
+                if impl is None:
+                    return self.__error(args[0], "IM001", f"Driver does not support {name}")
+                return impl(*args)
+            except Exception as e:
+                # An exception cannot be raised through the driver manager, so it is reported as a diagnostic.
+                return self.__error(args[0], "HY000", f"{name} raised {e!r}")
+            finally:
+                if lock is not None:
+                    lock.release()
+
+        return call
+
+    def __error(self, handle: typing.Any, state: str, message: str) -> int:
+        h = self.__handles.get(handle) if isinstance(handle, int) else None
+        if h is None:
+            return _constants.SQL_INVALID_HANDLE
+        h.diagnostics.append((state, message))
+        return _constants.SQL_ERROR
+
+    def __statement(self, handle: int) -> _Statement:
+        statement = self.__handles[handle]
+        assert isinstance(statement, _Statement)
+        statement.diagnostics.clear()
+        return statement
+
+    def __read_string(self, pointer: int | None, length: int) -> str:
+        if not pointer:
+            return ""
+        width = self.sqlwchar_size
+        if length == _constants.SQL_NTS:
+            length = 0
+            while ctypes.string_at(pointer + length * width, width) != b"\0" * width:
+                length += 1
+        return ctypes.string_at(pointer, length * width).decode(self.__encoding)
+
+    def __write_string(self, pointer: int | None, buffer_length: int, value: str, length_pointer: int | None) -> int:
+        """Write a null terminated string to a buffer of `buffer_length` bytes, truncating it if necessary, and its
+        length in bytes."""
+        data = value.encode(self.__encoding)
+        terminator = b"\0" * self.sqlwchar_size
+        if length_pointer:
+            SQLSMALLINT.from_address(length_pointer).value = len(data)
+        if pointer and buffer_length > 0:
+            room = max(buffer_length - len(terminator), 0)
+            room -= room % self.sqlwchar_size
+            ctypes.memmove(pointer, data[:room] + terminator, min(len(data), room) + len(terminator))
+            if room < len(data):
+                return _constants.SQL_SUCCESS_WITH_INFO
+        return _constants.SQL_SUCCESS
+
+    # Handles, environments and connections.
+
+    def _SQLAllocHandle(self, handle_type: int, parent: int | None, output: int) -> int:
+        handle_id = next(self.__handle_ids)
+        if handle_type == HandleType.SQL_HANDLE_STMT.value:
+            self.__handles[handle_id] = _Statement(
+                handle_type, attributes={StatementAttributeType.SQL_ATTR_ROW_ARRAY_SIZE.value: 1}
+            )
+        else:
+            self.__handles[handle_id] = _Handle(handle_type)
+        c_void_p.from_address(output).value = handle_id
+        return _constants.SQL_SUCCESS
+
+    def _SQLFreeHandle(self, handle_type: int, handle: int) -> int:
+        return _constants.SQL_SUCCESS if self.__handles.pop(handle, None) else _constants.SQL_INVALID_HANDLE
+
+    def _SQLSetEnvAttr(self, handle: int | None, attribute: int, value: int | None, length: int) -> int:
+        if handle:
+            self.__handles[handle].attributes[attribute] = value or 0
+        return _constants.SQL_SUCCESS
+
+    def _SQLSetConnectAttrW(self, handle: int, attribute: int, value: int | None, length: int) -> int:
+        self.__handles[handle].attributes[attribute] = value or 0
+        return _constants.SQL_SUCCESS
+
+    def _SQLGetConnectAttrW(
+        self, handle: int, attribute: int, value: int, buffer_length: int, length: int | None
+    ) -> int:
+        default = 1 if attribute == ConnectionAttributeType.SQL_ATTR_AUTOCOMMIT.value else 0
+        c_int.from_address(value).value = self.__handles[handle].attributes.get(attribute, default)
+        return _constants.SQL_SUCCESS
+
+    def _SQLDriverConnectW(
+        self,
+        handle: int,
+        window: int | None,
+        connection_string: int,
+        length: int,
+        output: int | None,
+        buffer_length: int,
+        output_length: int | None,
+        completion: int,
+    ) -> int:
+        self.__handles[handle].diagnostics.clear()
+        self.__write_string(output, buffer_length, self.__read_string(connection_string, length), output_length)
+        return _constants.SQL_SUCCESS
+
+    def _SQLDisconnect(self, handle: int) -> int:
+        return _constants.SQL_SUCCESS
+
+    def _SQLEndTran(self, handle_type: int, handle: int, completion_type: int) -> int:
+        return _constants.SQL_SUCCESS
+
+    def _SQLGetInfoW(self, handle: int, info_type: int, value: int, buffer_length: int, length: int | None) -> int:
+        # Without a value, string information types are empty and the others zero, telling them apart by the size
+        # of the buffer as the caller knows which it expects.
+        info = self.info.get(info_type, 0 if buffer_length in (2, 4) else "")
+        if isinstance(info, str):
+            return self.__write_string(value, buffer_length, info, length)
+        (SQLUSMALLINT if buffer_length == 2 else ctypes.c_uint).from_address(value).value = info
+        return _constants.SQL_SUCCESS
+
+    def _SQLGetFunctions(self, handle: int, function_id: int, supported: int) -> int:
+        SQLUSMALLINT.from_address(supported).value = 1
+        return _constants.SQL_SUCCESS
+
+    def _SQLGetDiagRecW(
+        self,
+        handle_type: int,
+        handle: int,
+        record: int,
+        state: int,
+        native_error: int,
+        message: int,
+        buffer_length: int,
+        text_length: int | None,
+    ) -> int:
+        h = self.__handles.get(handle)
+        if h is None:
+            return _constants.SQL_INVALID_HANDLE
+        if record > len(h.diagnostics):
+            return _constants.SQL_NO_DATA
+        sqlstate, text = h.diagnostics[record - 1]
+        self.__write_string(state, 6 * self.sqlwchar_size, sqlstate, None)
+        SQLINTEGER.from_address(native_error).value = 0
+        return self.__write_string(message, buffer_length * self.sqlwchar_size, text, text_length)
+
+    def _SQLDriversW(
+        self,
+        handle: int,
+        direction: int,
+        description: int,
+        description_length: int,
+        description_output: int,
+        attributes: int,
+        attributes_length: int,
+        attributes_output: int,
+    ) -> int:
+        if direction != SqlFetchType.SQL_FETCH_FIRST.value:
+            return _constants.SQL_NO_DATA
+        width = self.sqlwchar_size
+        self.__write_string(description, description_length * width, "Synthetic", description_output)
+        self.__write_string(attributes, attributes_length * width, "Driver=synthetic", attributes_output)
+        return _constants.SQL_SUCCESS
+
+    # Statements.
+
+    def __start(
+        self, statement: _Statement, sql: str, parameters: list[typing.Any], default: ResultSet | None = None
+    ) -> int:
+        self.executed.append((sql, parameters))
+        state = self.errors.get(sql)
+        if state is not None:
+            return self.__error_on(statement, state, f"Synthetic error executing {sql!r}")
+        spec = self.results.get(sql, default)
+        result: typing.Any = spec(parameters) if callable(spec) else spec
+        if result is None:
+            result = ResultSet((), rowcount=1 if parameters else 0)
+        statement.result_sets = [result] if isinstance(result, ResultSet) else list(result)
+        statement.position = -1
+        statement.rowset_size = 0
+        statement.offsets.clear()
+        return _constants.SQL_SUCCESS
+
+    def __error_on(self, statement: _Statement, state: str, message: str) -> int:
+        statement.diagnostics.append((state, message))
+        return _constants.SQL_ERROR
+
+    def _SQLExecDirectW(self, handle: int, sql: int, length: int) -> int:
+        statement = self.__statement(handle)
+        statement.sql = self.__read_string(sql, length)
+        return self.__execute(statement)
+
+    def _SQLPrepareW(self, handle: int, sql: int, length: int) -> int:
+        self.__statement(handle).sql = self.__read_string(sql, length)
+        return _constants.SQL_SUCCESS
+
+    def _SQLExecute(self, handle: int) -> int:
+        return self.__execute(self.__statement(handle))
+
+    def __execute(self, statement: _Statement) -> int:
+        attributes = statement.attributes
+        parameter_sets = self.__parameter_values(statement)
+        if len(parameter_sets) == 1:
+            return_code = self.__start(statement, statement.sql, parameter_sets[0])
+        else:
+            for parameters in parameter_sets:
+                return_code = self.__start(statement, statement.sql, parameters)
+                if return_code == _constants.SQL_ERROR:
+                    break
+            statement.result_sets = [ResultSet((), rowcount=len(parameter_sets))]
+        status_pointer = attributes.get(StatementAttributeType.SQL_ATTR_PARAM_STATUS_PTR.value)
+        if status_pointer:
+            status = (
+                ParameterStatus.SQL_PARAM_SUCCESS.value
+                if return_code == _constants.SQL_SUCCESS
+                else ParameterStatus.SQL_PARAM_ERROR.value
+            )
+            for i in range(len(parameter_sets)):
+                SQLUSMALLINT.from_address(status_pointer + i * ctypes.sizeof(SQLUSMALLINT)).value = status
+        processed_pointer = attributes.get(StatementAttributeType.SQL_ATTR_PARAMS_PROCESSED_PTR.value)
+        if processed_pointer:
+            SQLULEN.from_address(processed_pointer).value = len(parameter_sets)
+        return return_code
+
+    def __parameter_values(self, statement: _Statement) -> list[list[typing.Any]]:
+        size = statement.attributes.get(StatementAttributeType.SQL_ATTR_PARAMSET_SIZE.value) or 1
+        parameter_sets = []
+        for i in range(size):
+            values: list[typing.Any] = []
+            for number in sorted(statement.parameters):
+                c_type, sql_type, pointer, buffer_length, indicator = statement.parameters[number]
+                length = SQLLEN.from_address(indicator + i * ctypes.sizeof(SQLLEN)).value if indicator else 0
+                if not pointer or length == SQL_NULL_DATA:
+                    values.append(None)
+                    continue
+                if c_type == CDataType.SQL_C_DEFAULT.value:
+                    c_type = _DEFAULT_C_TYPES.get(sql_type, CDataType.SQL_C_WCHAR.value)
+                stride = FIXED_SIZES.get(c_type) or buffer_length
+                if length == _constants.SQL_NTS or c_type in FIXED_SIZES:
+                    length = FIXED_SIZES.get(c_type) or buffer_length
+                values.append(decode(ctypes.string_at(pointer + i * stride, length), c_type, self.__encoding))
+            parameter_sets.append(values)
+        return parameter_sets
+
+    def _SQLNumParams(self, handle: int, count: int) -> int:
+        SQLSMALLINT.from_address(count).value = self.__statement(handle).sql.count("?")
+        return _constants.SQL_SUCCESS
+
+    def _SQLDescribeParam(
+        self, handle: int, number: int, data_type: int, size: int, decimal_digits: int, nullable: int
+    ) -> int:
+        SQLSMALLINT.from_address(data_type).value = SqlDataType.SQL_WVARCHAR.value
+        SQLULEN.from_address(size).value = 255
+        SQLSMALLINT.from_address(decimal_digits).value = 0
+        SQLSMALLINT.from_address(nullable).value = 1
+        return _constants.SQL_SUCCESS
+
+    def _SQLBindParameter(
+        self,
+        handle: int,
+        number: int,
+        input_output_type: int,
+        c_type: int,
+        sql_type: int,
+        size: int,
+        decimal_digits: int,
+        pointer: int | None,
+        buffer_length: int,
+        indicator: int | None,
+    ) -> int:
+        self.__statement(handle).parameters[number] = (c_type, sql_type, pointer or 0, buffer_length, indicator or 0)
+        return _constants.SQL_SUCCESS
+
+    def _SQLRowCount(self, handle: int, count: int) -> int:
+        statement = self.__statement(handle)
+        SQLLEN.from_address(count).value = statement.result_sets[0].rowcount if statement.result_sets else -1
+        return _constants.SQL_SUCCESS
+
+    def _SQLNumResultCols(self, handle: int, count: int) -> int:
+        statement = self.__statement(handle)
+        SQLSMALLINT.from_address(count).value = len(statement.result_sets[0].columns) if statement.result_sets else 0
+        return _constants.SQL_SUCCESS
+
+    def _SQLDescribeColW(
+        self,
+        handle: int,
+        number: int,
+        name: int,
+        buffer_length: int,
+        name_length: int | None,
+        data_type: int,
+        size: int,
+        decimal_digits: int,
+        nullable: int,
+    ) -> int:
+        column = self.__statement(handle).result_sets[0].columns[number - 1]
+        return_code = self.__write_string(name, buffer_length * self.sqlwchar_size, column.name, None)
+        if name_length:
+            SQLSMALLINT.from_address(name_length).value = len(column.name)
+        SQLSMALLINT.from_address(data_type).value = column.sql_type
+        SQLULEN.from_address(size).value = column.size
+        SQLSMALLINT.from_address(decimal_digits).value = column.decimal_digits
+        SQLSMALLINT.from_address(nullable).value = int(column.nullable)
+        return return_code
+
+    def _SQLSetStmtAttrW(self, handle: int, attribute: int, value: int | None, length: int) -> int:
+        statement = self.__statement(handle)
+        if attribute == StatementAttributeType.SQL_ATTR_ASYNC_ENABLE.value and value:
+            return self.__error_on(statement, "HYC00", "Asynchronous execution is not supported")
+        statement.attributes[attribute] = value or 0
+        return _constants.SQL_SUCCESS
+
+    def _SQLGetStmtAttrW(self, handle: int, attribute: int, value: int, buffer_length: int, length: int | None) -> int:
+        SQLULEN.from_address(value).value = self.__statement(handle).attributes.get(attribute, 0)
+        return _constants.SQL_SUCCESS
+
+    def _SQLBindCol(
+        self, handle: int, number: int, c_type: int, pointer: int | None, buffer_length: int, indicator: int | None
+    ) -> int:
+        statement = self.__statement(handle)
+        if pointer:
+            statement.columns[number] = (c_type, pointer, buffer_length, indicator or 0)
+        else:
+            statement.columns.pop(number, None)
+        return _constants.SQL_SUCCESS
+
+    def _SQLFreeStmt(self, handle: int, option: int) -> int:
+        statement = self.__statement(handle)
+        if option == FreeStatementOption.SQL_CLOSE.value:
+            statement.result_sets = []
+        elif option == FreeStatementOption.SQL_UNBIND.value:
+            statement.columns.clear()
+        elif option == FreeStatementOption.SQL_RESET_PARAMS.value:
+            statement.parameters.clear()
+        return _constants.SQL_SUCCESS
+
+    def _SQLCloseCursor(self, handle: int) -> int:
+        self.__statement(handle).result_sets = []
+        return _constants.SQL_SUCCESS
+
+    def _SQLCancel(self, handle: int) -> int:
+        self.__statement(handle).result_sets = []
+        return _constants.SQL_SUCCESS
+
+    def _SQLMoreResults(self, handle: int) -> int:
+        statement = self.__statement(handle)
+        if len(statement.result_sets) <= 1:
+            statement.result_sets = []
+            return _constants.SQL_NO_DATA
+        statement.result_sets.pop(0)
+        statement.position = -1
+        statement.rowset_size = 0
+        return _constants.SQL_SUCCESS
+
+    def _SQLFetch(self, handle: int) -> int:
+        statement = self.__statement(handle)
+        if not statement.result_sets or not statement.result_sets[0].columns:
+            return self.__error_on(statement, "24000", "Invalid cursor state")
+        result_set = statement.result_sets[0]
+        attributes = statement.attributes
+        size = attributes[StatementAttributeType.SQL_ATTR_ROW_ARRAY_SIZE.value] or 1
+        start = statement.position + statement.rowset_size if statement.position >= 0 else 0
+        count = max(min(size, len(result_set.rows) - start), 0)
+        statement.position = start
+        statement.rowset_size = count
+        statement.offsets.clear()
+
+        fetched_pointer = attributes.get(StatementAttributeType.SQL_ATTR_ROWS_FETCHED_PTR.value)
+        if fetched_pointer:
+            SQLULEN.from_address(fetched_pointer).value = count
+        status_pointer = attributes.get(StatementAttributeType.SQL_ATTR_ROW_STATUS_PTR.value)
+        if status_pointer:
+            for i in range(size):
+                SQLUSMALLINT.from_address(status_pointer + i * 2).value = (
+                    SQL_ROW_SUCCESS if i < count else SQL_ROW_NOROW
+                )
+        if not count:
+            return _constants.SQL_NO_DATA
+
+        return_code = _constants.SQL_SUCCESS
+        sizeof_len = ctypes.sizeof(SQLLEN)
+        for number, (c_type, pointer, buffer_length, indicator) in statement.columns.items():
+            values = result_set.encoded(number - 1, c_type, self.__encoding)
+            stride = FIXED_SIZES.get(c_type) or buffer_length
+            for i in range(count):
+                data = values[start + i]
+                indicator_pointer = indicator + i * sizeof_len if indicator else 0
+                if data is None:
+                    if not indicator_pointer:
+                        return self.__error_on(statement, "22002", "Indicator variable required but not supplied")
+                    SQLLEN.from_address(indicator_pointer).value = SQL_NULL_DATA
+                    continue
+                if indicator_pointer:
+                    SQLLEN.from_address(indicator_pointer).value = len(data)
+                if self.__put(statement, data, c_type, pointer + i * stride, buffer_length) < len(data):
+                    return_code = _constants.SQL_SUCCESS_WITH_INFO
+        return return_code
+
+    def __put(self, statement: _Statement, data: bytes, c_type: int, pointer: int, buffer_length: int) -> int:
+        """Copy a value to a buffer, null terminating character strings and truncating them and binary values to fit,
+        and return the number of bytes of the value copied."""
+        if c_type in FIXED_SIZES:
+            ctypes.memmove(pointer, data, len(data))
+            return len(data)
+        if c_type == CDataType.SQL_C_BINARY.value:
+            terminator = b""
+        else:
+            terminator = b"\0" * (self.sqlwchar_size if c_type == CDataType.SQL_C_WCHAR.value else 1)
+        room = buffer_length - len(terminator)
+        if len(data) > room:
+            if terminator:
+                room -= room % len(terminator)
+            data = data[:room]
+            statement.diagnostics.append(("01004", "String data, right truncated"))
+        ctypes.memmove(pointer, data + terminator, len(data) + len(terminator))
+        return len(data)
+
+    def _SQLFetchScroll(self, handle: int, orientation: int, offset: int) -> int:
+        if orientation != SqlFetchType.SQL_FETCH_NEXT.value:
+            return self.__error_on(self.__statement(handle), "HY106", "Fetch type out of range")
+        return self._SQLFetch(handle)
+
+    def _SQLGetData(
+        self, handle: int, number: int, c_type: int, pointer: int, buffer_length: int, indicator: int | None
+    ) -> int:
+        statement = self.__statement(handle)
+        if not statement.result_sets or statement.position < 0 or not statement.rowset_size:
+            return self.__error_on(statement, "24000", "Invalid cursor state")
+        if statement.rowset_size > 1:
+            return self.__error_on(statement, "HYC00", "SQLGetData is not supported with block cursors")
+        data = statement.result_sets[0].encoded(number - 1, c_type, self.__encoding)[statement.position]
+        offset = statement.offsets.get(number)
+        if data is None:
+            if offset is not None:
+                return _constants.SQL_NO_DATA
+            statement.offsets[number] = 0
+            if not indicator:
+                return self.__error_on(statement, "22002", "Indicator variable required but not supplied")
+            SQLLEN.from_address(indicator).value = SQL_NULL_DATA
+            return _constants.SQL_SUCCESS
+        if offset is not None and (offset >= len(data) or c_type in FIXED_SIZES):
+            return _constants.SQL_NO_DATA
+        offset = offset or 0
+        remaining = data[offset:]
+        if indicator:
+            SQLLEN.from_address(indicator).value = len(remaining)
+        written = self.__put(statement, remaining, c_type, pointer, buffer_length)
+        statement.offsets[number] = offset + written
+        return _constants.SQL_SUCCESS if written == len(remaining) else _constants.SQL_SUCCESS_WITH_INFO
+
+    # Catalog functions.
+
+    def __catalog(self, handle: int, function: str) -> int:
+        # Catalog functions always return a result set, with no rows unless one was given.
+        empty = ResultSet([Column(name, SqlDataType.SQL_WVARCHAR.value, 128) for name in _CATALOG_COLUMNS[function]])
+        return self.__start(self.__statement(handle), function, [], empty)
+
+    def _SQLTablesW(self, handle: int, *args: typing.Any) -> int:
+        return self.__catalog(handle, "SQLTables")
+
+    def _SQLProceduresW(self, handle: int, *args: typing.Any) -> int:
+        return self.__catalog(handle, "SQLProcedures")
+
+    def _SQLForeignKeysW(self, handle: int, *args: typing.Any) -> int:
+        return self.__catalog(handle, "SQLForeignKeys")
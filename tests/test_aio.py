@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from purepyodbc import NotSupportedError, aio
+
+SQL = "select * from information_schema.tables;"
+
+
+def test_execute(connection_string: str) -> None:
+    async def run() -> None:
+        async with await aio.connect(connection_string) as connection:
+            cursor = await connection.cursor()
+            await cursor.execute("select ?", 1)
+            row = await cursor.fetchone()
+            assert row == (1,)
+            await cursor.close()
+
+    asyncio.run(run())
+
+
+def test_lazy_description(connection_string: str) -> None:
+    async def run() -> None:
+        async with await aio.connect(connection_string) as connection:
+            cursor = await connection.cursor()
+            await cursor.execute("select ? as a", 1)
+            # Neither is read from the driver until it is needed.
+            assert cursor.description is None
+            assert cursor.rowcount == -1
+            assert [x[0] for x in await cursor.get_description()] == ["a"]
+            assert isinstance(await cursor.get_rowcount(), int)
+
+            await cursor.execute("select ? as b", 1)
+            assert await cursor.fetchall() == [(1,)]
+            description = cursor.description
+            assert description is not None
+            assert [x[0] for x in description] == ["b"]
+
+    asyncio.run(run())
+
+
+def test_async_iteration(connection_string: str) -> None:
+    async def run() -> None:
+        async with await aio.connect(connection_string) as connection:
+            cursor = await connection.cursor()
+            expected = await (await cursor.execute(SQL)).fetchall()
+            cursor.iteration_size = 3
+            await cursor.execute(SQL)
+            rows = [row async for row in cursor]
+            assert rows == expected
+
+    asyncio.run(run())
+
+
+def test_native_async(connection_string: str) -> None:
+    async def run() -> None:
+        async with await aio.connect(connection_string, native_async=True) as connection:
+            cursor = await connection.cursor()
+            try:
+                await cursor.execute(SQL)
+            except NotSupportedError:
+                pytest.skip("The driver does not support asynchronous execution.")
+            rows = [row async for row in cursor]
+            assert rows == await (await cursor.execute(SQL)).fetchall()
+
+    asyncio.run(run())
+
+
+def test_concurrent_connections(connection_string: str) -> None:
+    async def query(i: int) -> int:
+        async with await aio.connect(connection_string) as connection:
+            cursor = await connection.cursor()
+            row = await (await cursor.execute("select ?", i)).fetchone()
+            assert row is not None
+            return int(row[0])
+
+    async def run() -> list[int]:
+        return await asyncio.gather(*(query(i) for i in range(5)))
+
+    assert asyncio.run(run()) == list(range(5))
+
+
+def test_cancel(connection_string: str) -> None:
+    async def run() -> None:
+        async with await aio.connect(connection_string) as connection:
+            dbms_name = connection.connection.dbms_name
+            sql = {
+                "Microsoft SQL Server": "waitfor delay '00:00:10'",
+                "PostgreSQL": "select pg_sleep(10)",
+                "MySQL": "select sleep(10)",
+            }[dbms_name]
+            cursor = await connection.cursor()
+
+            task = asyncio.ensure_future(cursor.execute(sql))
+            await asyncio.sleep(0.5)
+            start = time.monotonic()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            assert time.monotonic() - start < 5
+            row = await (await cursor.execute("select 1")).fetchone()
+            assert row == (1,)
+
+    asyncio.run(run())
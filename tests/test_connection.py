@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pytest
 
+import purepyodbc
 from purepyodbc import Connection
 
 
@@ -27,6 +28,14 @@ def test_autocommit(connection: Connection) -> None:
     assert connection.autocommit is False
 
 
+def test_refresh_autocommit(connection: Connection) -> None:
+    assert connection.refresh_autocommit() is False
+    connection.autocommit = True
+    assert connection.refresh_autocommit() is True
+    connection.autocommit = False
+    assert connection.refresh_autocommit() is False
+
+
 def test_schema_term(connection: Connection) -> None:
     expected = {
         "Microsoft SQL Server": "owner",
@@ -37,3 +46,107 @@ def test_schema_term(connection: Connection) -> None:
     schema_term = connection.schema_term
 
     assert schema_term == expected
+
+
+def test_getinfo(connection: Connection) -> None:
+    assert connection.getinfo(purepyodbc.InfoType.SQL_DBMS_NAME) == connection.dbms_name
+    assert connection.getinfo(purepyodbc.InfoType.SQL_DBMS_NAME.value) == connection.dbms_name
+    assert isinstance(connection.getinfo(purepyodbc.InfoType.SQL_KEYWORDS), str)
+    assert isinstance(connection.getinfo(purepyodbc.InfoType.SQL_MAX_COLUMN_NAME_LEN), int)
+    assert isinstance(connection.getinfo(purepyodbc.InfoType.SQL_SCROLL_OPTIONS), int)
+    assert isinstance(connection.getinfo(purepyodbc.InfoType.SQL_ACCESSIBLE_TABLES), bool)
+    with pytest.raises(purepyodbc.ProgrammingError):
+        connection.getinfo(-1)
+
+
+def test_statistics(connection: Connection) -> None:
+    slow = []
+    connection.slow_statement_threshold = 0.0
+    connection.slow_statement_callback = lambda sql, statistics: slow.append(sql)
+    connection.reset_statistics()
+
+    # The ODBC calls are counted while tracing is enabled.
+    purepyodbc.enable_tracing()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("select 1").fetchall()
+        cursor = connection.cursor()
+        cursor.execute("select 2").fetchall()
+    finally:
+        purepyodbc.disable_tracing()
+    statistics = connection.statistics
+
+    assert statistics.statements == 2
+    assert statistics.slow_statements == 2
+    assert statistics.rows_fetched == 2
+    assert statistics.odbc_calls > 0
+    assert slow == ["select 1", "select 2"]
+    connection.reset_statistics()
+    assert connection.statistics.rows_fetched == 0
+
+
+def test_connections_are_not_pooled_by_default(connection_string: str) -> None:
+    purepyodbc.close_pools()
+    with purepyodbc.connect(connection_string):
+        pass
+    assert purepyodbc.pool_statistics() == []
+
+
+def test_pooled_connection_is_reused(connection_string: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    purepyodbc.close_pools()
+    monkeypatch.setattr(purepyodbc, "connection_pooling", True)
+    with purepyodbc.connect(connection_string) as c:
+        c.autocommit = True
+        handle = c.handle.value
+
+    with purepyodbc.connect(connection_string) as c:
+        assert c.handle.value == handle
+        assert c.autocommit is False
+        assert c.cursor().execute("select 1").fetchone() == (1,)
+
+    [statistics] = purepyodbc.pool_statistics()
+    assert statistics.checkouts == 2
+    assert statistics.connections_created == 1
+    assert statistics.idle == 1
+    assert statistics.in_use == 0
+    purepyodbc.close_pools()
+
+
+def test_pool_checkout_timeout(connection_string: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    purepyodbc.close_pools()
+    monkeypatch.setattr(purepyodbc, "connection_pooling", True)
+    monkeypatch.setattr(purepyodbc, "pool_max_size", 1)
+    monkeypatch.setattr(purepyodbc, "pool_checkout_timeout", 0.1)
+
+    with purepyodbc.connect(connection_string):
+        with pytest.raises(purepyodbc.OperationalError):
+            purepyodbc.connect(connection_string)
+
+    [statistics] = purepyodbc.pool_statistics()
+    assert statistics.timeouts == 1
+    assert statistics.saturation == 0.0
+    purepyodbc.close_pools()
+
+
+def test_tracing(connection_string: str) -> None:
+    names = []
+    purepyodbc.enable_tracing(lambda name: lambda return_code: names.append(name))
+    try:
+        with purepyodbc.connect(connection_string) as c:
+            c.cursor().execute("select 1").fetchall()
+    finally:
+        purepyodbc.disable_tracing()
+    statistics = {x.function: x for x in purepyodbc.call_statistics()}
+    purepyodbc.reset_call_statistics()
+
+    assert "SQLExecDirectW" in names
+    assert statistics["SQLExecDirectW"].calls == names.count("SQLExecDirectW")
+    assert statistics["SQLExecDirectW"].errors == 0
+
+
+def test_environment_is_allocated_once(connection_string: str) -> None:
+    with purepyodbc.connect(connection_string):
+        environment = getattr(purepyodbc, "__environment")
+    purepyodbc.drivers()
+    with purepyodbc.connect(connection_string):
+        assert getattr(purepyodbc, "__environment") is environment
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import datetime
+import decimal
+import io
+import threading
 import uuid
+from typing import Any
 
 import pytest
 
-from purepyodbc import Connection, Cursor, Error
+from purepyodbc import Connection, Cursor, Error, NotSupportedError, ProgrammingError
 
 SQL = "select * from information_schema.tables;"
 
@@ -48,6 +53,162 @@ def test_fetchmany_size(cursor: Cursor, size: int) -> None:
     assert all(rows)
 
 
+@pytest.mark.parametrize("arraysize", [1, 2, 7, 100])
+def test_fetchall_arraysize(cursor: Cursor, arraysize: int) -> None:
+    expected = [row[2] for row in cursor.execute(SQL).fetchall()]
+    cursor.arraysize = arraysize
+    rows = cursor.execute(SQL).fetchall()
+    assert [row[2] for row in rows] == expected
+
+
+def test_interleaved_fetches(cursor: Cursor) -> None:
+    expected = [row[2] for row in cursor.execute(SQL).fetchall()]
+    cursor.arraysize = 3
+    cursor.execute(SQL)
+    rows = [cursor.fetchone()]
+    rows.extend(cursor.fetchmany(5))
+    rows.append(cursor.fetchone())
+    rows.extend(cursor.fetchall())
+    assert [row[2] for row in rows if row is not None] == expected
+    assert cursor.fetchone() is None
+
+
+@pytest.mark.parametrize("iteration_size", [1, 3, 100])
+def test_iteration(cursor: Cursor, iteration_size: int) -> None:
+    expected = [row[2] for row in cursor.execute(SQL).fetchall()]
+    cursor.iteration_size = iteration_size
+    assert [row[2] for row in cursor.execute(SQL)] == expected
+
+
+def test_interleaved_iteration(cursor: Cursor) -> None:
+    expected = [row[2] for row in cursor.execute(SQL).fetchall()]
+    cursor.iteration_size = 3
+    cursor.execute(SQL)
+    rows = [next(cursor)]
+    rows.extend(cursor.fetchmany(2))
+    rows.append(next(cursor))
+    row = cursor.fetchone()
+    assert row is not None
+    rows.append(row)
+    rows.extend(cursor)
+    assert [row[2] for row in rows] == expected
+
+
+@pytest.mark.parametrize("prefetch_blocks", [1, 3])
+def test_prefetching_iteration(cursor: Cursor, prefetch_blocks: int) -> None:
+    expected = [row[2] for row in cursor.execute(SQL).fetchall()]
+    cursor.iteration_size = 2
+    cursor.prefetch_blocks = prefetch_blocks
+    assert [row[2] for row in cursor.execute(SQL)] == expected
+
+    cursor.execute(SQL)
+    rows = [next(cursor)]
+    rows.extend(cursor.fetchmany(3))
+    rows.append(next(cursor))
+    rows.extend(cursor.fetchall())
+    assert [row[2] for row in rows] == expected
+
+
+def test_prefetching_iteration_close(cursor: Cursor) -> None:
+    cursor.iteration_size = 1
+    cursor.prefetch_blocks = 2
+    cursor.execute(SQL)
+    next(cursor)
+    cursor.close()
+    assert not any(x.name == "purepyodbc-prefetch" for x in threading.enumerate())
+
+
+def test_fetchall_long_column(cursor: Cursor) -> None:
+    long_type = {
+        "Microsoft SQL Server": "nvarchar(max)",
+        "PostgreSQL": "text",
+        "MySQL": "longtext",
+    }[cursor.connection.dbms_name]
+
+    cursor.execute("drop table if exists t1")
+    cursor.execute(f"create table t1(i int, s {long_type})")
+    cursor.execute("insert into t1 (i, s) values (1, 'a'), (2, null), (3, 'c')")
+    cursor.arraysize = 2
+
+    rows = cursor.execute("select i, s from t1 order by i").fetchall()
+
+    assert [(row[0], row[1]) for row in rows] == [(1, "a"), (2, None), (3, "c")]
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("1", 1),
+        ("cast(12.34 as decimal(10, 2))", decimal.Decimal("12.34")),
+        ("cast('2021-02-03' as date)", datetime.date(2021, 2, 3)),
+        ("'abc'", "abc"),
+    ],
+)
+def test_native_types(cursor: Cursor, expression: str, expected: Any) -> None:
+    row = cursor.execute(f"select {expression}").fetchone()
+    assert row is not None
+    assert row[0] == expected
+    assert type(row[0]) is type(expected)
+    assert cursor.description[0][1] is type(expected)
+
+
+def test_fetch_value_longer_than_buffer(cursor: Cursor) -> None:
+    if cursor.connection.dbms_name == "Microsoft SQL Server":
+        sql = "select replicate(cast(N'xy' as nvarchar(max)), 50000)"
+    else:
+        sql = "select repeat('xy', 50000)"
+
+    row = cursor.execute(sql).fetchone()
+
+    assert row is not None
+    assert row[0] == "xy" * 50000
+
+
+def test_iterchunks(cursor: Cursor) -> None:
+    if cursor.connection.dbms_name == "Microsoft SQL Server":
+        sql = "select 1, replicate(cast(N'xy' as nvarchar(max)), 50000), null"
+    else:
+        sql = "select 1, repeat('xy', 50000), null"
+
+    cursor.execute(sql)
+
+    assert cursor.nextrow()
+    assert cursor.getvalue(0) == 1
+    chunks = cursor.iterchunks(1, chunk_size=1000)
+    assert chunks is not None
+    assert "".join(str(x) for x in chunks) == "xy" * 50000
+    assert cursor.iterchunks(2) is None
+    assert not cursor.nextrow()
+
+
+def test_copycolumn(cursor: Cursor) -> None:
+    if cursor.connection.dbms_name == "Microsoft SQL Server":
+        sql = "select replicate(cast(N'xy' as nvarchar(max)), 50000) as value"
+    else:
+        sql = "select repeat('xy', 50000) as value"
+    file = io.StringIO()
+
+    cursor.execute(sql)
+
+    assert cursor.nextrow()
+    assert cursor.copycolumn("value", file) == 100000
+    assert file.getvalue() == "xy" * 50000
+
+
+def test_row(cursor: Cursor) -> None:
+    rows = cursor.execute("select 1 as a, 'b' as b union all select 2, 'c'").fetchall()
+
+    a, b = rows[1]
+    assert (a, b) == (2, "c")
+    assert len(rows[0]) == 2
+    assert rows[0] == (1, "b")
+    assert rows[0] != rows[1]
+    assert rows[0][-1] == rows[0]["b"] == rows[0].b == "b"
+    assert rows[1][:1] == (2,)
+    with pytest.raises(AttributeError):
+        rows[0].c
+
+
 def test_illegal_fetchall_raises(cursor: Cursor) -> None:
     with pytest.raises(Error):
         cursor.fetchall()
@@ -97,6 +258,98 @@ def test_emoticons_as_literal(cursor: Cursor) -> None:
     assert result == v
 
 
+@pytest.mark.parametrize("value", [1, "abc", None])
+def test_execute_parameter(cursor: Cursor, value: Any) -> None:
+    row = cursor.execute("select ?", value).fetchone()
+    assert row is not None
+    assert row[0] == value
+
+
+def test_execute_parameter_sequence(cursor: Cursor) -> None:
+    rows = cursor.execute("select ?, ?", (1, "a")).fetchall()
+    assert rows == [(1, "a")]
+
+
+def test_execute_prepared_statement_again(connection: Connection, cursor: Cursor) -> None:
+    cursor.execute("drop table if exists t1")
+    cursor.execute("create table t1(i int, s varchar(10))")
+
+    for i in range(3):
+        cursor.execute("insert into t1 (i, s) values (?, ?)", i, str(i))
+    rows = cursor.execute("select i, s from t1 where i >= ? order by i", 1).fetchall()
+
+    assert rows == [(1, "1"), (2, "2")]
+    assert len(connection._statement_cache) == 1
+
+
+def test_description_and_rowcount(cursor: Cursor) -> None:
+    cursor.execute("drop table if exists t1")
+    cursor.execute("create table t1(i int, s varchar(10))")
+
+    cursor.execute("insert into t1 (i, s) values (1, 'a'), (2, 'b')")
+    assert cursor.rowcount == 2
+    assert not cursor.description
+
+    for i in range(2):
+        cursor.execute("select i, s from t1 where i >= ? order by i", i)
+        assert [x[0] for x in cursor.description] == ["i", "s"]
+        assert cursor.fetchall() == [(1, "a"), (2, "b")]
+    cursor.execute("update t1 set s = 'c' where i = 1")
+    assert cursor.rowcount == 1
+    assert not cursor.description
+
+
+def test_statistics(cursor: Cursor) -> None:
+    cursor.arraysize = 2
+    cursor.execute("select 1 union all select 2 union all select 3")
+    assert cursor.statistics.first_row_time is None
+
+    assert len(cursor.fetchmany()) == 2
+    assert len(cursor.fetchall()) == 1
+    statistics = cursor.statistics
+
+    assert statistics.sql == "select 1 union all select 2 union all select 3"
+    assert statistics.rows_fetched == 3
+    assert statistics.bytes_fetched > 0
+    assert statistics.first_row_time is not None
+    assert statistics.execute_time > 0
+    assert 0 < statistics.conversion_time <= statistics.fetch_time
+    cursor.execute("select 1")
+    assert cursor.statistics.rows_fetched == 0
+
+
+def test_execute_wrong_number_of_parameters(cursor: Cursor) -> None:
+    with pytest.raises(ProgrammingError):
+        cursor.execute("select ?, ?", 1)
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 1024])
+def test_executemany(cursor: Cursor, batch_size: int) -> None:
+    cursor.execute("drop table if exists t1")
+    cursor.execute("create table t1(i int, s varchar(10))")
+    params = [(i, None if i % 3 == 0 else str(i) * (i % 4)) for i in range(10)]
+    cursor.executemany_batch_size = batch_size
+
+    cursor.executemany("insert into t1 (i, s) values (?, ?)", params)
+    rows = cursor.execute("select i, s from t1 order by i").fetchall()
+
+    assert rows == params
+
+
+def test_executemany_parameter_statuses(cursor: Cursor) -> None:
+    cursor.execute("drop table if exists t1")
+    cursor.execute("create table t1(i int)")
+
+    cursor.executemany("insert into t1 (i) values (?)", [(1,), (2,), (3,)])
+
+    assert [x.name for x in cursor.parameter_statuses] == ["SQL_PARAM_SUCCESS"] * 3
+
+
+def test_executemany_empty_raises(cursor: Cursor) -> None:
+    with pytest.raises(ProgrammingError):
+        cursor.executemany("select ?", [])
+
+
 def test_nextset(cursor: Cursor) -> None:
     sql = "select 1; select 2;"
     cursor.execute(sql)
@@ -110,6 +363,44 @@ def test_nextset(cursor: Cursor) -> None:
     assert second_set[0][0] == 2
 
 
+def test_execute_async(cursor: Cursor) -> None:
+    try:
+        pending = cursor.execute_async("select ? union all select 2", 1)
+    except NotSupportedError:
+        pytest.skip("The driver does not support asynchronous execution.")
+    while not pending.poll():
+        pass
+    assert pending.result() is cursor
+
+    fetch = cursor.fetchmany_async(5)
+    while not fetch.poll():
+        pass
+
+    assert fetch.result() == [(1,), (2,)]
+    # The statement executes synchronously again.
+    assert cursor.execute("select 3").fetchall() == [(3,)]
+
+
+def test_fetch_numpy(cursor: Cursor) -> None:
+    pytest.importorskip("numpy")
+    cursor.execute("select 1 as a, 'x' as b union all select null, null union all select 3, 'z';")
+    arrays = cursor.fetch_numpy()
+    assert list(arrays) == ["a", "b"]
+    assert arrays["a"].tolist() == [1, None, 3]
+    assert arrays["b"].tolist() == ["x", None, "z"]
+
+
+def test_fetch_arrow_batches(cursor: Cursor) -> None:
+    pa = pytest.importorskip("pyarrow")
+    expected = cursor.execute(SQL).fetchall()
+    cursor.execute(SQL)
+    batches = list(cursor.fetch_arrow_batches(batch_size=3))
+    assert all(batch.num_rows <= 3 for batch in batches)
+    table = pa.Table.from_batches(batches)
+    assert table.column_names == [x.name for x in cursor.description]
+    assert table.column(2).to_pylist() == [row[2] for row in expected]
+
+
 def test_tables(connection: Connection, cursor: Cursor) -> None:
     tbl = str(uuid.uuid4())
     cursor.execute(f"drop table if exists {connection.identifier_quote_char}{tbl}{connection.identifier_quote_char};")
@@ -125,3 +416,26 @@ def test_tables(connection: Connection, cursor: Cursor) -> None:
     assert hasattr(r, "table_type")
     assert hasattr(r, "remarks")
     assert r.table_name == tbl
+
+
+def test_tables_cached(connection: Connection, cursor: Cursor) -> None:
+    q = connection.identifier_quote_char
+    tbl = str(uuid.uuid4())
+    connection.catalog_cache_size = 10
+    cursor.execute(f"drop table if exists {q}{tbl}{q};")
+    assert cursor.tables(table=tbl).fetchall() == []
+
+    cursor.execute(f"create table {q}{tbl}{q} (a varchar(1));")
+    rows = cursor.tables(table=tbl).fetchall()
+    assert [r.table_name for r in rows] == [tbl]
+    assert len(connection._catalog_cache) == 1
+
+    r = cursor.tables(table=tbl).fetchone()
+    assert r is not None
+    assert r.table_name == tbl
+    assert cursor.description[2][0] == "table_name"
+    assert cursor.fetchone() is None
+    assert [tuple(r) for r in cursor.tables(table=tbl)] == [tuple(r) for r in rows]
+
+    connection.clear_catalog_cache()
+    assert len(connection._catalog_cache) == 0
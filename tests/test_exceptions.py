@@ -2,9 +2,35 @@ from __future__ import annotations
 
 import pytest
 
-from purepyodbc import Cursor, ProgrammingError
+from purepyodbc import (
+    Cursor,
+    DataError,
+    Error,
+    IntegrityError,
+    InterfaceError,
+    OperationalError,
+    ProgrammingError,
+)
+from purepyodbc._errors import error_for_sqlstate
 
 
 def test_invalid_syntax(cursor: Cursor) -> None:
     with pytest.raises(ProgrammingError):
         cursor.execute("foo bar baz")
+
+
+@pytest.mark.parametrize(
+    "sqlstate, expected",
+    [
+        ("08S01", OperationalError),
+        ("IM002", InterfaceError),
+        ("40002", IntegrityError),
+        ("22003", DataError),
+        ("23000", IntegrityError),
+        ("42S02", ProgrammingError),
+        ("HY000", Error),
+        ("40001", Error),
+    ],
+)
+def test_error_for_sqlstate(sqlstate: str, expected: type[Error]) -> None:
+    assert error_for_sqlstate(sqlstate) is expected
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import ctypes
+import os
+import re
+import shutil
+import subprocess
+import sys
+
 import pytest
 
 import purepyodbc
+from purepyodbc import InterfaceError, _driver_manager, _tracing
+from purepyodbc._typedef import SQLLEN, SQLULEN
+
+# Importing purepyodbc should not load the driver manager, so it should take well under this many seconds.
+IMPORT_TIME_BUDGET = 0.5
 
 
 @pytest.mark.parametrize(
@@ -19,3 +31,87 @@ def test_drivers(include_attributes: bool) -> None:
     for driver in drivers:
         assert isinstance(driver, str)
         print(driver)
+
+
+def _run_python(code: str, *options: str, **environment: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **environment},
+        check=True,
+    )
+
+
+def test_import_does_not_load_driver_manager() -> None:
+    result = _run_python(
+        "import purepyodbc; print(purepyodbc.__dict__['__driver_manager'])",
+        PUREPYODBC_DRIVER_MANAGER="/nonexistent/libodbc.so",
+    )
+    assert result.stdout.strip() == "None"
+
+
+def test_import_time() -> None:
+    # The best of a few runs, to ignore a slow start.
+    times = []
+    for _ in range(3):
+        result = _run_python("import purepyodbc", "-X", "importtime")
+        match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| purepyodbc$", result.stderr, re.MULTILINE)
+        assert match
+        times.append(int(match.group(1)) / 1_000_000)
+    assert min(times) < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize("size", [2, 4])
+def test_sqlwchar_size_variable(monkeypatch: pytest.MonkeyPatch, size: int) -> None:
+    monkeypatch.setenv(_driver_manager.SQLWCHAR_SIZE_VARIABLE, str(size))
+    _driver_manager.detect_sqlwchar_size.cache_clear()
+    try:
+        assert _driver_manager.detect_sqlwchar_size() == size
+    finally:
+        _driver_manager.detect_sqlwchar_size.cache_clear()
+
+
+def test_invalid_sqlwchar_size_variable_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(_driver_manager.SQLWCHAR_SIZE_VARIABLE, "3")
+    _driver_manager.detect_sqlwchar_size.cache_clear()
+    try:
+        with pytest.raises(InterfaceError):
+            _driver_manager.detect_sqlwchar_size()
+    finally:
+        _driver_manager.detect_sqlwchar_size.cache_clear()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="SQLWCHAR is always 2 bytes on Windows")
+def test_guessed_sqlwchar_size_warns(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(_driver_manager.SQLWCHAR_SIZE_VARIABLE, raising=False)
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    _driver_manager.detect_sqlwchar_size.cache_clear()
+    try:
+        with pytest.warns(RuntimeWarning, match=_driver_manager.SQLWCHAR_SIZE_VARIABLE):
+            assert _driver_manager.detect_sqlwchar_size() == 2
+    finally:
+        _driver_manager.detect_sqlwchar_size.cache_clear()
+
+
+def test_sqllen_is_pointer_sized() -> None:
+    assert ctypes.sizeof(SQLLEN) == ctypes.sizeof(SQLULEN) == ctypes.sizeof(ctypes.c_void_p)
+
+
+def test_tracer() -> None:
+    tracer = _tracing.Tracer()
+    calls = []
+    tracer.hooks = (lambda name: lambda return_code: calls.append((name, return_code)),)
+    func = tracer.wrap("SQLFetch", lambda *args: len(args) - 1)
+
+    assert func(1) == 0
+    assert func() == -1
+    [statistics] = tracer.statistics()
+
+    assert calls == [("SQLFetch", 0), ("SQLFetch", -1)]
+    assert statistics.function == "SQLFetch"
+    assert statistics.calls == 2
+    assert statistics.errors == 1
+    assert statistics.min_time <= statistics.mean_time <= statistics.max_time
+    tracer.reset()
+    assert tracer.statistics() == []
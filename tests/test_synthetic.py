@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import ctypes
+import datetime
+import gc
+import math
+import platform
+import sys
+import threading
+import time
+import uuid
+
+import pytest
+
+from purepyodbc import ProgrammingError
+from purepyodbc._driver_manager import ROW_SET_BUFFER_SIZE
+from purepyodbc._enums import SqlDataType
+from purepyodbc._pool import ConnectionPool
+from purepyodbc._typedef import SQLLEN
+
+from .synthetic import Column, ResultSet, SyntheticDriver, synthetic_rows
+
+COLUMNS = [
+    Column("integer", SqlDataType.SQL_INTEGER.value),
+    Column("double", SqlDataType.SQL_DOUBLE.value),
+    Column("varchar", SqlDataType.SQL_WVARCHAR.value, 20),
+    Column("varbinary", SqlDataType.SQL_VARBINARY.value, 8),
+    Column("timestamp", SqlDataType.SQL_TYPE_TIMESTAMP.value),
+    Column("date", SqlDataType.SQL_TYPE_DATE.value),
+    Column("decimal", SqlDataType.SQL_DECIMAL.value, 10, 2),
+    Column("bit", SqlDataType.SQL_BIT.value),
+    Column("guid", SqlDataType.SQL_GUID.value),
+]
+
+ROWS = synthetic_rows(COLUMNS, 250, nulls=7)
+
+
+@pytest.fixture
+def driver() -> SyntheticDriver:
+    return SyntheticDriver({"select": ResultSet(COLUMNS, ROWS)})
+
+
+def _expected(row: tuple[object, ...]) -> tuple[object, ...]:
+    # GUIDs are fetched as upper case strings by default, as pyodbc does.
+    return tuple(str(value).upper() if isinstance(value, uuid.UUID) else value for value in row)
+
+
+def test_fetch(driver: SyntheticDriver) -> None:
+    with driver.connect() as connection:
+        cursor = connection.cursor()
+        cursor.execute("select")
+        assert [column.name for column in cursor.description] == [column.name for column in COLUMNS]
+        assert tuple(cursor.fetchone() or ()) == _expected(ROWS[0])
+        assert [tuple(row) for row in cursor.fetchmany(9)] == [_expected(row) for row in ROWS[1:10]]
+        assert [tuple(row) for row in cursor.fetchall()] == [_expected(row) for row in ROWS[10:]]
+
+
+def test_parameters(driver: SyntheticDriver) -> None:
+    with driver.connect() as connection:
+        cursor = connection.cursor()
+        cursor.execute("insert ?, ?", 1, "a")
+        assert cursor.rowcount == 1
+        cursor.executemany("insert ?", [(2,), (3,)])
+        assert cursor.rowcount == 2
+    assert driver.executed == [("insert ?, ?", [1, "a"]), ("insert ?", [2]), ("insert ?", [3])]
+
+
+def test_errors(driver: SyntheticDriver) -> None:
+    driver.errors["select"] = "42S02"
+    with driver.connect() as connection:
+        with pytest.raises(ProgrammingError, match="42S02"):
+            connection.cursor().execute("select")
+
+
+def test_calls_per_row(driver: SyntheticDriver) -> None:
+    with driver.connect() as connection:
+        cursor = connection.cursor()
+        cursor.execute("select")
+        driver.reset_counts()
+        while cursor.fetchmany(100):
+            pass
+    # Rows are fetched in blocks, rather than a value at a time.
+    assert driver.calls["SQLFetchScroll"] == 4
+    assert driver.calls["SQLGetData"] == 0
+
+
+def test_block_reuse(driver: SyntheticDriver) -> None:
+    with driver.connect() as connection:
+        cursor = connection.cursor()
+        cursor.execute("select")
+        driver.reset_counts()
+        rows = []
+        for _ in range(5):
+            row = cursor.fetchone()
+            assert row is not None
+            rows.append(row)
+            rows.extend(cursor.fetchmany(2))
+        # The columns are bound once, and the rows asked for are taken from the first block.
+        assert driver.calls["SQLBindCol"] == len(COLUMNS)
+        assert driver.calls["SQLSetStmtAttrW"] == 2
+        assert driver.calls["SQLFetchScroll"] == 1
+        # A larger fetch binds larger arrays, after which the rows come in the same order, however they are fetched.
+        rows.append(next(cursor))
+        rows.extend(cursor.fetchmany(150))
+        rows.append(next(cursor))
+        rows.extend(cursor.fetchall())
+        assert [tuple(row) for row in rows] == [_expected(row) for row in ROWS]
+
+        cursor.execute("select")
+        driver.reset_counts()
+        assert len(cursor.fetchall()) == len(ROWS)
+    # fetchall() fetches blocks of iteration_size rows, rather than of arraysize.
+    assert driver.calls["SQLFetchScroll"] == 4
+
+
+def test_wide_blocks(driver: SyntheticDriver) -> None:
+    columns = [Column("nvarchar", SqlDataType.SQL_WVARCHAR.value, 4000)]
+    rows = synthetic_rows(columns, 250, nulls=7)
+    driver.results["select wide"] = ResultSet(columns, rows)
+    with driver.connect() as connection:
+        cursor = connection.cursor()
+        cursor.execute("select wide")
+        driver.reset_counts()
+        assert tuple(cursor.fetchone() or ()) == rows[0]
+        # The arrays of wide columns are bound for fewer rows, which larger fetches take several blocks of.
+        size = ROW_SET_BUFFER_SIZE // ((4000 * 2 + 1) * driver.sqlwchar_size + ctypes.sizeof(SQLLEN))
+        assert driver.calls["SQLFetchScroll"] == 1
+        assert [tuple(row) for row in cursor.fetchmany(100)] == rows[1:101]
+        assert driver.calls["SQLFetchScroll"] == math.ceil(101 / size)
+        assert [tuple(row) for row in cursor.fetchall()] == rows[101:]
+        assert driver.calls["SQLBindCol"] == 1
+
+
+def test_other_types(driver: SyntheticDriver) -> None:
+    columns = [
+        Column("time", SqlDataType.SQL_TYPE_TIME.value, 16, 7),
+        Column("time2", SqlDataType.SQL_SS_TIME2.value, 16, 7),
+        Column("datetimeoffset", SqlDataType.SQL_SS_TIMESTAMPOFFSET.value, 34, 7),
+        Column("xml", SqlDataType.SQL_SS_XML.value),
+        Column("date", SqlDataType.SQL_DATE.value),
+        Column("variant", -150),
+    ]
+    offset = datetime.timezone(-datetime.timedelta(hours=5, minutes=30))
+    row = (
+        datetime.time(1, 2, 3, 456789),
+        datetime.time(23, 59, 59, 999999),
+        datetime.datetime(2024, 1, 2, 3, 4, 5, 600000, offset),
+        "<a>b</a>",
+        datetime.date(2024, 1, 2),
+        "variant",
+    )
+    driver.results["select other"] = ResultSet(columns, [row])
+    with driver.connect() as connection:
+        cursor = connection.cursor()
+        cursor.execute("select other")
+        # Types without a handler of their own are read as character strings.
+        assert [x[1] for x in cursor.description] == [
+            datetime.time,
+            datetime.time,
+            datetime.datetime,
+            str,
+            datetime.date,
+            str,
+        ]
+        assert tuple(cursor.fetchone() or ()) == row
+
+
+def test_ddl_invalidates_prepared_statements(driver: SyntheticDriver) -> None:
+    before, after = ResultSet(COLUMNS[:1], [(1,)]), ResultSet(COLUMNS[:2], [(1, 2.0)])
+    driver.results["select ?"] = before
+    with driver.connect() as connection:
+        cursor, other = connection.cursor(), connection.cursor()
+        assert len(cursor.execute("select ?", 1).description) == 1
+        assert len(other.execute("select ?", 1).description) == 1
+        driver.results["select ?"] = after
+        # The column descriptions kept with the prepared statement are used until DDL is executed.
+        cursor.execute("select ?", 1)
+        assert len(cursor.description) == 1
+        cursor.execute("alter table t add double float")
+        cursor.execute("select ?", 1)
+        assert len(cursor.description) == 2
+        # The statement which was checked out when the DDL was executed is not cached again.
+        other.execute("select 1")
+        other.execute("select ?", 1)
+        assert len(other.description) == 2
+        assert tuple(other.fetchone() or ()) == (1, 2.0)
+
+
+def test_statistics(driver: SyntheticDriver) -> None:
+    with driver.connect() as connection:
+        cursor = connection.cursor()
+        cursor.execute("select").fetchall()
+        statistics = cursor.statistics
+        assert statistics.rows_fetched == len(ROWS)
+        assert statistics.bytes_fetched > 0
+        assert 0 < statistics.conversion_time <= statistics.fetch_time
+        # The ODBC calls are only counted while tracing is enabled.
+        assert statistics.odbc_calls == 0
+        connection._driver_manager.enable_tracing(())
+        try:
+            cursor.execute("select").fetchall()
+        finally:
+            connection._driver_manager.disable_tracing()
+        assert cursor.statistics.odbc_calls > 0
+
+
+def test_latency(driver: SyntheticDriver) -> None:
+    driver.latency["SQLExecDirectW"] = 0.05
+    with driver.connect() as connection:
+        cursor = connection.cursor()
+        cursor.execute("select")
+        assert cursor.statistics.execute_time >= 0.05
+
+
+@pytest.mark.skipif(platform.python_implementation() != "CPython", reason="Counts CPython's memory blocks.")
+def test_allocations_per_row(driver: SyntheticDriver) -> None:
+    with driver.connect() as connection:
+        cursor = connection.cursor()
+        # The first fetch allocates the buffers, which are reused by the second.
+        cursor.execute("select")
+        cursor.fetchall()
+        cursor.execute("select")
+        gc.collect()
+        gc.disable()
+        try:
+            before = sys.getallocatedblocks()
+            rows = cursor.fetchall()
+            blocks = (sys.getallocatedblocks() - before) / len(rows)
+        finally:
+            gc.enable()
+    # Each row should be made of little more than its values.
+    assert blocks <= len(COLUMNS) + 3
+
+
+def _wait_for_fetch(driver: SyntheticDriver, calls: int) -> None:
+    while driver.calls["SQLFetchScroll"] < calls:
+        time.sleep(0.001)
+
+
+def test_execute_while_prefetching(driver: SyntheticDriver) -> None:
+    driver.latency["SQLFetchScroll"] = 0.05
+    with driver.connect() as connection:
+        cursor = connection.cursor()
+        cursor.prefetch_blocks = 2
+        cursor.execute("select")
+        driver.reset_counts()
+        assert tuple(next(cursor)) == _expected(ROWS[0])
+        # The helper thread is in the middle of fetching the second block, and must have stopped before the statement
+        # is closed, or the driver fails the call with HY010.
+        _wait_for_fetch(driver, 2)
+        cursor.execute("select")
+        assert [tuple(row) for row in cursor] == [_expected(row) for row in ROWS]
+
+        cursor.execute("select")
+        driver.reset_counts()
+        next(cursor)
+        _wait_for_fetch(driver, 2)
+        cursor.close()
+
+
+def test_prefetching_statistics(driver: SyntheticDriver) -> None:
+    driver.latency["SQLFetchScroll"] = 0.01
+    threads = []
+    with driver.connect() as connection:
+        # The statement only becomes slow once its blocks have been fetched.
+        connection.slow_statement_threshold = 0.02
+        connection.slow_statement_callback = lambda sql, statistics: threads.append(threading.current_thread())
+        cursor = connection.cursor()
+        cursor.prefetch_blocks = 2
+        cursor.execute("select")
+        assert threads == []
+        assert len(list(cursor)) == len(ROWS)
+        # The blocks fetched by the helper thread are accounted for, and reported, on the iterating thread.
+        assert threads == [threading.current_thread()]
+        statistics = cursor.statistics
+        assert statistics.rows_fetched == len(ROWS)
+        assert 0 < statistics.conversion_time <= statistics.fetch_time
+
+
+def test_pool_min_idle(driver: SyntheticDriver) -> None:
+    connection = driver.connect()
+    pool = ConnectionPool(connection._driver_manager, driver.connect, "", max_size=3, min_idle=2, max_lifetime=None)
+    connection.close()
+    assert pool.statistics().idle == 2
+    first, second, third = pool.checkout(), pool.checkout(), pool.checkout()
+    # Returning a connection which cannot be reused opens another, so that two are idle again.
+    pool.release(first, reusable=False)
+    assert pool.statistics().idle == 1
+    second.close()
+    assert (pool.statistics().idle, pool.statistics().in_use) == (2, 1)
+    third.close()
+    statistics = pool.statistics()
+    assert (statistics.idle, statistics.connections_created, statistics.connections_closed) == (3, 4, 1)
+    pool.close()